@@ -0,0 +1,112 @@
+"""
+Per-request overhead of `AuthMiddleware`: pure ASGI implementation versus
+the former `BaseHTTPMiddleware` one, measured in-process (no network).
+
+Usage (with the package installed, e.g. `pip install -e .`):
+    python benchmarks/middleware_auth.py [n_requests]
+"""
+
+import asyncio
+import sys
+import time
+from typing import Any, Callable
+
+from starlette.applications import Starlette
+from starlette.middleware import Middleware
+from starlette.middleware.base import BaseHTTPMiddleware, RequestResponseEndpoint
+from starlette.requests import Request
+from starlette.responses import PlainTextResponse, Response
+from starlette.routing import Route
+from starlette.types import ASGIApp, Message
+
+from auth.presentation.http.middleware_auth import AuthMiddleware
+
+
+class BaseHTTPAuthMiddleware(BaseHTTPMiddleware):
+    """
+    The former implementation, kept here as the baseline.
+    """
+
+    async def dispatch(
+        self, request: Request, call_next: RequestResponseEndpoint
+    ) -> Response:
+        response: Response = await call_next(request)
+
+        new_access_token: str | None = getattr(request.state, "new_access_token", None)
+        cookie_params: dict[str, Any] = getattr(request.state, "cookie_params", {})
+        if new_access_token is not None and cookie_params.get("secure") is not None:
+            response.set_cookie(
+                key="access_token",
+                value=new_access_token,
+                httponly=True,
+                secure=cookie_params["secure"],
+                samesite=cookie_params.get("samesite"),
+            )
+        if getattr(request.state, "delete_access_token", False):
+            response.delete_cookie(key="access_token")
+        return response
+
+
+async def plain_endpoint(_: Request) -> Response:
+    return PlainTextResponse("ok")
+
+
+async def cookie_endpoint(request: Request) -> Response:
+    request.state.new_access_token = "header.payload.signature"
+    request.state.cookie_params = {"secure": True, "samesite": "strict"}
+    return PlainTextResponse("ok")
+
+
+def build_app(middleware: list[Middleware]) -> ASGIApp:
+    return Starlette(
+        routes=[Route("/plain", plain_endpoint), Route("/cookie", cookie_endpoint)],
+        middleware=middleware,
+    )
+
+
+async def measure(app: ASGIApp, path: str, n_requests: int) -> float:
+    async def receive() -> Message:
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(_: Message) -> None: ...
+
+    def make_scope() -> dict[str, Any]:
+        return {
+            "type": "http",
+            "asgi": {"version": "3.0"},
+            "http_version": "1.1",
+            "method": "GET",
+            "scheme": "http",
+            "path": path,
+            "raw_path": path.encode(),
+            "query_string": b"",
+            "root_path": "",
+            "headers": [(b"host", b"bench")],
+            "client": ("127.0.0.1", 50000),
+            "server": ("bench", 80),
+        }
+
+    for _ in range(min(1_000, n_requests)):
+        await app(make_scope(), receive, send)
+
+    started_at: float = time.perf_counter()
+    for _ in range(n_requests):
+        await app(make_scope(), receive, send)
+    return (time.perf_counter() - started_at) / n_requests * 1e6
+
+
+async def main(n_requests: int) -> None:
+    apps: dict[str, Callable[[], ASGIApp]] = {
+        "no middleware": lambda: build_app([]),
+        "BaseHTTPMiddleware": lambda: build_app([Middleware(BaseHTTPAuthMiddleware)]),
+        "pure ASGI": lambda: build_app([Middleware(AuthMiddleware)]),
+    }
+    print(f"{n_requests} requests per case, microseconds per request")
+    for path in ("/plain", "/cookie"):
+        for name, factory in apps.items():
+            per_request_us: float = await measure(factory(), path, n_requests)
+            print(f"{path:8} {name:20} {per_request_us:8.1f}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main(int(sys.argv[1]) if len(sys.argv) > 1 else 20_000))
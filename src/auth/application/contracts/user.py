@@ -1,6 +1,9 @@
 from dataclasses import dataclass
+from uuid import UUID
 
 from auth.application.enums import ResponseStatusEnum
+from auth.domain.user.entity import User
+from auth.domain.user.enums import UserRoleEnum
 
 
 @dataclass(frozen=True, slots=True, kw_only=True)
@@ -13,3 +16,26 @@ class SignUpRequest:
 class SignUpResponse:
     username: str
     status: ResponseStatusEnum
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class UserListItem:
+    id: UUID
+    username: str
+    roles: list[UserRoleEnum]
+    is_active: bool
+
+    @classmethod
+    def from_user(cls, user: User) -> "UserListItem":
+        return cls(
+            id=user.id_.value,
+            username=user.username.value,
+            roles=sorted(user.roles),
+            is_active=user.is_active,
+        )
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class ListUsersResponse:
+    users: list[UserListItem]
+    next_cursor: str | None
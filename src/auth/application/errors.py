@@ -3,3 +3,7 @@ from auth.application.base.errors import ApplicationError
 
 class DataGatewayError(ApplicationError):
     ...
+
+
+class PaginationCursorError(ApplicationError):
+    ...
@@ -1,8 +1,52 @@
+import base64
+import binascii
 from dataclasses import dataclass
+from typing import Callable, Generic, TypeVar
+from uuid import UUID
+
+from auth.application.errors import PaginationCursorError
+
+T = TypeVar("T")
 
 
 @dataclass(frozen=True, slots=True, kw_only=True)
 class PaginationRequest:
+    """
+    Keyset pagination: `cursor` is the opaque continuation token
+    of the previous page, none for the first page.
+    """
+
     limit: int
-    offset: int
-    
\ No newline at end of file
+    cursor: str | None = None
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class Page(Generic[T]):
+    items: list[T]
+    next_cursor: str | None
+
+
+def build_page(rows: list[T], limit: int, key: Callable[[T], UUID]) -> Page[T]:
+    """
+    `rows` are read with `limit + 1`: the extra row only tells
+    that another page follows.
+    """
+    if len(rows) <= limit:
+        return Page(items=rows, next_cursor=None)
+
+    items: list[T] = rows[:limit]
+    return Page(items=items, next_cursor=encode_cursor(key(items[-1])))
+
+
+def encode_cursor(last_key: UUID) -> str:
+    return base64.urlsafe_b64encode(last_key.bytes).rstrip(b"=").decode()
+
+
+def decode_cursor(cursor: str) -> UUID:
+    """
+    :raises PaginationCursorError:
+    """
+    try:
+        return UUID(bytes=base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)))
+    except (binascii.Error, ValueError) as error:
+        raise PaginationCursorError("Invalid pagination cursor.") from error
@@ -1,10 +1,7 @@
 from auth.application.base.interactors import InteractorStrict
 from auth.application.committer import Committer
 from auth.application.enums import ResponseStatusEnum
-from auth.application.user.errors import (
-    AlreadyAuthenticatedError,
-    AuthenticationError,
-)
+from auth.application.user.errors import AlreadyAuthenticatedError
 from auth.application.user.ports.identity_provider import IdentityProvider
 from auth.application.user.ports.user_data_gateway import UserDataGateway
 from auth.application.contracts.user import (
@@ -12,7 +9,6 @@ from auth.application.contracts.user import (
     SignUpResponse,
 )
 from auth.domain.user.entity import User
-from auth.domain.user.errors.existence import UsernameAlreadyExists
 from auth.domain.user.service import UserService
 from auth.domain.user.value_objects import RawPassword, Username
 
@@ -23,6 +19,7 @@ class SignUpInteractor(InteractorStrict[SignUpRequest, SignUpResponse]):
     :raises DomainFieldError:
     :raises DataGatewayError:
     :raises UsernameAlreadyExists:
+    :raises PasswordHasherBusy:
     """
 
     def __init__(
@@ -38,23 +35,17 @@ class SignUpInteractor(InteractorStrict[SignUpRequest, SignUpResponse]):
         self._committer = committer
 
     async def __call__(self, request_data: SignUpRequest) -> SignUpResponse:
-        try:
-            await self._identity_provider.get_current_user_id()
+        if await self._identity_provider.is_authenticated():
             raise AlreadyAuthenticatedError(
                 "You are already authenticated. Consider logging out."
             )
-        except AuthenticationError:
-            ...
 
         username: Username = Username(request_data.username)
         password: RawPassword = RawPassword(request_data.password)
 
-        if not await self._user_data_gateway.is_username_unique(username):
-            raise UsernameAlreadyExists(username.value)
-
-        user: User = self._user_service.create_user(username, password)
+        user: User = await self._user_service.create_user(username, password)
 
-        await self._user_data_gateway.save(user)
+        await self._user_data_gateway.save_with_unique_username(user)
         await self._committer.commit()
 
         return SignUpResponse(user.username.value, ResponseStatusEnum.CREATED)
@@ -0,0 +1,43 @@
+from typing import AsyncIterator
+
+from auth.application.base.interactors import InteractorFlexible
+from auth.application.contracts.user import UserListItem
+from auth.application.user.ports.user_data_gateway import UserDataGateway
+from auth.application.user.service_authorization import AuthorizationService
+from auth.domain.user.entity import User
+from auth.domain.user.enums import UserRoleEnum
+
+EXPORT_BATCH_SIZE: int = 1_000
+
+
+class ExportUsersInteractor(InteractorFlexible):
+    """
+    Authorizes up front and returns a lazy iterator, so the export
+    can be streamed while it is read.
+
+    :raises AuthenticationError:
+    :raises AuthorizationError:
+    """
+
+    def __init__(
+        self,
+        authorization_service: AuthorizationService,
+        user_data_gateway: UserDataGateway,
+    ):
+        self._authorization_service = authorization_service
+        self._user_data_gateway = user_data_gateway
+
+    async def __call__(self) -> AsyncIterator[UserListItem]:
+        await self._authorization_service.check_authorization(UserRoleEnum.ADMIN)
+
+        return self._export()
+
+    async def _export(self) -> AsyncIterator[UserListItem]:
+        """
+        :raises DataGatewayError:
+        """
+        users: AsyncIterator[User] = self._user_data_gateway.stream_all(
+            EXPORT_BATCH_SIZE
+        )
+        async for user in users:
+            yield UserListItem.from_user(user)
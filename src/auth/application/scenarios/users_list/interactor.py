@@ -0,0 +1,54 @@
+from uuid import UUID
+
+from auth.application.base.interactors import InteractorStrict
+from auth.application.contracts.user import ListUsersResponse, UserListItem
+from auth.application.pagination import (
+    Page,
+    PaginationRequest,
+    build_page,
+    decode_cursor,
+)
+from auth.application.user.ports.user_data_gateway import UserDataGateway
+from auth.application.user.service_authorization import AuthorizationService
+from auth.domain.user.entity import User
+from auth.domain.user.enums import UserRoleEnum
+from auth.domain.user.value_objects import UserId
+
+
+class ListUsersInteractor(InteractorStrict[PaginationRequest, ListUsersResponse]):
+    """
+    :raises AuthenticationError:
+    :raises AuthorizationError:
+    :raises PaginationCursorError:
+    :raises DataGatewayError:
+    """
+
+    def __init__(
+        self,
+        authorization_service: AuthorizationService,
+        user_data_gateway: UserDataGateway,
+    ):
+        self._authorization_service = authorization_service
+        self._user_data_gateway = user_data_gateway
+
+    async def __call__(self, request_data: PaginationRequest) -> ListUsersResponse:
+        await self._authorization_service.check_authorization(UserRoleEnum.ADMIN)
+
+        after_id: UserId | None = (
+            UserId(decode_cursor(request_data.cursor))
+            if request_data.cursor is not None
+            else None
+        )
+        users: list[User] = await self._user_data_gateway.read_all(
+            request_data.limit + 1, after_id
+        )
+        page: Page[User] = build_page(users, request_data.limit, _user_key)
+
+        return ListUsersResponse(
+            users=[UserListItem.from_user(user) for user in page.items],
+            next_cursor=page.next_cursor,
+        )
+
+
+def _user_key(user: User) -> UUID:
+    return user.id_.value
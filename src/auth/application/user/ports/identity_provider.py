@@ -6,6 +6,12 @@ from auth.domain.user.value_objects import UserId
 
 
 class IdentityProvider(Protocol):
+    @abstractmethod
+    async def is_authenticated(self) -> bool:
+        """
+        Cheap check meant for anonymous endpoints, with no side effects.
+        """
+
     @abstractmethod
     async def get_current_user_id(self) -> UserId:
         """
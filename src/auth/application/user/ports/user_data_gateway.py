@@ -1,5 +1,5 @@
 from abc import abstractmethod
-from typing import Protocol
+from typing import AsyncIterator, Protocol
 
 from auth.domain.user.entity import User
 from auth.domain.user.value_objects import UserId, Username
@@ -12,6 +12,15 @@ class UserDataGateway(Protocol):
         :raises DataGatewayError:
         """
 
+    @abstractmethod
+    async def save_with_unique_username(self, user: User) -> None:
+        """
+        Checks username uniqueness and saves in a single statement.
+
+        :raises DataGatewayError:
+        :raises UsernameAlreadyExists:
+        """
+
     @abstractmethod
     async def read_by_id(self, user_id: UserId) -> User | None:
         """
@@ -33,8 +42,19 @@ class UserDataGateway(Protocol):
         """
 
     @abstractmethod
-    async def read_all(self, limit: int, offset: int) -> list[User]:
+    async def read_all(
+        self, limit: int, after_id: UserId | None = None
+    ) -> list[User]:
         """
+        Keyset page in `id` order: up to `limit` users with ids after `after_id`.
+
+        :raises DataGatewayError:
+        """
+
+    @abstractmethod
+    def stream_all(self, batch_size: int) -> AsyncIterator[User]:
+        """
+        All users in `id` order, fetched `batch_size` rows at a time.
+
         :raises DataGatewayError:
         """
-        
\ No newline at end of file
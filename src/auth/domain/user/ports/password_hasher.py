@@ -6,8 +6,22 @@ from auth.domain.user.value_objects import RawPassword
 
 class PasswordHasher(Protocol):
     @abstractmethod
-    def hash(self, raw_password: RawPassword) -> bytes: ...
+    async def hash(self, raw_password: RawPassword) -> bytes: ...
 
     @abstractmethod
-    def verify(self, *, raw_password: RawPassword, hashed_password: bytes) -> bool: ...
-    
\ No newline at end of file
+    async def verify(
+        self, *, raw_password: RawPassword, hashed_password: bytes
+    ) -> bool: ...
+
+    @abstractmethod
+    def needs_rehash(self, hashed_password: bytes) -> bool:
+        """
+        Whether the hash was made with another scheme or cost than
+        new hashes are.
+        """
+
+    @abstractmethod
+    async def verify_dummy(self, *, raw_password: RawPassword) -> bool:
+        """
+        Costs as much as `verify` against a real hash, always fails.
+        """
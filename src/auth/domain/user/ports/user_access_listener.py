@@ -0,0 +1,13 @@
+from abc import abstractmethod
+from typing import Protocol
+
+from auth.domain.user.value_objects import UserId
+
+
+class UserAccessListener(Protocol):
+    @abstractmethod
+    def on_access_changed(self, user_id: UserId) -> None:
+        """
+        Called once the user's roles or activation have been changed
+        in memory, before the change is persisted.
+        """
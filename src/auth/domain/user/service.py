@@ -1,6 +1,7 @@
 from auth.domain.user.entity import User
 from auth.domain.user.enums import UserRoleEnum
 from auth.domain.user.ports.password_hasher import PasswordHasher
+from auth.domain.user.ports.user_access_listener import UserAccessListener
 from auth.domain.user.ports.user_id_generator import UserIdGenerator
 from auth.domain.user.value_objects import (
     RawPassword,
@@ -15,18 +16,20 @@ class UserService:
         self,
         user_id_generator: UserIdGenerator,
         password_hasher: PasswordHasher,
+        user_access_listener: UserAccessListener,
     ) -> None:
         self._user_id_generator = user_id_generator
         self._password_hasher = password_hasher
+        self._user_access_listener = user_access_listener
 
-    def create_user(self, username: Username, raw_password: RawPassword) -> User:
+    async def create_user(
+        self, username: Username, raw_password: RawPassword
+    ) -> User:
         """
         :raises DomainFieldError:
         """
         user_id: UserId = UserId(self._user_id_generator())
-        password_hash: UserPasswordHash = UserPasswordHash(
-            self._password_hasher.hash(raw_password)
-        )
+        password_hash: UserPasswordHash = await self.hash_password(raw_password)
 
         return User(
             id_=user_id,
@@ -36,17 +39,32 @@ class UserService:
             is_active=True,
         )
 
-    def is_password_valid(self, user: User, raw_password: RawPassword) -> bool:
-        return self._password_hasher.verify(
+    async def is_password_valid(self, user: User, raw_password: RawPassword) -> bool:
+        return await self._password_hasher.verify(
             raw_password=raw_password,
             hashed_password=user.password_hash.value,
         )
 
+    def needs_password_rehash(self, user: User) -> bool:
+        return self._password_hasher.needs_rehash(user.password_hash.value)
+
+    async def hash_password(self, raw_password: RawPassword) -> UserPasswordHash:
+        return UserPasswordHash(await self._password_hasher.hash(raw_password))
+
+    async def verify_dummy_password(self, raw_password: RawPassword) -> bool:
+        """
+        Spends the same effort as `is_password_valid` when there is no user
+        to check against, so unknown usernames cannot be told apart by timing.
+        """
+        return await self._password_hasher.verify_dummy(raw_password=raw_password)
+
     def toggle_user_activation(self, user: User, is_active: bool) -> None:
         user.is_active = is_active
+        self._user_access_listener.on_access_changed(user.id_)
 
     def toggle_user_admin_role(self, user: User, is_admin: bool) -> None:
         if is_admin:
             user.roles.add(UserRoleEnum.ADMIN)
         else:
             user.roles.discard(UserRoleEnum.ADMIN)
+        self._user_access_listener.on_access_changed(user.id_)
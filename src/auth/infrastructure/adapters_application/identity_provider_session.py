@@ -8,7 +8,11 @@ from auth.domain.user.value_objects import UserId
 from auth.infrastructure.adapters_application.user_data_mapper_sqla import (
     SqlaUserDataMapper,
 )
-from auth.infrastructure.record_session import SessionRecord
+from auth.infrastructure.record_session import SessionIdentityRecord, SessionRecord
+from auth.infrastructure.session.access_token_processor_jwt import (
+    AccessTokenIdentity,
+)
+from auth.infrastructure.session.context_request import RequestIdentityContext
 from auth.infrastructure.session.errors import (
     AdapterError,
     SessionExpired,
@@ -16,7 +20,7 @@ from auth.infrastructure.session.errors import (
 )
 from auth.infrastructure.session.services.jwt_token import JwtTokenService
 from auth.infrastructure.session.services.session import SessionService
-
+from auth.infrastructure.user.role_cache_memory import InMemoryUserRoleCache
 
 
 class SessionIdentityProvider(IdentityProvider):
@@ -25,28 +29,171 @@ class SessionIdentityProvider(IdentityProvider):
         jwt_token_service: JwtTokenService,
         session_service: SessionService,
         sqla_user_data_mapper: SqlaUserDataMapper,
+        request_identity_context: RequestIdentityContext,
+        in_memory_user_role_cache: InMemoryUserRoleCache,
     ):
         self._jwt_token_service = jwt_token_service
         self._session_service = session_service
         self._sqla_user_data_mapper = sqla_user_data_mapper
+        self._request_identity_context = request_identity_context
+        self._in_memory_user_role_cache = in_memory_user_role_cache
 
     async def get_current_user_id(self) -> UserId:
         """
         :raises AuthenticationError:
         """
 
+        access_token: str = self._get_access_token()
+
+        stateless_identity: AccessTokenIdentity | None = (
+            self._get_stateless_identity(access_token)
+        )
+        if stateless_identity is not None:
+            return stateless_identity.user_id
+
+        session: SessionRecord = await self._authenticate_session(access_token)
+
+        if self._jwt_token_service.is_stateless_enabled:
+            user: User = await self._read_user(session.user_id)
+            self._renew_stateless_access_token(session, self._get_user_roles(user))
+
+        return session.user_id
+
+    async def get_current_user_roles(self) -> set[UserRoleEnum]:
+        """
+        Roles are resolved once per request, then served from the request
+        context; across requests, the role cache spares the user read.
+
+        :raises AuthenticationError:
+        """
+
+        access_token: str = self._get_access_token()
+
+        stateless_identity: AccessTokenIdentity | None = (
+            self._get_stateless_identity(access_token)
+        )
+        if stateless_identity is not None:
+            return stateless_identity.roles
+
+        session: SessionRecord = await self._authenticate_session(
+            access_token, with_roles=True
+        )
+        roles: set[UserRoleEnum] | None = self._request_identity_context.roles
+        if roles is None:
+            # the session was already cached, only the roles are left to resolve
+            roles = self._in_memory_user_role_cache.get(session.user_id)
+        if roles is None:
+            roles = self._get_user_roles(await self._read_user(session.user_id))
+            self._in_memory_user_role_cache.put(session.user_id, roles)
+        self._request_identity_context.roles = roles
+
+        if self._jwt_token_service.is_stateless_enabled:
+            self._renew_stateless_access_token(session, roles)
+
+        return roles
+
+    async def is_authenticated(self) -> bool:
+        """
+        A missing, malformed or expired token is rejected without touching
+        the session store, and the session is never prolonged.
+        """
+
+        try:
+            access_token: str = self._get_access_token()
+
+            if self._get_stateless_identity(access_token) is not None:
+                return True
+
+            await self._authenticate_session(access_token, prolong=False)
+        except AuthenticationError:
+            return False
+
+        return True
+
+    def _get_access_token(self) -> str:
+        """
+        :raises AuthenticationError:
+        """
+
+        if self._request_identity_context.access_token is not None:
+            return self._request_identity_context.access_token
+
         try:
             access_token: str = self._jwt_token_service.get_access_token_from_request()
+        except AdapterError as error:
+            raise AuthenticationError("Not authenticated") from error
+
+        self._request_identity_context.access_token = access_token
+        return access_token
+
+    def _get_stateless_identity(self, access_token: str) -> AccessTokenIdentity | None:
+        """
+        :raises AuthenticationError:
+        """
+
+        try:
+            identity: AccessTokenIdentity | None = (
+                self._jwt_token_service.get_stateless_identity_from_access_token(
+                    access_token
+                )
+            )
+        except AdapterError as error:
+            raise AuthenticationError("Not authenticated") from error
+
+        if identity is None or self._session_service.is_access_token_revoked(
+            identity
+        ):
+            return None
+
+        return identity
+
+    async def _authenticate_session(
+        self, access_token: str, *, prolong: bool = True, with_roles: bool = False
+    ) -> SessionRecord:
+        """
+        With `prolong` disabled, a session near expiry is accepted as is
+        and not kept in the request context.
+        With `with_roles`, a session read from the store comes with the user's
+        roles in the same query, kept in the request context.
+
+        :raises AuthenticationError:
+        """
+
+        if self._request_identity_context.session is not None:
+            return self._request_identity_context.session
+
+        try:
             session_id: str = self._jwt_token_service.get_session_id_from_access_token(
                 access_token
             )
         except AdapterError as error:
             raise AuthenticationError("Not authenticated") from error
 
+        cached_session: SessionRecord | None = (
+            self._session_service.get_cached_session(session_id)
+        )
+        if cached_session is not None and not prolong:
+            return cached_session
+        if cached_session is not None and not (
+            self._session_service.is_session_near_expiry(cached_session)
+        ):
+            self._request_identity_context.session = cached_session
+            return cached_session
+
         try:
-            session: SessionRecord = await self._session_service.get_session(
-                session_id, for_update=True
-            )
+            session: SessionRecord
+            if with_roles:
+                identity: SessionIdentityRecord = (
+                    await self._session_service.get_session_identity(session_id)
+                )
+                session = identity.session
+                roles: set[UserRoleEnum] = (
+                    identity.roles if identity.is_active else set()
+                )
+                self._request_identity_context.roles = roles
+                self._in_memory_user_role_cache.put(session.user_id, roles)
+            else:
+                session = await self._session_service.get_session(session_id)
         except (DataGatewayError, SessionNotFoundById) as error:
             raise AuthenticationError("Not authenticated") from error
 
@@ -55,17 +202,28 @@ class SessionIdentityProvider(IdentityProvider):
         except SessionExpired as error:
             raise AuthenticationError("Not authenticated") from error
 
+        self._session_service.cache_session(session)
+
+        if not prolong:
+            return session
+
         if self._session_service.is_session_near_expiry(session):
             await self._session_service.prolong_session(session)
+            # stateless tokens are renewed by the callers, with the user's identity
+            if not self._jwt_token_service.is_stateless_enabled:
+                self._renew_access_token(session)
 
-        return session.user_id
+        self._request_identity_context.session = session
+        return session
 
-    async def get_current_user_roles(self) -> set[UserRoleEnum]:
+    async def _read_user(self, user_id: UserId) -> User:
         """
         :raises AuthenticationError:
         """
 
-        user_id: UserId = await self.get_current_user_id()
+        cached_user: User | None = self._request_identity_context.user
+        if cached_user is not None and cached_user.id_ == user_id:
+            return cached_user
 
         try:
             user: User | None = await self._sqla_user_data_mapper.read_by_id(user_id)
@@ -74,4 +232,35 @@ class SessionIdentityProvider(IdentityProvider):
         except (DataGatewayError, UserNotFoundById) as error:
             raise AuthenticationError("Not authenticated") from error
 
-        return user.roles
\ No newline at end of file
+        self._request_identity_context.user = user
+        return user
+
+    @staticmethod
+    def _get_user_roles(user: User) -> set[UserRoleEnum]:
+        """
+        An inactive user holds no role.
+        """
+
+        return user.roles if user.is_active else set()
+
+    def _renew_access_token(self, session: SessionRecord) -> None:
+        """
+        The session has just been prolonged: a fresh token carries
+        the new expiration to the client, sparing it a re-login.
+        """
+
+        access_token: str = self._jwt_token_service.issue_access_token(session.id_)
+        self._jwt_token_service.add_access_token_to_request(access_token)
+
+    def _renew_stateless_access_token(
+        self, session: SessionRecord, roles: set[UserRoleEnum]
+    ) -> None:
+        """
+        The stateless window of the presented token is over, while the session
+        is still valid: a fresh token restarts the window.
+        """
+
+        access_token: str = self._jwt_token_service.issue_access_token(
+            session.id_, user_id=session.user_id, roles=roles
+        )
+        self._jwt_token_service.add_access_token_to_request(access_token)
@@ -1,12 +1,17 @@
+from typing import AsyncIterator
+from uuid import UUID
+
 from sqlalchemy import Select, exists, select
+from sqlalchemy.dialects.postgresql import Insert, insert
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.sql.operators import eq
 
 from auth.application.errors import DataGatewayError
 from auth.application.user.ports.user_data_gateway import UserDataGateway
+from auth.domain.user.errors.existence import UsernameAlreadyExists
 from auth.domain.user.value_objects import UserId, Username
-from auth.infrastructure.user.persistence_sqla import User
+from auth.infrastructure.user.persistence_sqla import User, users_table
 
 
 class SqlaUserDataMapper(UserDataGateway):
@@ -26,6 +31,40 @@ class SqlaUserDataMapper(UserDataGateway):
         except SQLAlchemyError as error:
             raise DataGatewayError("Database query failed.") from error
 
+    async def save_with_unique_username(self, user: User) -> None:
+        """
+        A concurrent signup with the same username loses the conflict
+        instead of failing on the unique constraint.
+
+        :raises DataGatewayError:
+        :raises UsernameAlreadyExists:
+        """
+        insert_stmt: Insert = (
+            insert(users_table)
+            .values(
+                id=user.id_.value,
+                username=user.username.value,
+                password_hash=user.password_hash.value,
+                roles=list(user.roles),
+                is_active=user.is_active,
+            )
+            .on_conflict_do_nothing(index_elements=[users_table.c.username])
+            .returning(users_table.c.id)
+        )
+
+        try:
+            inserted_id: UUID | None = (
+                await self._session.execute(insert_stmt)
+            ).scalar_one_or_none()
+
+        except OSError as error:
+            raise DataGatewayError("Connection failed.") from error
+        except SQLAlchemyError as error:
+            raise DataGatewayError("Database query failed.") from error
+
+        if inserted_id is None:
+            raise UsernameAlreadyExists(user.username.value)
+
     async def read_by_id(self, user_id: UserId) -> User | None:
         """
         :raises DataGatewayError:
@@ -89,11 +128,20 @@ class SqlaUserDataMapper(UserDataGateway):
         except SQLAlchemyError as error:
             raise DataGatewayError("Database query failed.") from error
 
-    async def read_all(self, limit: int, offset: int) -> list[User]:
+    async def read_all(
+        self, limit: int, after_id: UserId | None = None
+    ) -> list[User]:
         """
+        Seeks through the primary key index instead of skipping rows, so every
+        page costs the same. UUIDv7 ids keep the order close to signup order.
+
         :raises DataGatewayError:
         """
-        select_stmt: Select[tuple[User]] = select(User).limit(limit).offset(offset)
+        select_stmt: Select[tuple[User]] = (
+            select(User).order_by(users_table.c.id).limit(limit)
+        )
+        if after_id is not None:
+            select_stmt = select_stmt.where(users_table.c.id > after_id.value)
 
         try:
             users: list[User] = list((await self._session.scalars(select_stmt)).all())
@@ -103,4 +151,28 @@ class SqlaUserDataMapper(UserDataGateway):
         except OSError as error:
             raise DataGatewayError("Connection failed.") from error
         except SQLAlchemyError as error:
-            raise DataGatewayError("Database query failed.") from error
\ No newline at end of file
+            raise DataGatewayError("Database query failed.") from error
+
+    async def stream_all(self, batch_size: int) -> AsyncIterator[User]:
+        """
+        Reads through a server-side cursor. Users are detached from the session
+        once consumed, so memory stays flat however many rows there are.
+
+        :raises DataGatewayError:
+        """
+        select_stmt: Select[tuple[User]] = (
+            select(User)
+            .order_by(users_table.c.id)
+            .execution_options(yield_per=batch_size)
+        )
+
+        try:
+            users = await self._session.stream_scalars(select_stmt)
+            async for user in users:
+                yield user
+                self._session.expunge(user)
+
+        except OSError as error:
+            raise DataGatewayError("Connection failed.") from error
+        except SQLAlchemyError as error:
+            raise DataGatewayError("Database query failed.") from error
@@ -0,0 +1,94 @@
+import time
+from collections import OrderedDict
+from typing import Callable, Generic, Hashable, TypeVar
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+class TtlLruCache(Generic[K, V]):
+    """
+    In-process cache bounded both by entry count and by entry age.
+    - The least recently used entry is evicted once `max_entries` is exceeded.
+    - An entry is dropped on access once its TTL has passed.
+    - `max_entries == 0` disables the cache: nothing is stored.
+    - `on_evict` is called for every entry leaving the cache for any reason.
+    Not thread-safe; meant to be used from a single event loop.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_entries: int,
+        ttl_s: float,
+        on_evict: Callable[[K, V], None] | None = None,
+    ):
+        self._max_entries = max_entries
+        self._ttl_s = ttl_s
+        self._on_evict = on_evict
+        self._entries: OrderedDict[K, tuple[float, V]] = OrderedDict()
+        self.hits: int = 0
+        self.misses: int = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._entries
+
+    @property
+    def is_enabled(self) -> bool:
+        return self._max_entries > 0 and self._ttl_s > 0
+
+    def get(self, key: K) -> V | None:
+        entry: tuple[float, V] | None = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            self.pop(key)
+            self.misses += 1
+            return None
+
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def put(self, key: K, value: V, ttl_s: float | None = None) -> None:
+        """
+        `ttl_s` can only shorten the cache-wide TTL for this entry.
+        """
+        if not self.is_enabled:
+            return
+
+        entry_ttl_s: float = self._ttl_s if ttl_s is None else min(ttl_s, self._ttl_s)
+        if entry_ttl_s <= 0:
+            self.pop(key)
+            return
+
+        self.pop(key)
+        self._entries[key] = (time.monotonic() + entry_ttl_s, value)
+
+        while len(self._entries) > self._max_entries:
+            evicted_key, (_, evicted_value) = self._entries.popitem(last=False)
+            self._notify_evicted(evicted_key, evicted_value)
+
+    def pop(self, key: K) -> V | None:
+        entry: tuple[float, V] | None = self._entries.pop(key, None)
+        if entry is None:
+            return None
+
+        _, value = entry
+        self._notify_evicted(key, value)
+        return value
+
+    def clear(self) -> None:
+        while self._entries:
+            key, (_, value) = self._entries.popitem(last=False)
+            self._notify_evicted(key, value)
+
+    def _notify_evicted(self, key: K, value: V) -> None:
+        if self._on_evict is not None:
+            self._on_evict(key, value)
@@ -0,0 +1,14 @@
+from dataclasses import dataclass, field
+from datetime import datetime
+from uuid import UUID
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class RevokeSessionsRequest:
+    user_ids: list[UUID] = field(default_factory=list)
+    created_before: datetime | None = None
+
+
+@dataclass(frozen=True, slots=True)
+class RevokeSessionsResponse:
+    message: str
@@ -3,9 +3,36 @@ from typing import Literal, NewType
 
 # security.password
 PasswordPepper = NewType("PasswordPepper", str)
+PasswordHasherPoolKind = Literal["thread", "process"]
+ConstantTimeLogin = NewType("ConstantTimeLogin", bool)
+DummyPasswordHash = NewType("DummyPasswordHash", bytes)
+PasswordHashScheme = Literal["bcrypt", "argon2id"]
+UserImportFormat = Literal["csv", "ndjson"]
 
 # security.jwt
 JwtSecret = NewType("JwtSecret", str)
 JwtAlgorithm = Literal["HS256", "HS384", "HS512", "RS256", "RS384", "RS512"]
 JwtAccessTokenTtlMin = NewType("JwtAccessTokenTtlMin", timedelta)
+JwtStatelessWindow = NewType("JwtStatelessWindow", timedelta)
+JwtDecodeCacheMaxEntries = NewType("JwtDecodeCacheMaxEntries", int)
 SessionRefreshThreshold = NewType("SessionRefreshThreshold", float)
+SessionCacheMaxEntries = NewType("SessionCacheMaxEntries", int)
+SessionCacheTtl = NewType("SessionCacheTtl", timedelta)
+SessionReaperInterval = NewType("SessionReaperInterval", timedelta)
+SessionReaperBatchSize = NewType("SessionReaperBatchSize", int)
+SessionProlongFlushInterval = NewType("SessionProlongFlushInterval", timedelta)
+SessionRevocationBatchSize = NewType("SessionRevocationBatchSize", int)
+UserRoleCacheMaxEntries = NewType("UserRoleCacheMaxEntries", int)
+UserRoleCacheTtl = NewType("UserRoleCacheTtl", timedelta)
+
+# security.rate_limit
+RateLimitBackend = Literal["memory", "redis"]
+RateLimitKeyPrefix = NewType("RateLimitKeyPrefix", str)
+LoginRateLimitPerUsername = NewType("LoginRateLimitPerUsername", int)
+LoginRateLimitPerUsernameAddress = NewType("LoginRateLimitPerUsernameAddress", int)
+LoginRateLimitPerAddress = NewType("LoginRateLimitPerAddress", int)
+LoginRateLimitWindow = NewType("LoginRateLimitWindow", timedelta)
+
+# db.session_store
+SessionStoreBackend = Literal["sqla", "redis", "memory"]
+SessionStoreKeyPrefix = NewType("SessionStoreKeyPrefix", str)
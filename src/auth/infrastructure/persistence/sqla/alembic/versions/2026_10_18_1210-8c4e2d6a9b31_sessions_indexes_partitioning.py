@@ -0,0 +1,120 @@
+"""sessions indexes and optional partitioning
+
+Indexes `sessions.user_id` (per-user revocation) and `sessions.expiration`
+(expiry sweeps).
+
+Partitioning is opt-in: `alembic -x sessions_partitioning=true upgrade head`.
+It rebuilds `sessions` as a table partitioned by range of `expiration`, with
+one partition per day (`sessions_pYYYYMMDD`) plus a default partition.
+Expired days are then dropped by detaching their partition, see
+`SqlaSessionPartitionManager`. The primary key becomes `(id, expiration)`,
+as Postgres requires the partition key in it.
+Only live sessions are copied over.
+Whether `sessions` is already partitioned is read from the catalog, so the
+downgrade needs no flag and restores whichever layout is in place.
+
+Revision ID: 8c4e2d6a9b31
+Revises: 3f1a9c2b7d10
+Create Date: 2026-10-18 12:10:00.000000
+
+"""
+from datetime import UTC, date, datetime, timedelta
+from typing import Sequence, Union
+
+from alembic import context, op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "8c4e2d6a9b31"
+down_revision: Union[str, None] = "3f1a9c2b7d10"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+PARTITION_DAYS_AHEAD: int = 7
+
+
+def is_partitioning_requested() -> bool:
+    x_arguments: dict[str, str] = context.get_x_argument(as_dictionary=True)
+    return x_arguments.get("sessions_partitioning", "").lower() in ("1", "true")
+
+
+def is_sessions_partitioned() -> bool:
+    if context.is_offline_mode():
+        # no database to inspect when only rendering SQL
+        return is_partitioning_requested()
+
+    return bool(
+        op.get_bind().scalar(
+            sa.text(
+                "SELECT EXISTS (SELECT 1 FROM pg_partitioned_table "
+                "WHERE partrelid = to_regclass('sessions'))"
+            )
+        )
+    )
+
+
+def upgrade() -> None:
+    if not is_partitioning_requested() or is_sessions_partitioned():
+        op.create_index(op.f("ix_sessions_user_id"), "sessions", ["user_id"])
+        op.create_index(op.f("ix_sessions_expiration"), "sessions", ["expiration"])
+        return
+
+    op.rename_table("sessions", "sessions_unpartitioned")
+    op.execute(
+        "ALTER TABLE sessions_unpartitioned "
+        "RENAME CONSTRAINT pk_sessions TO pk_sessions_unpartitioned"
+    )
+    op.execute(
+        "CREATE TABLE sessions ("
+        "id VARCHAR NOT NULL, "
+        "user_id UUID NOT NULL, "
+        "expiration TIMESTAMP WITH TIME ZONE NOT NULL, "
+        "CONSTRAINT pk_sessions PRIMARY KEY (id, expiration)"
+        ") PARTITION BY RANGE (expiration)"
+    )
+    op.execute("CREATE TABLE sessions_default PARTITION OF sessions DEFAULT")
+
+    today: date = datetime.now(tz=UTC).date()
+    for day_offset in range(PARTITION_DAYS_AHEAD + 1):
+        day: date = today + timedelta(days=day_offset)
+        op.execute(
+            f"CREATE TABLE sessions_p{day:%Y%m%d} PARTITION OF sessions "
+            f"FOR VALUES FROM ('{day.isoformat()}') "
+            f"TO ('{(day + timedelta(days=1)).isoformat()}')"
+        )
+
+    op.create_index(op.f("ix_sessions_user_id"), "sessions", ["user_id"])
+    op.create_index(op.f("ix_sessions_expiration"), "sessions", ["expiration"])
+    op.execute(
+        "INSERT INTO sessions (id, user_id, expiration) "
+        "SELECT id, user_id, expiration FROM sessions_unpartitioned "
+        "WHERE expiration > now()"
+    )
+    op.drop_table("sessions_unpartitioned")
+
+
+def downgrade() -> None:
+    if not is_sessions_partitioned():
+        op.drop_index(op.f("ix_sessions_expiration"), table_name="sessions")
+        op.drop_index(op.f("ix_sessions_user_id"), table_name="sessions")
+        return
+
+    op.rename_table("sessions", "sessions_partitioned")
+    op.execute(
+        "ALTER TABLE sessions_partitioned "
+        "RENAME CONSTRAINT pk_sessions TO pk_sessions_partitioned"
+    )
+    op.execute(
+        "CREATE TABLE sessions ("
+        "id VARCHAR NOT NULL, "
+        "user_id UUID NOT NULL, "
+        "expiration TIMESTAMP WITH TIME ZONE NOT NULL, "
+        "CONSTRAINT pk_sessions PRIMARY KEY (id)"
+        ")"
+    )
+    op.execute(
+        "INSERT INTO sessions (id, user_id, expiration) "
+        "SELECT id, user_id, expiration FROM sessions_partitioned "
+        "WHERE expiration > now()"
+    )
+    op.drop_table("sessions_partitioned")
@@ -0,0 +1,17 @@
+import math
+
+from auth.infrastructure.base.errors import InfrastructureError
+
+
+class RateLimitExceeded(InfrastructureError):
+    def __init__(self, scope: str, retry_after_s: float):
+        self.retry_after_s: int = max(1, math.ceil(retry_after_s))
+        message: str = (
+            f"Too many attempts ({scope}). "
+            f"Try again in {self.retry_after_s} seconds."
+        )
+        super().__init__(message)
+
+
+class RateLimitStorageError(InfrastructureError):
+    pass
@@ -0,0 +1,69 @@
+import logging
+import time
+
+from auth.infrastructure.rate_limiting.errors import (
+    RateLimitExceeded,
+    RateLimitStorageError,
+)
+from auth.infrastructure.rate_limiting.ports.rate_limit_storage import (
+    RateLimitStorage,
+)
+
+log = logging.getLogger(__name__)
+
+
+class SlidingWindowRateLimiter:
+    """
+    Sliding window approximated from two fixed-window counters:
+    hits of the previous window are weighted by how much of it still
+    overlaps the sliding window.
+    - `limit == 0` disables the limiter.
+    - Storage failures let the hit through: limiting is best effort and
+      must not take logins down with it.
+    """
+
+    def __init__(
+        self,
+        rate_limit_storage: RateLimitStorage,
+        *,
+        scope: str,
+        limit: int,
+        window_s: float,
+    ):
+        self._rate_limit_storage = rate_limit_storage
+        self._scope = scope
+        self._limit = limit
+        self._window_s = window_s
+
+    @property
+    def is_enabled(self) -> bool:
+        return self._limit > 0 and self._window_s > 0
+
+    async def hit(self, key: str) -> None:
+        """
+        :raises RateLimitExceeded:
+        """
+        if not self.is_enabled:
+            return
+
+        now: float = time.time()
+        window_index: int = int(now // self._window_s)
+        window_elapsed_s: float = now - window_index * self._window_s
+
+        try:
+            current, previous = await self._rate_limit_storage.increment(
+                f"{self._scope}:{key}",
+                window_index=window_index,
+                window_s=self._window_s,
+            )
+        except RateLimitStorageError:
+            log.warning(
+                "Rate limit storage failed, '%s' is not limited.",
+                self._scope,
+                exc_info=True,
+            )
+            return
+
+        previous_weight: float = 1 - window_elapsed_s / self._window_s
+        if previous * previous_weight + current > self._limit:
+            raise RateLimitExceeded(self._scope, self._window_s - window_elapsed_s)
@@ -0,0 +1,7 @@
+from abc import abstractmethod
+from typing import Protocol
+
+
+class ClientAddressProvider(Protocol):
+    @abstractmethod
+    def get_client_address(self) -> str | None: ...
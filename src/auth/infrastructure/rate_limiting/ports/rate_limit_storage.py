@@ -0,0 +1,20 @@
+from abc import abstractmethod
+from typing import Protocol
+
+
+class RateLimitStorage(Protocol):
+    """
+    Hit counters split into fixed windows, `window_index` being the number
+    of whole windows since the epoch.
+    """
+
+    @abstractmethod
+    async def increment(
+        self, key: str, *, window_index: int, window_s: float
+    ) -> tuple[int, int]:
+        """
+        Counts one more hit of `key` in the given window.
+        Returns the hit counts of this window and of the previous one.
+
+        :raises RateLimitStorageError:
+        """
@@ -0,0 +1,72 @@
+from auth.infrastructure.custom_types import (
+    LoginRateLimitPerAddress,
+    LoginRateLimitPerUsername,
+    LoginRateLimitPerUsernameAddress,
+    LoginRateLimitWindow,
+)
+from auth.infrastructure.rate_limiting.limiter_sliding_window import (
+    SlidingWindowRateLimiter,
+)
+from auth.infrastructure.rate_limiting.ports.client_address_provider import (
+    ClientAddressProvider,
+)
+from auth.infrastructure.rate_limiting.ports.rate_limit_storage import (
+    RateLimitStorage,
+)
+
+
+class LoginRateLimitService:
+    """
+    Three sliding windows:
+    - per username, whatever the source, high enough that spreading
+      attempts over many addresses cannot lock the owner out cheaply;
+    - per username and source address, tighter;
+    - per source address, across usernames.
+    """
+
+    def __init__(
+        self,
+        rate_limit_storage: RateLimitStorage,
+        client_address_provider: ClientAddressProvider,
+        limit_per_username: LoginRateLimitPerUsername,
+        limit_per_username_address: LoginRateLimitPerUsernameAddress,
+        limit_per_address: LoginRateLimitPerAddress,
+        window: LoginRateLimitWindow,
+    ):
+        self._client_address_provider = client_address_provider
+        self._username_rate_limiter = SlidingWindowRateLimiter(
+            rate_limit_storage,
+            scope="login:username",
+            limit=limit_per_username,
+            window_s=window.total_seconds(),
+        )
+        self._username_address_rate_limiter = SlidingWindowRateLimiter(
+            rate_limit_storage,
+            scope="login:username_address",
+            limit=limit_per_username_address,
+            window_s=window.total_seconds(),
+        )
+        self._address_rate_limiter = SlidingWindowRateLimiter(
+            rate_limit_storage,
+            scope="login:address",
+            limit=limit_per_address,
+            window_s=window.total_seconds(),
+        )
+
+    async def check_login_attempt(self, username: str) -> None:
+        """
+        Counts every attempt, successful or not, so that bursts are shed
+        before any database or password hashing work.
+        Without a known source address, only the per-username limit applies.
+
+        :raises RateLimitExceeded:
+        """
+
+        client_address: str | None = self._client_address_provider.get_client_address()
+        if client_address is not None:
+            await self._address_rate_limiter.hit(client_address)
+            await self._username_address_rate_limiter.hit(
+                f"{username}@{client_address}"
+            )
+
+        await self._username_rate_limiter.hit(username)
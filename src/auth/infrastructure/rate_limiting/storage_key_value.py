@@ -0,0 +1,50 @@
+import math
+
+from auth.infrastructure.custom_types import RateLimitKeyPrefix
+from auth.infrastructure.rate_limiting.errors import RateLimitStorageError
+from auth.infrastructure.rate_limiting.ports.rate_limit_storage import (
+    RateLimitStorage,
+)
+from auth.infrastructure.session.errors import KeyValueClientError
+from auth.infrastructure.session.ports.key_value_client import KeyValueClient
+
+
+class KeyValueRateLimitStorage(RateLimitStorage):
+    """
+    Counters shared by all workers, one key per window:
+    `{prefix}:rate_limit:{key}:{window_index}`.
+    A window key expires once it can no longer be read as the previous window.
+    """
+
+    def __init__(
+        self,
+        key_value_client: KeyValueClient,
+        key_prefix: RateLimitKeyPrefix,
+    ):
+        self._key_value_client = key_value_client
+        self._key_prefix = key_prefix
+
+    async def increment(
+        self, key: str, *, window_index: int, window_s: float
+    ) -> tuple[int, int]:
+        """
+        :raises RateLimitStorageError:
+        """
+        current_window_key: str = self._window_key(key, window_index)
+        previous_window_key: str = self._window_key(key, window_index - 1)
+
+        try:
+            current, _, previous = await (
+                self._key_value_client.pipeline(transaction=False)
+                .incr(current_window_key)
+                .pexpire(current_window_key, math.ceil(2 * window_s * 1000))
+                .get(previous_window_key)
+                .execute()
+            )
+        except KeyValueClientError as error:
+            raise RateLimitStorageError("Rate limit storage failed.") from error
+
+        return int(current), 0 if previous is None else int(previous)
+
+    def _window_key(self, key: str, window_index: int) -> str:
+        return f"{self._key_prefix}:rate_limit:{key}:{window_index}"
@@ -0,0 +1,44 @@
+from auth.infrastructure.rate_limiting.ports.rate_limit_storage import (
+    RateLimitStorage,
+)
+
+
+class InMemoryRateLimitStorage(RateLimitStorage):
+    """
+    Process-local counters: each worker enforces limits on its own share
+    of the traffic. Keys idle for more than one window are dropped
+    whenever a new window starts.
+    """
+
+    def __init__(self) -> None:
+        # key -> (window index, hits in that window, hits in the previous one)
+        self._counters: dict[str, tuple[int, int, int]] = {}
+        self._latest_window_index: int = 0
+
+    async def increment(
+        self, key: str, *, window_index: int, window_s: float
+    ) -> tuple[int, int]:
+        if window_index > self._latest_window_index:
+            self._latest_window_index = window_index
+            self._prune(window_index)
+
+        counted_window_index, current, previous = self._counters.get(
+            key, (window_index, 0, 0)
+        )
+        if counted_window_index == window_index - 1:
+            current, previous = 0, current
+        elif counted_window_index != window_index:
+            current, previous = 0, 0
+
+        current += 1
+        self._counters[key] = (window_index, current, previous)
+        return current, previous
+
+    def _prune(self, window_index: int) -> None:
+        stale_keys: list[str] = [
+            key
+            for key, (counted_window_index, _, _) in self._counters.items()
+            if counted_window_index < window_index - 1
+        ]
+        for key in stale_keys:
+            del self._counters[key]
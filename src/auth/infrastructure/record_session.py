@@ -1,6 +1,7 @@
 from dataclasses import dataclass
 from datetime import datetime
 
+from auth.domain.user.enums import UserRoleEnum
 from auth.domain.user.value_objects import UserId
 
 
@@ -9,4 +10,14 @@ class SessionRecord:
     id_: str
     user_id: UserId
     expiration: datetime
-    
\ No newline at end of file
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class SessionIdentityRecord:
+    """
+    A session together with what authorization needs to know of its user.
+    """
+
+    session: SessionRecord
+    roles: set[UserRoleEnum]
+    is_active: bool
@@ -13,9 +13,14 @@ from auth.infrastructure.adapters_application.user_data_mapper_sqla import (
     SqlaUserDataMapper,
 )
 from auth.infrastructure.base.interactors import InteractorStrict
+from auth.infrastructure.custom_types import ConstantTimeLogin
+from auth.infrastructure.rate_limiting.services.login import LoginRateLimitService
 from auth.infrastructure.record_session import SessionRecord
 from auth.infrastructure.session.services.jwt_token import JwtTokenService
 from auth.infrastructure.session.services.session import SessionService
+from auth.infrastructure.user.password_rehash_scheduler import (
+    PasswordRehashScheduler,
+)
 from auth.infrastructure.contracts.login import LogInRequest, LogInResponse
 
 
@@ -25,6 +30,8 @@ class LogInInteractor(InteractorStrict[LogInRequest, LogInResponse]):
     :raises DomainFieldError:
     :raises DataGatewayError:
     :raises UserNotFoundByUsername:
+    :raises PasswordHasherBusy:
+    :raises RateLimitExceeded:
     """
 
     def __init__(
@@ -34,42 +41,65 @@ class LogInInteractor(InteractorStrict[LogInRequest, LogInResponse]):
         session_service: SessionService,
         jtw_token_service: JwtTokenService,
         user_service: UserService,
+        constant_time_login: ConstantTimeLogin,
+        login_rate_limit_service: LoginRateLimitService,
+        password_rehash_scheduler: PasswordRehashScheduler,
     ):
         self._session_identity_provider = session_identity_provider
         self._sqla_user_data_mapper = sqla_user_data_mapper
         self._session_service = session_service
         self._jwt_token_service = jtw_token_service
         self._user_service = user_service
+        self._constant_time_login = constant_time_login
+        self._login_rate_limit_service = login_rate_limit_service
+        self._password_rehash_scheduler = password_rehash_scheduler
 
     async def __call__(self, request_data: LogInRequest) -> LogInResponse:
 
-        try:
-            await self._session_identity_provider.get_current_user_id()
+        username: Username = Username(request_data.username)
+        password: RawPassword = RawPassword(request_data.password)
+
+        await self._login_rate_limit_service.check_login_attempt(username.value)
+
+        if await self._session_identity_provider.is_authenticated():
             raise AlreadyAuthenticatedError(
                 "You are already authenticated. Consider logging out."
             )
-        except AuthenticationError:
-            pass
-
-        username: Username = Username(request_data.username)
-        password: RawPassword = RawPassword(request_data.password)
 
         user: User | None = await self._sqla_user_data_mapper.read_by_username(username)
+
         if user is None:
-            raise UserNotFoundByUsername(username)
+            if not self._constant_time_login:
+                raise UserNotFoundByUsername(username)
+            # unknown usernames cost one bcrypt check too and fail the same way
+            await self._user_service.verify_dummy_password(password)
+            raise AuthenticationError("Invalid username or password.")
 
-        if not self._user_service.is_password_valid(user, password):
-            raise AuthenticationError("Invalid password.")
+        if not await self._user_service.is_password_valid(user, password):
+            raise AuthenticationError(
+                "Invalid username or password."
+                if self._constant_time_login
+                else "Invalid password."
+            )
 
         if not user.is_active:
             raise AuthenticationError(
                 "Your account is inactive. Please contact support."
             )
 
+        if self._user_service.needs_password_rehash(user):
+            self._password_rehash_scheduler.schedule(
+                user.id_,
+                user.password_hash,
+                self._user_service.hash_password(password),
+            )
+
         session: SessionRecord = await self._session_service.create_session(user.id_)
         await self._session_service.save_session(session)
 
-        access_token: str = self._jwt_token_service.issue_access_token(session.id_)
+        access_token: str = self._jwt_token_service.issue_access_token(
+            session.id_, user_id=user.id_, roles=user.roles
+        )
         self._jwt_token_service.add_access_token_to_request(access_token)
 
         return LogInResponse("Logged in: successful.")
@@ -0,0 +1,61 @@
+from auth.application.user.service_authorization import AuthorizationService
+from auth.domain.user.enums import UserRoleEnum
+from auth.domain.user.value_objects import UserId
+from auth.infrastructure.base.interactors import InteractorStrict
+from auth.infrastructure.contracts.revoke_sessions import (
+    RevokeSessionsRequest,
+    RevokeSessionsResponse,
+)
+from auth.infrastructure.session.errors import SessionRevocationCriteriaError
+from auth.infrastructure.session.services.session import SessionService
+
+
+class RevokeSessionsInteractor(
+    InteractorStrict[RevokeSessionsRequest, RevokeSessionsResponse]
+):
+    """
+    :raises AuthenticationError:
+    :raises AuthorizationError:
+    :raises SessionRevocationCriteriaError:
+    :raises SessionRevocationUnsupported:
+    :raises DataGatewayError:
+    """
+
+    def __init__(
+        self,
+        authorization_service: AuthorizationService,
+        session_service: SessionService,
+    ):
+        self._authorization_service = authorization_service
+        self._session_service = session_service
+
+    async def __call__(
+        self, request_data: RevokeSessionsRequest
+    ) -> RevokeSessionsResponse:
+
+        await self._authorization_service.check_authorization(UserRoleEnum.ADMIN)
+
+        if not request_data.user_ids and request_data.created_before is None:
+            raise SessionRevocationCriteriaError(
+                "Provide user ids, a creation time cutoff or both."
+            )
+        if (
+            request_data.created_before is not None
+            and request_data.created_before.tzinfo is None
+        ):
+            raise SessionRevocationCriteriaError(
+                "The creation time cutoff must include a time zone."
+            )
+
+        if request_data.user_ids:
+            user_ids: list[UserId] = [
+                UserId(user_id) for user_id in dict.fromkeys(request_data.user_ids)
+            ]
+            await self._session_service.revoke_sessions_for_users(user_ids)
+
+        if request_data.created_before is not None:
+            await self._session_service.revoke_sessions_created_before(
+                request_data.created_before
+            )
+
+        return RevokeSessionsResponse("Sessions revoked: successful.")
@@ -1,10 +1,30 @@
+from dataclasses import dataclass
+from datetime import UTC, datetime, timedelta
 from typing import Any, cast
+from uuid import UUID
 
 import jwt
 
-from auth.infrastructure.custom_types import JwtAlgorithm, JwtSecret
-from auth.infrastructure.session.exceptions import AdapterError
-from auth.infrastructure.session.session_timer_utc import UtcSessionTimer
+from auth.domain.user.enums import UserRoleEnum
+from auth.domain.user.value_objects import UserId
+from auth.infrastructure.custom_types import (
+    JwtAlgorithm,
+    JwtSecret,
+    JwtStatelessWindow,
+)
+from auth.infrastructure.session.errors import AdapterError
+from auth.infrastructure.session.timer_utc import UtcSessionTimer
+from auth.infrastructure.session.token_cache_memory import (
+    InMemoryDecodedTokenCache,
+)
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class AccessTokenIdentity:
+    session_id: str
+    user_id: UserId
+    roles: set[UserRoleEnum]
+    issued_at: datetime
 
 
 class JwtAccessTokenProcessor:
@@ -13,16 +33,44 @@ class JwtAccessTokenProcessor:
         secret: JwtSecret,
         algorithm: JwtAlgorithm,
         utc_session_timer: UtcSessionTimer,
+        stateless_window: JwtStatelessWindow,
+        in_memory_decoded_token_cache: InMemoryDecodedTokenCache,
     ):
         self._secret = secret
         self._algorithm = algorithm
         self._utc_session_timer = utc_session_timer
+        self._stateless_window = stateless_window
+        self._in_memory_decoded_token_cache = in_memory_decoded_token_cache
+
+    @property
+    def is_stateless_enabled(self) -> bool:
+        return self._stateless_window > timedelta(0)
 
-    def issue_access_token(self, session_id: str) -> str:
+    def issue_access_token(
+        self,
+        session_id: str,
+        *,
+        user_id: UserId | None = None,
+        roles: set[UserRoleEnum] | None = None,
+    ) -> str:
+        """
+        With the stateless mode enabled and the user given, the token also
+        carries the user's identity, valid on its own until `stateless_exp`.
+        """
         to_encode: dict[str, Any] = {
             "session_id": session_id,
             "exp": int(self._utc_session_timer.access_expiration.timestamp()),
         }
+        if self.is_stateless_enabled and user_id is not None:
+            issued_at: datetime = self._utc_session_timer.current_time
+            to_encode |= {
+                "user_id": str(user_id.value),
+                "roles": sorted(roles or ()),
+                "iat": int(issued_at.timestamp()),
+                "stateless_exp": int(
+                    (issued_at + self._stateless_window).timestamp()
+                ),
+            }
         return jwt.encode(
             payload=to_encode,
             key=self._secret,
@@ -41,12 +89,52 @@ class JwtAccessTokenProcessor:
 
         return session_id
 
+    def extract_stateless_identity(
+        self, access_token: str
+    ) -> AccessTokenIdentity | None:
+        """
+        Returns None when the token carries no identity or its stateless
+        window is over, i.e. when the session store has to be consulted.
+
+        :raises AdapterError:
+        """
+        if not self.is_stateless_enabled:
+            return None
+
+        payload: dict[str, Any] = self._decode_token(access_token)
+
+        stateless_exp: int | None = payload.get("stateless_exp")
+        if (
+            stateless_exp is None
+            or stateless_exp <= self._utc_session_timer.current_time.timestamp()
+        ):
+            return None
+
+        try:
+            return AccessTokenIdentity(
+                session_id=payload["session_id"],
+                user_id=UserId(UUID(payload["user_id"])),
+                roles={UserRoleEnum(role) for role in payload["roles"]},
+                issued_at=datetime.fromtimestamp(payload["iat"], tz=UTC),
+            )
+        except (KeyError, TypeError, ValueError) as error:
+            raise AdapterError("Token identity is malformed.") from error
+
     def _decode_token(self, token: str) -> dict[str, Any]:
         """
+        Signature verification is skipped for tokens already verified
+        by this process and not yet expired.
+
         :raises AdapterError:
         """
+        cached_payload: dict[str, Any] | None = (
+            self._in_memory_decoded_token_cache.get(token)
+        )
+        if cached_payload is not None:
+            return cached_payload
+
         try:
-            return cast(
+            payload: dict[str, Any] = cast(
                 dict[str, Any],
                 jwt.decode(
                     jwt=token,
@@ -55,4 +143,7 @@ class JwtAccessTokenProcessor:
                 ),
             )
         except jwt.PyJWTError as error:
-            raise AdapterError("Token is invalid or expired.") from error
\ No newline at end of file
+            raise AdapterError("Token is invalid or expired.") from error
+
+        self._in_memory_decoded_token_cache.put(token, payload)
+        return payload
@@ -0,0 +1,74 @@
+from datetime import UTC, datetime
+
+from auth.domain.user.value_objects import UserId
+from auth.infrastructure.cache_ttl_lru import TtlLruCache
+from auth.infrastructure.custom_types import SessionCacheMaxEntries, SessionCacheTtl
+from auth.infrastructure.record_session import SessionRecord
+
+
+class InMemorySessionCache:
+    """
+    Process-local cache of already validated sessions, keyed by session id.
+    Entries never outlive the session expiration. Invalidation is local to the
+    process, so the cache TTL bounds how long other workers may keep serving
+    a revoked session.
+    """
+
+    def __init__(
+        self,
+        max_entries: SessionCacheMaxEntries,
+        ttl: SessionCacheTtl,
+    ):
+        self._sessions: TtlLruCache[str, SessionRecord] = TtlLruCache(
+            max_entries=max_entries,
+            ttl_s=ttl.total_seconds(),
+            on_evict=self._forget_user_session,
+        )
+        self._session_ids_by_user: dict[UserId, set[str]] = {}
+
+    def get(self, session_id: str) -> SessionRecord | None:
+        return self._sessions.get(session_id)
+
+    def put(self, session: SessionRecord) -> None:
+        """
+        Stores a detached copy, so the cached record never shares state
+        with an ORM session.
+        """
+        if not self._sessions.is_enabled:
+            return
+
+        session_copy: SessionRecord = SessionRecord(
+            id_=session.id_,
+            user_id=session.user_id,
+            expiration=session.expiration,
+        )
+        time_remaining_s: float = (
+            session.expiration - datetime.now(tz=UTC)
+        ).total_seconds()
+
+        self._sessions.put(session_copy.id_, session_copy, ttl_s=time_remaining_s)
+        if session_copy.id_ in self._sessions:
+            self._session_ids_by_user.setdefault(session.user_id, set()).add(
+                session_copy.id_
+            )
+
+    def invalidate(self, session_id: str) -> None:
+        self._sessions.pop(session_id)
+
+    def invalidate_user(self, user_id: UserId) -> None:
+        for session_id in tuple(self._session_ids_by_user.get(user_id, ())):
+            self._sessions.pop(session_id)
+
+    def clear(self) -> None:
+        self._sessions.clear()
+
+    def _forget_user_session(self, session_id: str, session: SessionRecord) -> None:
+        user_session_ids: set[str] | None = self._session_ids_by_user.get(
+            session.user_id
+        )
+        if user_session_ids is None:
+            return
+
+        user_session_ids.discard(session_id)
+        if not user_session_ids:
+            del self._session_ids_by_user[session.user_id]
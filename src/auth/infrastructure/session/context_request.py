@@ -0,0 +1,18 @@
+from auth.domain.user.entity import User
+from auth.domain.user.enums import UserRoleEnum
+from auth.infrastructure.record_session import SessionRecord
+
+
+class RequestIdentityContext:
+    """
+    What authentication has already resolved during the current request,
+    shared by every service of that request.
+    Only an authenticated (validated and unexpired) session is kept.
+    """
+
+    def __init__(self) -> None:
+        self.access_token: str | None = None
+        self.session: SessionRecord | None = None
+        self.user: User | None = None
+        # read along with the session, when it came from the session store
+        self.roles: set[UserRoleEnum] | None = None
@@ -0,0 +1,214 @@
+import json
+from datetime import datetime
+from typing import Any
+from uuid import UUID
+
+from auth.application.errors import DataGatewayError
+from auth.domain.user.value_objects import UserId
+from auth.infrastructure.custom_types import SessionStoreKeyPrefix
+from auth.infrastructure.record_session import SessionRecord
+from auth.infrastructure.session.errors import KeyValueClientError
+from auth.infrastructure.session.ports.key_value_client import KeyValueClient
+from auth.infrastructure.session.ports.session_data_gateway import (
+    SessionDataGateway,
+)
+from auth.infrastructure.session.timer_utc import UtcSessionTimer
+
+
+class KeyValueSessionDataMapper(SessionDataGateway):
+    """
+    Layout:
+    - `{prefix}:session:{session_id}` holds the session and expires with it.
+    - `{prefix}:user_sessions:{user_id}` is the set of the user's session ids,
+      kept alive as long as the user's latest session.
+    Expired sessions are removed by the store itself.
+    """
+
+    def __init__(
+        self,
+        key_value_client: KeyValueClient,
+        key_prefix: SessionStoreKeyPrefix,
+        utc_session_timer: UtcSessionTimer,
+    ):
+        self._key_value_client = key_value_client
+        self._key_prefix = key_prefix
+        self._utc_session_timer = utc_session_timer
+
+    async def save(self, session_record: SessionRecord) -> None:
+        """
+        :raises DataGatewayError:
+        """
+        ttl_ms: int = self._get_ttl_ms(session_record.expiration)
+        user_sessions_key: str = self._user_sessions_key(session_record.user_id)
+
+        try:
+            await (
+                self._key_value_client.pipeline()
+                .set(
+                    self._session_key(session_record.id_),
+                    self._encode(session_record),
+                    px=ttl_ms,
+                )
+                .sadd(user_sessions_key, session_record.id_)
+                .pexpire(user_sessions_key, ttl_ms)
+                .execute()
+            )
+
+        except OSError as error:
+            raise DataGatewayError("Connection failed.") from error
+        except KeyValueClientError as error:
+            raise DataGatewayError("Session store query failed.") from error
+
+    async def read(
+        self, session_id: str, for_update: bool = False
+    ) -> SessionRecord | None:
+        """
+        `for_update` is accepted for interface compatibility; the store has no
+        row locks, writes use conditional logic instead.
+
+        :raises DataGatewayError:
+        """
+        try:
+            raw_session: bytes | None = await self._key_value_client.get(
+                self._session_key(session_id)
+            )
+
+        except OSError as error:
+            raise DataGatewayError("Connection failed.") from error
+        except KeyValueClientError as error:
+            raise DataGatewayError("Session store query failed.") from error
+
+        if raw_session is None:
+            return None
+
+        return self._decode(session_id, raw_session)
+
+    async def prolong(
+        self,
+        session_record: SessionRecord,
+        *,
+        new_expiration: datetime,
+        refresh_boundary: datetime,
+    ) -> bool:
+        """
+        The session is only rewritten while its key still exists: a logout
+        or revocation between the read and the write is not undone.
+
+        :raises DataGatewayError:
+        """
+        stored_session: SessionRecord | None = await self.read(session_record.id_)
+        if stored_session is None or stored_session.expiration >= refresh_boundary:
+            return False
+
+        stored_session.expiration = new_expiration
+        ttl_ms: int = self._get_ttl_ms(new_expiration)
+        user_sessions_key: str = self._user_sessions_key(stored_session.user_id)
+
+        try:
+            is_prolonged, _ = await (
+                self._key_value_client.pipeline()
+                .set(
+                    self._session_key(stored_session.id_),
+                    self._encode(stored_session),
+                    px=ttl_ms,
+                    xx=True,
+                )
+                # a no-op once the user's sessions are all revoked
+                .pexpire(user_sessions_key, ttl_ms)
+                .execute()
+            )
+
+        except OSError as error:
+            raise DataGatewayError("Connection failed.") from error
+        except KeyValueClientError as error:
+            raise DataGatewayError("Session store query failed.") from error
+
+        if not is_prolonged:
+            return False
+
+        session_record.expiration = new_expiration
+        return True
+
+    async def delete(self, session_id: str) -> bool:
+        """
+        :raises DataGatewayError:
+        """
+        session: SessionRecord | None = await self.read(session_id)
+        if session is None:
+            return False
+
+        try:
+            deleted_count, _ = await (
+                self._key_value_client.pipeline()
+                .delete(self._session_key(session_id))
+                .srem(self._user_sessions_key(session.user_id), session_id)
+                .execute()
+            )
+
+            return bool(deleted_count)
+
+        except OSError as error:
+            raise DataGatewayError("Connection failed.") from error
+        except KeyValueClientError as error:
+            raise DataGatewayError("Session store query failed.") from error
+
+    async def delete_all_for_user(self, user_id: UserId) -> None:
+        """
+        :raises DataGatewayError:
+        """
+        user_sessions_key: str = self._user_sessions_key(user_id)
+
+        try:
+            session_ids: set[bytes] = await self._key_value_client.smembers(
+                user_sessions_key
+            )
+            session_keys: list[str] = [
+                self._session_key(session_id.decode()) for session_id in session_ids
+            ]
+            await (
+                self._key_value_client.pipeline()
+                .delete(*session_keys, user_sessions_key)
+                .execute()
+            )
+
+        except OSError as error:
+            raise DataGatewayError("Connection failed.") from error
+        except KeyValueClientError as error:
+            raise DataGatewayError("Session store query failed.") from error
+
+    def _session_key(self, session_id: str) -> str:
+        return f"{self._key_prefix}:session:{session_id}"
+
+    def _user_sessions_key(self, user_id: UserId) -> str:
+        return f"{self._key_prefix}:user_sessions:{user_id.value}"
+
+    def _get_ttl_ms(self, expiration: datetime) -> int:
+        time_remaining_ms: float = (
+            expiration - self._utc_session_timer.current_time
+        ).total_seconds() * 1000
+        return max(1, int(time_remaining_ms))
+
+    @staticmethod
+    def _encode(session_record: SessionRecord) -> bytes:
+        return json.dumps(
+            {
+                "user_id": str(session_record.user_id.value),
+                "expiration": session_record.expiration.isoformat(),
+            }
+        ).encode()
+
+    @staticmethod
+    def _decode(session_id: str, raw_session: bytes) -> SessionRecord:
+        """
+        :raises DataGatewayError:
+        """
+        try:
+            data: dict[str, Any] = json.loads(raw_session)
+            return SessionRecord(
+                id_=session_id,
+                user_id=UserId(UUID(data["user_id"])),
+                expiration=datetime.fromisoformat(data["expiration"]),
+            )
+
+        except (ValueError, KeyError, TypeError) as error:
+            raise DataGatewayError("Stored session is malformed.") from error
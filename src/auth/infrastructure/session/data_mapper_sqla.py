@@ -1,15 +1,20 @@
-from sqlalchemy import Delete, delete
+from datetime import datetime
+
+from sqlalchemy import Delete, delete, update
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.sql.dml import ReturningDelete
-from sqlalchemy.sql.operators import eq
+from sqlalchemy.sql.dml import ReturningDelete, ReturningUpdate
+from sqlalchemy.sql.operators import eq, lt
 
 from auth.application.errors import DataGatewayError
 from auth.domain.user.value_objects import UserId
 from auth.infrastructure.record_session import SessionRecord
+from auth.infrastructure.session.ports.session_data_gateway import (
+    SessionDataGateway,
+)
 
 
-class SqlaSessionDataMapper:
+class SqlaSessionDataMapper(SessionDataGateway):
     def __init__(self, session: AsyncSession):
         self._session = session
 
@@ -46,6 +51,41 @@ class SqlaSessionDataMapper:
         except SQLAlchemyError as error:
             raise DataGatewayError("Database query failed.") from error
 
+    async def prolong(
+        self,
+        session_record: SessionRecord,
+        *,
+        new_expiration: datetime,
+        refresh_boundary: datetime,
+    ) -> bool:
+        """
+        Conditional single-statement update: the row is only touched while its
+        expiration is still before `refresh_boundary`, so concurrent requests
+        prolonging the same session do not need a row lock held beforehand,
+        and only the first of them actually writes.
+        Loaded instances of the session are synchronized with the new value.
+
+        :raises DataGatewayError:
+        """
+        update_stmt: ReturningUpdate[tuple[str]] = (
+            update(SessionRecord)
+            .where(eq(SessionRecord.id_, session_record.id_))  # type: ignore
+            .where(lt(SessionRecord.expiration, refresh_boundary))  # type: ignore
+            .values(expiration=new_expiration)
+            .returning(SessionRecord.id_)
+        )
+
+        try:
+            result = await self._session.execute(update_stmt)
+            updated_ids: tuple[str, ...] = tuple(result.scalars().all())
+
+            return bool(updated_ids)
+
+        except OSError as error:
+            raise DataGatewayError("Connection failed.") from error
+        except SQLAlchemyError as error:
+            raise DataGatewayError("Database query failed.") from error
+
     async def delete(self, session_id: str) -> bool:
         """
         :raises DataGatewayError:
@@ -15,4 +15,15 @@ class SessionExpired(InfrastructureError):
     def __init__(self, session_id: str):
         message: str = f"Session with id '{session_id}' is expired or revoked."
         super().__init__(message)
-        
\ No newline at end of file
+
+
+class KeyValueClientError(InfrastructureError):
+    pass
+
+
+class SessionRevocationCriteriaError(InfrastructureError):
+    pass
+
+
+class SessionRevocationUnsupported(InfrastructureError):
+    pass
@@ -0,0 +1,48 @@
+from auth.domain.user.entity import User
+from auth.infrastructure.adapters_application.user_data_mapper_sqla import (
+    SqlaUserDataMapper,
+)
+from auth.infrastructure.record_session import SessionIdentityRecord, SessionRecord
+from auth.infrastructure.session.ports.session_data_gateway import (
+    SessionDataGateway,
+)
+from auth.infrastructure.session.ports.session_identity_reader import (
+    SessionIdentityReader,
+)
+
+
+class GatewaySessionIdentityReader(SessionIdentityReader):
+    """
+    For session stores outside the users database: the session and the user
+    are read one after the other.
+    """
+
+    def __init__(
+        self,
+        session_data_gateway: SessionDataGateway,
+        sqla_user_data_mapper: SqlaUserDataMapper,
+    ):
+        self._session_data_gateway = session_data_gateway
+        self._sqla_user_data_mapper = sqla_user_data_mapper
+
+    async def read(self, session_id: str) -> SessionIdentityRecord | None:
+        """
+        :raises DataGatewayError:
+        """
+        session: SessionRecord | None = await self._session_data_gateway.read(
+            session_id
+        )
+        if session is None:
+            return None
+
+        user: User | None = await self._sqla_user_data_mapper.read_by_id(
+            session.user_id
+        )
+        if user is None:
+            return None
+
+        return SessionIdentityRecord(
+            session=session,
+            roles=user.roles,
+            is_active=user.is_active,
+        )
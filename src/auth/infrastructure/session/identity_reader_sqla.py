@@ -0,0 +1,59 @@
+from sqlalchemy import Row, Select, select
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from auth.application.errors import DataGatewayError
+from auth.domain.user.value_objects import UserId
+from auth.infrastructure.record_session import SessionIdentityRecord, SessionRecord
+from auth.infrastructure.session.persistence_sqla import sessions_table
+from auth.infrastructure.session.ports.session_identity_reader import (
+    SessionIdentityReader,
+)
+from auth.infrastructure.user.persistence_sqla import users_table
+
+
+class SqlaSessionIdentityReader(SessionIdentityReader):
+    """
+    Reads the session and its user's roles in a single round trip,
+    joining `sessions` to `users` on the primary key. No row is locked.
+    """
+
+    def __init__(self, session: AsyncSession):
+        self._session = session
+
+    async def read(self, session_id: str) -> SessionIdentityRecord | None:
+        """
+        :raises DataGatewayError:
+        """
+        select_stmt: Select = (
+            select(
+                sessions_table.c.id,
+                sessions_table.c.user_id,
+                sessions_table.c.expiration,
+                users_table.c.roles,
+                users_table.c.is_active,
+            )
+            .join(users_table, users_table.c.id == sessions_table.c.user_id)
+            .where(sessions_table.c.id == session_id)
+        )
+
+        try:
+            row: Row | None = (await self._session.execute(select_stmt)).one_or_none()
+
+        except OSError as error:
+            raise DataGatewayError("Connection failed.") from error
+        except SQLAlchemyError as error:
+            raise DataGatewayError("Database query failed.") from error
+
+        if row is None:
+            return None
+
+        return SessionIdentityRecord(
+            session=SessionRecord(
+                id_=row.id,
+                user_id=UserId(row.user_id),
+                expiration=row.expiration,
+            ),
+            roles=set(row.roles),
+            is_active=row.is_active,
+        )
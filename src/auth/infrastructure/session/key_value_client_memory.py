@@ -0,0 +1,132 @@
+import time
+from typing import Any, Callable, Self
+
+from auth.infrastructure.session.ports.key_value_client import (
+    KeyValueClient,
+    KeyValuePipeline,
+)
+
+
+class InMemoryKeyValueClient(KeyValueClient):
+    """
+    In-process stand-in for a Redis server, for tests and local runs.
+    State is per process and lost on restart.
+    """
+
+    def __init__(self) -> None:
+        self._values: dict[str, bytes | set[bytes]] = {}
+        self._expires_at: dict[str, float] = {}
+
+    async def get(self, name: str) -> bytes | None:
+        return self.apply_get(name)
+
+    async def smembers(self, name: str) -> set[bytes]:
+        value: bytes | set[bytes] | None = self._lookup(name)
+        return set(value) if isinstance(value, set) else set()
+
+    def pipeline(self, transaction: bool = True) -> KeyValuePipeline:
+        return InMemoryKeyValuePipeline(self)
+
+    def _lookup(self, name: str) -> bytes | set[bytes] | None:
+        expires_at: float | None = self._expires_at.get(name)
+        if expires_at is not None and expires_at <= time.monotonic():
+            self._remove(name)
+        return self._values.get(name)
+
+    def _remove(self, name: str) -> int:
+        self._expires_at.pop(name, None)
+        return 0 if self._values.pop(name, None) is None else 1
+
+    def apply_set(
+        self, name: str, value: bytes, px: int | None, xx: bool = False
+    ) -> bool | None:
+        if xx and self._lookup(name) is None:
+            return None
+        self._remove(name)
+        self._values[name] = value
+        if px is not None:
+            self._expires_at[name] = time.monotonic() + px / 1000
+        return True
+
+    def apply_get(self, name: str) -> bytes | None:
+        value: bytes | set[bytes] | None = self._lookup(name)
+        return value if isinstance(value, bytes) else None
+
+    def apply_incr(self, name: str, amount: int) -> int:
+        """
+        Keeps the expiration of an existing key, as Redis does.
+        """
+        value: bytes | None = self.apply_get(name)
+        counter: int = (0 if value is None else int(value)) + amount
+        self._values[name] = str(counter).encode()
+        return counter
+
+    def apply_delete(self, *names: str) -> int:
+        return sum(
+            self._remove(name) for name in names if self._lookup(name) is not None
+        )
+
+    def apply_sadd(self, name: str, *values: str) -> int:
+        members: bytes | set[bytes] | None = self._lookup(name)
+        if not isinstance(members, set):
+            members = set()
+            self._values[name] = members
+        new_members: set[bytes] = {value.encode() for value in values} - members
+        members.update(new_members)
+        return len(new_members)
+
+    def apply_srem(self, name: str, *values: str) -> int:
+        members: bytes | set[bytes] | None = self._lookup(name)
+        if not isinstance(members, set):
+            return 0
+        removed_members: set[bytes] = members & {value.encode() for value in values}
+        members.difference_update(removed_members)
+        if not members:
+            self._remove(name)
+        return len(removed_members)
+
+    def apply_pexpire(self, name: str, time_ms: int) -> bool:
+        if self._lookup(name) is None:
+            return False
+        self._expires_at[name] = time.monotonic() + time_ms / 1000
+        return True
+
+
+class InMemoryKeyValuePipeline(KeyValuePipeline):
+    def __init__(self, client: InMemoryKeyValueClient):
+        self._client = client
+        self._commands: list[Callable[[], Any]] = []
+
+    def get(self, name: str) -> Self:
+        self._commands.append(lambda: self._client.apply_get(name))
+        return self
+
+    def set(
+        self, name: str, value: bytes, px: int | None = None, xx: bool = False
+    ) -> Self:
+        self._commands.append(lambda: self._client.apply_set(name, value, px, xx))
+        return self
+
+    def incr(self, name: str, amount: int = 1) -> Self:
+        self._commands.append(lambda: self._client.apply_incr(name, amount))
+        return self
+
+    def delete(self, *names: str) -> Self:
+        self._commands.append(lambda: self._client.apply_delete(*names))
+        return self
+
+    def sadd(self, name: str, *values: str) -> Self:
+        self._commands.append(lambda: self._client.apply_sadd(name, *values))
+        return self
+
+    def srem(self, name: str, *values: str) -> Self:
+        self._commands.append(lambda: self._client.apply_srem(name, *values))
+        return self
+
+    def pexpire(self, name: str, time: int) -> Self:
+        self._commands.append(lambda: self._client.apply_pexpire(name, time))
+        return self
+
+    async def execute(self) -> list[Any]:
+        commands, self._commands = self._commands, []
+        return [command() for command in commands]
@@ -0,0 +1,101 @@
+from typing import Any, Self
+
+from redis import RedisError
+from redis.asyncio import Redis
+from redis.asyncio.client import Pipeline
+
+from auth.infrastructure.session.errors import KeyValueClientError
+from auth.infrastructure.session.ports.key_value_client import (
+    KeyValueClient,
+    KeyValuePipeline,
+)
+
+
+class RedisKeyValueClient(KeyValueClient):
+    """
+    Requires the optional `redis` package.
+    """
+
+    def __init__(self, redis_client: Redis):
+        self._redis_client = redis_client
+
+    @classmethod
+    def from_url(cls, url: str) -> Self:
+        return cls(Redis.from_url(url))
+
+    async def get(self, name: str) -> bytes | None:
+        """
+        :raises KeyValueClientError:
+        """
+        try:
+            value: bytes | None = await self._redis_client.get(name)
+            return value
+
+        except RedisError as error:
+            raise KeyValueClientError("Key-value store query failed.") from error
+
+    async def smembers(self, name: str) -> set[bytes]:
+        """
+        :raises KeyValueClientError:
+        """
+        try:
+            members: set[bytes] = await self._redis_client.smembers(  # type: ignore
+                name
+            )
+            return members
+
+        except RedisError as error:
+            raise KeyValueClientError("Key-value store query failed.") from error
+
+    def pipeline(self, transaction: bool = True) -> KeyValuePipeline:
+        return RedisKeyValuePipeline(
+            self._redis_client.pipeline(transaction=transaction)
+        )
+
+    async def close(self) -> None:
+        await self._redis_client.aclose()
+
+
+class RedisKeyValuePipeline(KeyValuePipeline):
+    def __init__(self, redis_pipeline: Pipeline):
+        self._redis_pipeline = redis_pipeline
+
+    def get(self, name: str) -> Self:
+        self._redis_pipeline.get(name)
+        return self
+
+    def set(
+        self, name: str, value: bytes, px: int | None = None, xx: bool = False
+    ) -> Self:
+        self._redis_pipeline.set(name, value, px=px, xx=xx)
+        return self
+
+    def incr(self, name: str, amount: int = 1) -> Self:
+        self._redis_pipeline.incr(name, amount)
+        return self
+
+    def delete(self, *names: str) -> Self:
+        self._redis_pipeline.delete(*names)
+        return self
+
+    def sadd(self, name: str, *values: str) -> Self:
+        self._redis_pipeline.sadd(name, *values)
+        return self
+
+    def srem(self, name: str, *values: str) -> Self:
+        self._redis_pipeline.srem(name, *values)
+        return self
+
+    def pexpire(self, name: str, time: int) -> Self:
+        self._redis_pipeline.pexpire(name, time)
+        return self
+
+    async def execute(self) -> list[Any]:
+        """
+        :raises KeyValueClientError:
+        """
+        try:
+            return await self._redis_pipeline.execute()
+
+        except RedisError as error:
+            raise KeyValueClientError("Key-value store pipeline failed.") from error
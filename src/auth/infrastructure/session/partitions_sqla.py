@@ -0,0 +1,102 @@
+import logging
+import re
+from datetime import UTC, date, datetime, timedelta
+
+from sqlalchemy import TextClause, text
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+log = logging.getLogger(__name__)
+
+PARTITION_NAME_PATTERN: re.Pattern[str] = re.compile(r"^sessions_p(\d{8})$")
+
+
+class SqlaSessionPartitionManager:
+    """
+    Maintains daily range partitions of the partitioned `sessions` table,
+    see the `sessions_indexes_partitioning` migration.
+    - `sessions_pYYYYMMDD` holds sessions expiring on that UTC day.
+    - Partitions are created `days_ahead` days in advance, before any
+      session can expire within them.
+    - A partition is dropped as a whole once its day is over, which is far
+      cheaper than deleting its rows.
+    """
+
+    def __init__(
+        self,
+        session_maker: async_sessionmaker[AsyncSession],
+        *,
+        days_ahead: int,
+    ):
+        self._session_maker = session_maker
+        self._days_ahead = days_ahead
+
+    async def ensure_partitions(self) -> list[str]:
+        """
+        :raises OSError:
+        :raises SQLAlchemyError:
+        """
+        today: date = datetime.now(tz=UTC).date()
+        existing_partitions: set[str] = set(await self._list_partitions())
+        created_partitions: list[str] = []
+
+        async with self._session_maker() as session:
+            for day_offset in range(self._days_ahead + 1):
+                day: date = today + timedelta(days=day_offset)
+                partition_name: str = f"sessions_p{day:%Y%m%d}"
+                if partition_name in existing_partitions:
+                    continue
+
+                create_stmt: TextClause = text(
+                    f"CREATE TABLE IF NOT EXISTS {partition_name} "
+                    f"PARTITION OF sessions FOR VALUES "
+                    f"FROM ('{day.isoformat()}') "
+                    f"TO ('{(day + timedelta(days=1)).isoformat()}')"
+                )
+                await session.execute(create_stmt)
+                created_partitions.append(partition_name)
+            await session.commit()
+
+        if created_partitions:
+            log.info("Session partitions created: %s.", created_partitions)
+        return created_partitions
+
+    async def drop_expired_partitions(self) -> list[str]:
+        """
+        :raises OSError:
+        :raises SQLAlchemyError:
+        """
+        today: date = datetime.now(tz=UTC).date()
+        dropped_partitions: list[str] = []
+
+        async with self._session_maker() as session:
+            for partition_name in await self._list_partitions():
+                match: re.Match[str] | None = PARTITION_NAME_PATTERN.match(
+                    partition_name
+                )
+                if match is None:
+                    continue
+                partition_day: date = datetime.strptime(match[1], "%Y%m%d").date()
+                if partition_day >= today:
+                    continue
+
+                await session.execute(
+                    text(f"ALTER TABLE sessions DETACH PARTITION {partition_name}")
+                )
+                await session.execute(text(f"DROP TABLE {partition_name}"))
+                dropped_partitions.append(partition_name)
+            await session.commit()
+
+        if dropped_partitions:
+            log.info("Expired session partitions dropped: %s.", dropped_partitions)
+        return dropped_partitions
+
+    async def _list_partitions(self) -> list[str]:
+        select_stmt: TextClause = text(
+            "SELECT child.relname FROM pg_inherits "
+            "JOIN pg_class parent ON pg_inherits.inhparent = parent.oid "
+            "JOIN pg_class child ON pg_inherits.inhrelid = child.oid "
+            "WHERE parent.relname = 'sessions'"
+        )
+
+        async with self._session_maker() as session:
+            return list((await session.scalars(select_stmt)).all())
@@ -1,6 +1,6 @@
 __all__ = ("SessionRecord",)
 
-from sqlalchemy import UUID, Column, DateTime, String, Table
+from sqlalchemy import UUID, Column, DateTime, String, Table, func
 from sqlalchemy.orm import composite
 
 from auth.domain.user.value_objects import UserId
@@ -11,8 +11,16 @@ sessions_table = Table(
     "sessions",
     mapper_registry.metadata,
     Column("id", String, primary_key=True),
-    Column("user_id", UUID(as_uuid=True), nullable=False),
-    Column("expiration", DateTime(timezone=True), nullable=False),
+    Column("user_id", UUID(as_uuid=True), nullable=False, index=True),
+    Column("expiration", DateTime(timezone=True), nullable=False, index=True),
+    # set by the database, only read by bulk revocation
+    Column(
+        "created_at",
+        DateTime(timezone=True),
+        nullable=False,
+        server_default=func.now(),
+        index=True,
+    ),
 )
 
 mapper_registry.map_imperatively(
@@ -24,4 +32,5 @@ mapper_registry.map_imperatively(
         "expiration": sessions_table.c.expiration,
     },
     column_prefix="_",
+    exclude_properties=["created_at"],
 )
@@ -0,0 +1,64 @@
+from abc import abstractmethod
+from typing import Any, Protocol, Self
+
+
+class KeyValuePipeline(Protocol):
+    """
+    Commands are queued and sent in one round trip by `execute`.
+    """
+
+    @abstractmethod
+    def get(self, name: str) -> Self: ...
+
+    @abstractmethod
+    def set(
+        self, name: str, value: bytes, px: int | None = None, xx: bool = False
+    ) -> Self:
+        """
+        With `xx`, only an existing key is overwritten: the result is `None`
+        if the key is missing.
+        """
+
+    @abstractmethod
+    def incr(self, name: str, amount: int = 1) -> Self: ...
+
+    @abstractmethod
+    def delete(self, *names: str) -> Self: ...
+
+    @abstractmethod
+    def sadd(self, name: str, *values: str) -> Self: ...
+
+    @abstractmethod
+    def srem(self, name: str, *values: str) -> Self: ...
+
+    @abstractmethod
+    def pexpire(self, name: str, time: int) -> Self: ...
+
+    @abstractmethod
+    async def execute(self) -> list[Any]:
+        """
+        :raises KeyValueClientError:
+        """
+
+
+class KeyValueClient(Protocol):
+    """
+    Subset of the Redis protocol used by the key-value session store
+    and the shared rate limit counters.
+    Keys expire natively after the `px` / `pexpire` time in milliseconds.
+    """
+
+    @abstractmethod
+    async def get(self, name: str) -> bytes | None:
+        """
+        :raises KeyValueClientError:
+        """
+
+    @abstractmethod
+    async def smembers(self, name: str) -> set[bytes]:
+        """
+        :raises KeyValueClientError:
+        """
+
+    @abstractmethod
+    def pipeline(self, transaction: bool = True) -> KeyValuePipeline: ...
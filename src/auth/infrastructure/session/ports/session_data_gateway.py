@@ -0,0 +1,49 @@
+from abc import abstractmethod
+from datetime import datetime
+from typing import Protocol
+
+from auth.domain.user.value_objects import UserId
+from auth.infrastructure.record_session import SessionRecord
+
+
+class SessionDataGateway(Protocol):
+    @abstractmethod
+    async def save(self, session_record: SessionRecord) -> None:
+        """
+        :raises DataGatewayError:
+        """
+
+    @abstractmethod
+    async def read(
+        self, session_id: str, for_update: bool = False
+    ) -> SessionRecord | None:
+        """
+        :raises DataGatewayError:
+        """
+
+    @abstractmethod
+    async def prolong(
+        self,
+        session_record: SessionRecord,
+        *,
+        new_expiration: datetime,
+        refresh_boundary: datetime,
+    ) -> bool:
+        """
+        Sets `new_expiration` only while the stored expiration is still before
+        `refresh_boundary`; returns whether the session was prolonged.
+
+        :raises DataGatewayError:
+        """
+
+    @abstractmethod
+    async def delete(self, session_id: str) -> bool:
+        """
+        :raises DataGatewayError:
+        """
+
+    @abstractmethod
+    async def delete_all_for_user(self, user_id: UserId) -> None:
+        """
+        :raises DataGatewayError:
+        """
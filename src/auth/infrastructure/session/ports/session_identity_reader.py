@@ -0,0 +1,14 @@
+from abc import abstractmethod
+from typing import Protocol
+
+from auth.infrastructure.record_session import SessionIdentityRecord
+
+
+class SessionIdentityReader(Protocol):
+    @abstractmethod
+    async def read(self, session_id: str) -> SessionIdentityRecord | None:
+        """
+        None if either the session or its user does not exist.
+
+        :raises DataGatewayError:
+        """
@@ -0,0 +1,102 @@
+import asyncio
+import logging
+from datetime import datetime
+
+from sqlalchemy import DateTime, String, Update, Values, column, update, values
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from auth.infrastructure.custom_types import SessionProlongFlushInterval
+from auth.infrastructure.session.persistence_sqla import sessions_table
+
+log = logging.getLogger(__name__)
+
+
+class SqlaSessionProlongationCoalescer:
+    """
+    Write-behind buffer for session prolongations.
+    - Requests only record the new expiration in memory, the latest one
+      per session id wins.
+    - Pending expirations are periodically written as one multi-row
+      `UPDATE ... FROM (VALUES ...)`, which never moves an expiration back.
+    - Until then, the pending expiration is authoritative for this process.
+    - A failed flush, whatever the error, keeps its entries for the next one.
+    """
+
+    def __init__(
+        self,
+        session_maker: async_sessionmaker[AsyncSession],
+        *,
+        flush_interval: SessionProlongFlushInterval,
+        is_enabled: bool,
+    ):
+        self._session_maker = session_maker
+        self._flush_interval = flush_interval
+        self.is_enabled = is_enabled
+        self._pending: dict[str, datetime] = {}
+
+    def enqueue(self, session_id: str, new_expiration: datetime) -> None:
+        pending_expiration: datetime | None = self._pending.get(session_id)
+        if pending_expiration is None or pending_expiration < new_expiration:
+            self._pending[session_id] = new_expiration
+
+    def get_pending_expiration(self, session_id: str) -> datetime | None:
+        return self._pending.get(session_id)
+
+    def discard(self, session_id: str) -> None:
+        self._pending.pop(session_id, None)
+
+    async def run(self) -> None:
+        log.info(
+            "Session prolongation coalescer started: every %s.", self._flush_interval
+        )
+        while True:
+            await asyncio.sleep(self._flush_interval.total_seconds())
+            try:
+                await self.flush()
+            # cancellation is not an `Exception` and still stops the loop
+            except Exception:  # pylint: disable=W0718
+                log.error("Session prolongation flush failed.", exc_info=True)
+
+    async def flush(self) -> int:
+        if not self._pending:
+            return 0
+
+        flushed: dict[str, datetime] = {}
+        try:
+            flushed, self._pending = self._pending, {}
+            pending_rows: Values = values(
+                column("id", String),
+                column("expiration", DateTime(timezone=True)),
+                name="pending",
+            ).data(list(flushed.items()))
+            update_stmt: Update = (
+                update(sessions_table)
+                .where(
+                    sessions_table.c.id == pending_rows.c.id,
+                    sessions_table.c.expiration < pending_rows.c.expiration,
+                )
+                .values(expiration=pending_rows.c.expiration)
+            )
+
+            async with self._session_maker() as session:
+                await session.execute(update_stmt)
+                await session.commit()
+        except Exception:  # pylint: disable=W0718
+            log.error(
+                "Session prolongation flush of %d sessions failed.",
+                len(flushed),
+                exc_info=True,
+            )
+            self._requeue(flushed)
+            return 0
+        except asyncio.CancelledError:
+            # left for the final flush on shutdown
+            self._requeue(flushed)
+            raise
+
+        log.debug("Session prolongations flushed: %d sessions.", len(flushed))
+        return len(flushed)
+
+    def _requeue(self, flushed: dict[str, datetime]) -> None:
+        for session_id, new_expiration in flushed.items():
+            self.enqueue(session_id, new_expiration)
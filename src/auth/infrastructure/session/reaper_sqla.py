@@ -0,0 +1,126 @@
+import asyncio
+import logging
+import time
+from dataclasses import dataclass
+from datetime import UTC, datetime
+
+from sqlalchemy import Delete, ScalarSelect, delete, select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from auth.infrastructure.custom_types import (
+    SessionReaperBatchSize,
+    SessionReaperInterval,
+)
+from auth.infrastructure.session.partitions_sqla import SqlaSessionPartitionManager
+from auth.infrastructure.session.persistence_sqla import sessions_table
+
+log = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class SessionReapResult:
+    deleted: int
+    batches: int
+    partitions_dropped: int
+    elapsed_s: float
+
+
+class SqlaSessionReaper:
+    """
+    Periodically deletes expired sessions.
+    Each batch is its own short transaction that deletes at most `batch_size`
+    rows, picked in `expiration` order through its index and skipping rows
+    locked by concurrent requests.
+    With a partitioned table, whole expired days are dropped first, so the
+    batches only have to clean up the current day.
+    """
+
+    def __init__(
+        self,
+        session_maker: async_sessionmaker[AsyncSession],
+        *,
+        interval: SessionReaperInterval,
+        batch_size: SessionReaperBatchSize,
+        is_enabled: bool,
+        partition_manager: SqlaSessionPartitionManager | None = None,
+    ):
+        self._session_maker = session_maker
+        self._interval = interval
+        self._batch_size = batch_size
+        self.is_enabled = is_enabled
+        self._partition_manager = partition_manager
+
+    async def run(self) -> None:
+        log.info(
+            "Session reaper started: every %s, batches of %d.",
+            self._interval,
+            self._batch_size,
+        )
+        while True:
+            try:
+                await self.reap_expired()
+            # cancellation is not an `Exception` and still stops the loop
+            except Exception:  # pylint: disable=W0718
+                log.error("Session reaper run failed.", exc_info=True)
+            await asyncio.sleep(self._interval.total_seconds())
+
+    async def reap_expired(self) -> SessionReapResult:
+        """
+        :raises OSError:
+        :raises SQLAlchemyError:
+        """
+        started_at: float = time.perf_counter()
+        expired_before: datetime = datetime.now(tz=UTC)
+        deleted: int = 0
+        batches: int = 0
+        partitions_dropped: int = 0
+
+        if self._partition_manager is not None:
+            await self._partition_manager.ensure_partitions()
+            partitions_dropped = len(
+                await self._partition_manager.drop_expired_partitions()
+            )
+
+        while True:
+            batch_deleted: int = await self._delete_batch(expired_before)
+            deleted += batch_deleted
+            batches += 1
+            if batch_deleted < self._batch_size:
+                break
+            # yields to request handling between batches
+            await asyncio.sleep(0)
+
+        result = SessionReapResult(
+            deleted=deleted,
+            batches=batches,
+            partitions_dropped=partitions_dropped,
+            elapsed_s=time.perf_counter() - started_at,
+        )
+        log.info(
+            "Session reaper deleted %d expired sessions in %d batches "
+            "and dropped %d partitions, %.3f s.",
+            result.deleted,
+            result.batches,
+            result.partitions_dropped,
+            result.elapsed_s,
+        )
+        return result
+
+    async def _delete_batch(self, expired_before: datetime) -> int:
+        expired_ids: ScalarSelect = (
+            select(sessions_table.c.id)
+            .where(sessions_table.c.expiration <= expired_before)
+            .order_by(sessions_table.c.expiration)
+            .limit(self._batch_size)
+            .with_for_update(skip_locked=True)
+            .scalar_subquery()
+        )
+        delete_stmt: Delete = delete(sessions_table).where(
+            sessions_table.c.id.in_(expired_ids)
+        )
+
+        async with self._session_maker() as session:
+            result = await session.execute(delete_stmt)
+            await session.commit()
+
+        return int(result.rowcount)  # type: ignore[attr-defined]
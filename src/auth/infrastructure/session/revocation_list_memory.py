@@ -0,0 +1,60 @@
+from datetime import UTC, datetime
+
+from auth.domain.user.value_objects import UserId
+from auth.infrastructure.custom_types import JwtStatelessWindow
+from auth.infrastructure.session.access_token_processor_jwt import (
+    AccessTokenIdentity,
+)
+
+
+class InMemoryRevocationList:
+    """
+    Revocations that stateless tokens must honour within their window.
+    An entry is only needed until every token issued before it has left its
+    stateless window, so entries are dropped after one window.
+    Revocations are local to the process: other workers keep accepting
+    a revoked token until its stateless window is over.
+    """
+
+    def __init__(self, stateless_window: JwtStatelessWindow):
+        self._stateless_window = stateless_window
+        self._revoked_sessions: dict[str, datetime] = {}
+        self._revoked_users: dict[UserId, datetime] = {}
+        self._revoked_all_at: datetime | None = None
+
+    def revoke_session(self, session_id: str) -> None:
+        self._prune()
+        self._revoked_sessions[session_id] = datetime.now(tz=UTC)
+
+    def revoke_user(self, user_id: UserId) -> None:
+        self._prune()
+        self._revoked_users[user_id] = datetime.now(tz=UTC)
+
+    def revoke_all(self) -> None:
+        """
+        Every token issued so far takes the stateful path for one window.
+        """
+        self._prune()
+        self._revoked_all_at = datetime.now(tz=UTC)
+
+    def is_revoked(self, identity: AccessTokenIdentity) -> bool:
+        if identity.session_id in self._revoked_sessions:
+            return True
+        if (
+            self._revoked_all_at is not None
+            and identity.issued_at <= self._revoked_all_at
+        ):
+            return True
+
+        revoked_user_at: datetime | None = self._revoked_users.get(identity.user_id)
+        # `iat` has a one-second resolution, tokens issued within the same second
+        # are treated as revoked and simply take the stateful path
+        return revoked_user_at is not None and identity.issued_at <= revoked_user_at
+
+    def _prune(self) -> None:
+        stale_before: datetime = datetime.now(tz=UTC) - self._stateless_window
+        for revocations in (self._revoked_sessions, self._revoked_users):
+            for key in [key for key, at in revocations.items() if at < stale_before]:
+                del revocations[key]
+        if self._revoked_all_at is not None and self._revoked_all_at < stale_before:
+            self._revoked_all_at = None
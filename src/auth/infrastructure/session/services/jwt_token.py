@@ -1,5 +1,8 @@
 
+from auth.domain.user.enums import UserRoleEnum
+from auth.domain.user.value_objects import UserId
 from auth.infrastructure.session.access_token_processor_jwt import (
+    AccessTokenIdentity,
     JwtAccessTokenProcessor,
 )
 from auth.infrastructure.session.ports.access_token_request_handler import (
@@ -16,10 +19,21 @@ class JwtTokenService:
         self._jwt_access_token_processor = jwt_access_token_processor
         self._access_token_request_handler = access_token_request_handler
 
-    def issue_access_token(self, session_id: str) -> str:
+    @property
+    def is_stateless_enabled(self) -> bool:
+
+        return self._jwt_access_token_processor.is_stateless_enabled
+
+    def issue_access_token(
+        self,
+        session_id: str,
+        *,
+        user_id: UserId | None = None,
+        roles: set[UserRoleEnum] | None = None,
+    ) -> str:
 
         access_token: str = self._jwt_access_token_processor.issue_access_token(
-            session_id
+            session_id, user_id=user_id, roles=roles
         )
 
         return access_token
@@ -52,4 +66,17 @@ class JwtTokenService:
             access_token
         )
 
-        return session_id
\ No newline at end of file
+        return session_id
+
+    def get_stateless_identity_from_access_token(
+        self, access_token: str
+    ) -> AccessTokenIdentity | None:
+        """
+        :raises AdapterError:
+        """
+
+        identity: AccessTokenIdentity | None = (
+            self._jwt_access_token_processor.extract_stateless_identity(access_token)
+        )
+
+        return identity
@@ -1,12 +1,32 @@
 from datetime import datetime, timedelta
+from typing import Sequence
 
 from auth.domain.user.value_objects import UserId
 from auth.infrastructure.persistence.sqla.committer import SqlaCommitter
-from auth.infrastructure.record_session import SessionRecord
-from auth.infrastructure.session.errors import SessionExpired, SessionNotFoundById
+from auth.infrastructure.record_session import SessionIdentityRecord, SessionRecord
+from auth.infrastructure.session.access_token_processor_jwt import (
+    AccessTokenIdentity,
+)
+from auth.infrastructure.session.bulk_revoker_sqla import SqlaSessionBulkRevoker
+from auth.infrastructure.session.cache_memory import InMemorySessionCache
+from auth.infrastructure.session.context_request import RequestIdentityContext
+from auth.infrastructure.session.errors import (
+    SessionExpired,
+    SessionNotFoundById,
+    SessionRevocationUnsupported,
+)
 from auth.infrastructure.session.services.jwt_token import JwtTokenService
-from auth.infrastructure.session.data_mapper_sqla import SqlaSessionDataMapper
 from auth.infrastructure.session.id_generator_str import StrSessionIdGenerator
+from auth.infrastructure.session.ports.session_data_gateway import (
+    SessionDataGateway,
+)
+from auth.infrastructure.session.ports.session_identity_reader import (
+    SessionIdentityReader,
+)
+from auth.infrastructure.session.prolongation_coalescer_sqla import (
+    SqlaSessionProlongationCoalescer,
+)
+from auth.infrastructure.session.revocation_list_memory import InMemoryRevocationList
 from auth.infrastructure.session.timer_utc import UtcSessionTimer
 
 
@@ -15,15 +35,27 @@ class SessionService:
         self,
         str_session_id_generator: StrSessionIdGenerator,
         utc_session_timer: UtcSessionTimer,
-        sqla_session_data_mapper: SqlaSessionDataMapper,
+        session_data_gateway: SessionDataGateway,
         sqla_committer: SqlaCommitter,
         jwt_token_service: JwtTokenService,
+        in_memory_session_cache: InMemorySessionCache,
+        in_memory_revocation_list: InMemoryRevocationList,
+        request_identity_context: RequestIdentityContext,
+        session_prolongation_coalescer: SqlaSessionProlongationCoalescer,
+        session_bulk_revoker: SqlaSessionBulkRevoker,
+        session_identity_reader: SessionIdentityReader,
     ):
         self._str_session_id_generator = str_session_id_generator
         self._utc_session_timer = utc_session_timer
-        self._sqla_session_data_mapper = sqla_session_data_mapper
+        self._session_data_gateway = session_data_gateway
         self._sqla_committer = sqla_committer
         self._jwt_token_service = jwt_token_service
+        self._in_memory_session_cache = in_memory_session_cache
+        self._in_memory_revocation_list = in_memory_revocation_list
+        self._request_identity_context = request_identity_context
+        self._session_prolongation_coalescer = session_prolongation_coalescer
+        self._session_bulk_revoker = session_bulk_revoker
+        self._session_identity_reader = session_identity_reader
 
     async def create_session(self, user_id: UserId) -> SessionRecord:
 
@@ -41,7 +73,7 @@ class SessionService:
         """
         :raises DataGatewayError:
         """
-        await self._sqla_session_data_mapper.save(session_record)
+        await self._session_data_gateway.save(session_record)
 
         await self._sqla_committer.commit()
 
@@ -53,21 +85,78 @@ class SessionService:
         :raises SessionNotFoundById:
         """
 
-        session: SessionRecord | None = await self._sqla_session_data_mapper.read(
+        session: SessionRecord | None = await self._session_data_gateway.read(
             session_id, for_update=for_update
         )
         if session is None:
             raise SessionNotFoundById(session_id)
 
+        return self._apply_pending_expiration(session)
+
+    async def get_session_identity(self, session_id: str) -> SessionIdentityRecord:
+        """
+        The session along with its user's roles, in one read where the store
+        allows it.
+
+        :raises DataGatewayError:
+        :raises SessionNotFoundById:
+        """
+
+        identity: SessionIdentityRecord | None = (
+            await self._session_identity_reader.read(session_id)
+        )
+        if identity is None:
+            raise SessionNotFoundById(session_id)
+
+        session: SessionRecord = self._apply_pending_expiration(identity.session)
+        if session is identity.session:
+            return identity
+
+        return SessionIdentityRecord(
+            session=session,
+            roles=identity.roles,
+            is_active=identity.is_active,
+        )
+
+    def _apply_pending_expiration(self, session: SessionRecord) -> SessionRecord:
+
+        pending_expiration: datetime | None = (
+            self._session_prolongation_coalescer.get_pending_expiration(session.id_)
+        )
+        if pending_expiration is not None and pending_expiration > session.expiration:
+            # detached copy: changing the loaded record would write it back
+            return SessionRecord(
+                id_=session.id_,
+                user_id=session.user_id,
+                expiration=pending_expiration,
+            )
+
         return session
 
+    def get_cached_session(self, session_id: str) -> SessionRecord | None:
+
+        return self._in_memory_session_cache.get(session_id)
+
+    def cache_session(self, session: SessionRecord) -> None:
+
+        self._in_memory_session_cache.put(session)
+
+    def is_access_token_revoked(self, identity: AccessTokenIdentity) -> bool:
+
+        return self._in_memory_revocation_list.is_revoked(identity)
+
     async def get_current_session(self) -> SessionRecord:
         """
+        Reuses the session already authenticated during this request, if any.
+
         :raises AdapterError:
         :raises DataGatewayError:
         :raises SessionNotFoundById:
         """
 
+        if self._request_identity_context.session is not None:
+            return self._request_identity_context.session
+
         access_token: str = self._jwt_token_service.get_access_token_from_request()
         session_id: str = self._jwt_token_service.get_session_id_from_access_token(
             access_token
@@ -95,23 +184,106 @@ class SessionService:
 
     async def prolong_session(self, session: SessionRecord) -> None:
         """
+        With the prolongation coalescer enabled, the write is deferred
+        and the prolonged session is served from the cache meanwhile.
+
         :raises DataGatewayError:
         """
 
-        new_expiration: datetime = self._utc_session_timer.access_expiration
-        session.expiration = new_expiration
+        if self._session_prolongation_coalescer.is_enabled:
+            new_expiration: datetime = self._utc_session_timer.access_expiration
+            self._session_prolongation_coalescer.enqueue(session.id_, new_expiration)
+            self._in_memory_session_cache.put(
+                SessionRecord(
+                    id_=session.id_,
+                    user_id=session.user_id,
+                    expiration=new_expiration,
+                )
+            )
+            return
 
-        await self._sqla_session_data_mapper.save(session)
+        await self._session_data_gateway.prolong(
+            session,
+            new_expiration=self._utc_session_timer.access_expiration,
+            refresh_boundary=self._utc_session_timer.refresh_boundary,
+        )
 
         await self._sqla_committer.commit()
 
+        self._in_memory_session_cache.invalidate(session.id_)
+
     async def delete_session(self, session_id: str) -> None:
         """
         :raises DataGatewayError:
         :raises SessionNotFoundById:
         """
 
-        if not await self._sqla_session_data_mapper.delete(session_id):
+        self._in_memory_session_cache.invalidate(session_id)
+        self._in_memory_revocation_list.revoke_session(session_id)
+        self._session_prolongation_coalescer.discard(session_id)
+        current_session: SessionRecord | None = self._request_identity_context.session
+        if current_session is not None and current_session.id_ == session_id:
+            self._request_identity_context.session = None
+
+        if not await self._session_data_gateway.delete(session_id):
             raise SessionNotFoundById(session_id)
 
         await self._sqla_committer.commit()
+
+    async def delete_all_sessions_for_user(self, user_id: UserId) -> None:
+        """
+        :raises DataGatewayError:
+        """
+
+        self._in_memory_session_cache.invalidate_user(user_id)
+        self._in_memory_revocation_list.revoke_user(user_id)
+        current_session: SessionRecord | None = self._request_identity_context.session
+        if current_session is not None and current_session.user_id == user_id:
+            self._request_identity_context.session = None
+
+        await self._session_data_gateway.delete_all_for_user(user_id)
+
+        await self._sqla_committer.commit()
+
+    async def revoke_sessions_for_users(self, user_ids: Sequence[UserId]) -> None:
+        """
+        In-process caches are invalidated before the deletes,
+        so a request of this process never sees a session being revoked.
+
+        :raises DataGatewayError:
+        """
+
+        for user_id in user_ids:
+            self._in_memory_session_cache.invalidate_user(user_id)
+            self._in_memory_revocation_list.revoke_user(user_id)
+        current_session: SessionRecord | None = self._request_identity_context.session
+        if current_session is not None and current_session.user_id in user_ids:
+            self._request_identity_context.session = None
+
+        if self._session_bulk_revoker.is_enabled:
+            await self._session_bulk_revoker.revoke_for_users(user_ids)
+            return
+
+        for user_id in user_ids:
+            await self._session_data_gateway.delete_all_for_user(user_id)
+        await self._sqla_committer.commit()
+
+    async def revoke_sessions_created_before(self, cutoff: datetime) -> None:
+        """
+        Cached sessions do not carry their creation time,
+        so the whole in-process cache is dropped.
+
+        :raises DataGatewayError:
+        :raises SessionRevocationUnsupported:
+        """
+
+        if not self._session_bulk_revoker.is_enabled:
+            raise SessionRevocationUnsupported(
+                "Revocation by creation time requires the SQL session store."
+            )
+
+        self._in_memory_session_cache.clear()
+        self._in_memory_revocation_list.revoke_all()
+        self._request_identity_context.session = None
+
+        await self._session_bulk_revoker.revoke_created_before(cutoff)
@@ -26,3 +26,7 @@ class UtcSessionTimer:
     @property
     def refresh_trigger_interval(self) -> timedelta:
         return self._session_ttl_min * self._session_refresh_threshold
+
+    @property
+    def refresh_boundary(self) -> datetime:
+        return self.current_time + self.refresh_trigger_interval
@@ -0,0 +1,59 @@
+import hashlib
+import time
+from typing import Any
+
+from auth.infrastructure.cache_ttl_lru import TtlLruCache
+from auth.infrastructure.custom_types import (
+    JwtAccessTokenTtlMin,
+    JwtDecodeCacheMaxEntries,
+)
+
+
+class InMemoryDecodedTokenCache:
+    """
+    Process-local cache of verified access token payloads, keyed by the
+    SHA-256 digest of the token, so raw tokens are never kept in memory.
+    Entries never outlive the token `exp` claim.
+    Payloads are shared between requests and must not be mutated.
+    """
+
+    def __init__(
+        self,
+        max_entries: JwtDecodeCacheMaxEntries,
+        access_token_ttl: JwtAccessTokenTtlMin,
+    ):
+        self._payloads: TtlLruCache[bytes, dict[str, Any]] = TtlLruCache(
+            max_entries=max_entries,
+            ttl_s=access_token_ttl.total_seconds(),
+        )
+
+    @property
+    def hits(self) -> int:
+        return self._payloads.hits
+
+    @property
+    def misses(self) -> int:
+        return self._payloads.misses
+
+    def get(self, token: str) -> dict[str, Any] | None:
+        if not self._payloads.is_enabled:
+            return None
+
+        return self._payloads.get(self._digest(token))
+
+    def put(self, token: str, payload: dict[str, Any]) -> None:
+        """
+        Tokens without a numeric `exp` claim are not cached.
+        """
+        if not self._payloads.is_enabled:
+            return
+
+        exp: Any = payload.get("exp")
+        if not isinstance(exp, (int, float)):
+            return
+
+        self._payloads.put(self._digest(token), payload, ttl_s=exp - time.time())
+
+    @staticmethod
+    def _digest(token: str) -> bytes:
+        return hashlib.sha256(token.encode()).digest()
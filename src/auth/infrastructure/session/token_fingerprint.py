@@ -0,0 +1,18 @@
+import hashlib
+
+
+class TokenFingerprint:
+    """
+    Loggable stand-in for a credential: renders as a short SHA-256 prefix,
+    computed only if the log record is actually formatted.
+    """
+
+    __slots__ = ("_token",)
+
+    def __init__(self, token: str):
+        self._token = token
+
+    def __str__(self) -> str:
+        return hashlib.sha256(self._token.encode()).hexdigest()[:12]
+
+    __repr__ = __str__
@@ -0,0 +1,194 @@
+# pylint: disable=C0301 (line-too-long)
+
+import base64
+import hashlib
+import hmac
+
+import bcrypt
+
+from auth.domain.user.ports.password_hasher import PasswordHasher
+from auth.domain.user.value_objects import RawPassword
+from auth.infrastructure.custom_types import (
+    DummyPasswordHash,
+    PasswordHashScheme,
+    PasswordPepper,
+)
+from auth.infrastructure.user.password_hash_policy import PasswordHashPolicy
+from auth.infrastructure.user.password_hasher_pool import PasswordHasherPool
+
+BCRYPT_PREFIXES: tuple[bytes, ...] = (b"$2a$", b"$2b$", b"$2y$")
+ARGON2ID_PREFIX: bytes = b"$argon2id$"
+DUMMY_PASSWORD: str = "dummy-password"
+
+
+def argon2_hash(
+    password: bytes, time_cost: int, memory_cost_kib: int, parallelism: int
+) -> bytes:
+    """
+    Module-level, like the other hashing functions, to be picklable
+    by a process pool. Requires the optional `argon2-cffi` package.
+    """
+    from argon2 import PasswordHasher as Argon2Hasher
+
+    return (
+        Argon2Hasher(
+            time_cost=time_cost,
+            memory_cost=memory_cost_kib,
+            parallelism=parallelism,
+        )
+        .hash(password)
+        .encode()
+    )
+
+
+def argon2_verify(password: bytes, hashed_password: bytes) -> bool:
+    """
+    Requires the optional `argon2-cffi` package.
+    """
+    from argon2 import PasswordHasher as Argon2Hasher
+    from argon2.exceptions import InvalidHashError, VerificationError
+
+    try:
+        return Argon2Hasher().verify(hashed_password, password)
+    except (VerificationError, InvalidHashError):
+        return False
+
+
+def _add_pepper(raw_password: RawPassword, pepper: str) -> bytes:
+    hmac_password: bytes = hmac.new(
+        key=pepper.encode(),
+        msg=raw_password.value.encode(),
+        digestmod=hashlib.sha256,
+    ).digest()
+    return base64.b64encode(hmac_password)
+
+
+def _hash_with_policy(
+    raw_password: RawPassword, pepper: str, policy: PasswordHashPolicy
+) -> bytes:
+    base64_hmac_password: bytes = _add_pepper(raw_password, pepper)
+    if policy.scheme == "argon2id":
+        return argon2_hash(
+            base64_hmac_password,
+            policy.argon2_time_cost,
+            policy.argon2_memory_cost_kib,
+            policy.argon2_parallelism,
+        )
+    return bcrypt.hashpw(
+        base64_hmac_password, bcrypt.gensalt(rounds=policy.bcrypt_rounds)
+    )
+
+
+def hash_passwords(
+    raw_passwords: list[str], pepper: str, policy: PasswordHashPolicy
+) -> list[bytes]:
+    """
+    Hashes a whole batch in one job, the way `MultiSchemePasswordHasher.hash`
+    hashes a single password: one process pool round trip per batch
+    instead of per password.
+    """
+    return [
+        _hash_with_policy(RawPassword(raw_password), pepper, policy)
+        for raw_password in raw_passwords
+    ]
+
+
+class MultiSchemePasswordHasher(PasswordHasher):
+    """
+    Hashes with the scheme and cost of the current policy, and verifies
+    any supported scheme, identified by the prefix of the stored hash:
+    bcrypt (`$2a$`, `$2b$`, `$2y$`) and argon2id (`$argon2id$`).
+    """
+
+    def __init__(
+        self,
+        pepper: PasswordPepper,
+        password_hasher_pool: PasswordHasherPool,
+        password_hash_policy: PasswordHashPolicy,
+        dummy_password_hash: DummyPasswordHash,
+    ):
+        self._pepper = pepper
+        self._password_hasher_pool = password_hasher_pool
+        self._password_hash_policy = password_hash_policy
+        self._dummy_password_hash = dummy_password_hash
+
+    async def hash(self, raw_password: RawPassword) -> bytes:
+        """
+        Bcrypt is limited to 72-character passwords. Adding a pepper may surpass this character count.
+        To keep the input within the 72-character limit, pre-hashing can be employed.
+        One option is using HMAC-SHA256, which produces a fixed-length digest of the peppered password.
+        However, pre-hashing may introduce null bytes, which `bcrypt` cannot process correctly.
+        This issue can be resolved by applying `base64` encoding to the digest.
+        The resulting `base64(hmac-sha256(password, pepper))` string is then ready for bcrypt hashing.
+        Salt is added to this string before passing it to `bcrypt` for the final hashing step.
+        Argon2id gets the same peppered input, so both schemes share one pepper handling.
+        Hashing itself runs in the password hasher pool to keep the event loop free.
+
+        :raises PasswordHasherBusy:
+        """
+        return await self._password_hasher_pool.run(
+            _hash_with_policy,
+            raw_password,
+            self._pepper,
+            self._password_hash_policy,
+        )
+
+    async def verify(
+        self, *, raw_password: RawPassword, hashed_password: bytes
+    ) -> bool:
+        """
+        Hashes of an unknown scheme never verify.
+
+        :raises PasswordHasherBusy:
+        """
+        scheme: PasswordHashScheme | None = self._identify_scheme(hashed_password)
+        if scheme is None:
+            return False
+
+        base64_hmac_password: bytes = _add_pepper(raw_password, self._pepper)
+        if scheme == "argon2id":
+            return await self._password_hasher_pool.run_verification(
+                argon2_verify, base64_hmac_password, hashed_password
+            )
+        return await self._password_hasher_pool.run_verification(
+            bcrypt.checkpw, base64_hmac_password, hashed_password
+        )
+
+    async def verify_dummy(self, *, raw_password: RawPassword) -> bool:
+        """
+        The dummy hash is made once at startup with the current policy,
+        so this costs exactly one verification.
+
+        :raises PasswordHasherBusy:
+        """
+        await self.verify(
+            raw_password=raw_password, hashed_password=self._dummy_password_hash
+        )
+        return False
+
+    def needs_rehash(self, hashed_password: bytes) -> bool:
+        policy: PasswordHashPolicy = self._password_hash_policy
+        scheme: PasswordHashScheme | None = self._identify_scheme(hashed_password)
+
+        if scheme != policy.scheme:
+            return True
+
+        if scheme == "bcrypt":
+            # `$2b$12$...`: the cost factor follows the scheme prefix
+            return int(hashed_password[4:6]) != policy.bcrypt_rounds
+
+        from argon2 import PasswordHasher as Argon2Hasher
+
+        return Argon2Hasher(
+            time_cost=policy.argon2_time_cost,
+            memory_cost=policy.argon2_memory_cost_kib,
+            parallelism=policy.argon2_parallelism,
+        ).check_needs_rehash(hashed_password.decode())
+
+    @staticmethod
+    def _identify_scheme(hashed_password: bytes) -> PasswordHashScheme | None:
+        if hashed_password.startswith(BCRYPT_PREFIXES):
+            return "bcrypt"
+        if hashed_password.startswith(ARGON2ID_PREFIX):
+            return "argon2id"
+        return None
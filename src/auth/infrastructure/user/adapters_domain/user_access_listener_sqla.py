@@ -0,0 +1,47 @@
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from auth.domain.user.ports.user_access_listener import UserAccessListener
+from auth.domain.user.value_objects import UserId
+from auth.infrastructure.session.revocation_list_memory import InMemoryRevocationList
+from auth.infrastructure.user.role_cache_memory import InMemoryUserRoleCache
+
+
+class SqlaUserAccessListener(UserAccessListener):
+    """
+    Drops the cached roles of a changed user right away, and again once
+    the request's transaction commits: in between, a concurrent request
+    may have cached the roles still committed.
+    Once committed, the user's stateless tokens are revoked as well, as they
+    carry the former roles: the next request takes the stateful path and
+    gets a token with the new ones, or none for a deactivated user.
+    """
+
+    def __init__(
+        self,
+        session: AsyncSession,
+        in_memory_user_role_cache: InMemoryUserRoleCache,
+        in_memory_revocation_list: InMemoryRevocationList,
+    ):
+        self._session = session
+        self._in_memory_user_role_cache = in_memory_user_role_cache
+        self._in_memory_revocation_list = in_memory_revocation_list
+        self._changed_user_ids: set[UserId] = set()
+        self._is_listening: bool = False
+
+    def on_access_changed(self, user_id: UserId) -> None:
+        self._in_memory_user_role_cache.invalidate(user_id)
+        self._changed_user_ids.add(user_id)
+
+        if not self._is_listening:
+            event.listen(self._session.sync_session, "after_commit", self._on_commit)
+            self._is_listening = True
+
+    def _on_commit(self, _: Session) -> None:
+        for user_id in self._changed_user_ids:
+            self._in_memory_user_role_cache.invalidate(user_id)
+            # not before the commit: a token renewed in between would carry
+            # the former roles and be issued after the revocation
+            self._in_memory_revocation_list.revoke_user(user_id)
+        self._changed_user_ids.clear()
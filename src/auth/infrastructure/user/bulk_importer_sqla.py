@@ -0,0 +1,289 @@
+import asyncio
+import logging
+import time
+from dataclasses import dataclass
+from typing import Iterable
+from uuid import UUID
+
+import psycopg
+from sqlalchemy import (
+    UUID as SqlaUUID,
+    Column,
+    LargeBinary,
+    MetaData,
+    String,
+    Table,
+    select,
+)
+from sqlalchemy.dialects.postgresql import Insert, insert
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncSession, async_sessionmaker
+
+from auth.application.errors import DataGatewayError
+from auth.domain.base.errors import DomainFieldError
+from auth.domain.user.ports.user_id_generator import UserIdGenerator
+from auth.domain.user.validation.constants import USERNAME_MAX_LEN
+from auth.domain.user.value_objects import RawPassword, Username
+from auth.infrastructure.custom_types import PasswordPepper
+from auth.infrastructure.user.adapters_domain.password_hasher_multi_scheme import (
+    ARGON2ID_PREFIX,
+    BCRYPT_PREFIXES,
+    hash_passwords,
+)
+from auth.infrastructure.user.import_records import UserImportRecord
+from auth.infrastructure.user.password_hash_policy import PasswordHashPolicy
+from auth.infrastructure.user.password_hasher_pool import PasswordHasherPool
+from auth.infrastructure.user.persistence_sqla import users_table
+
+log = logging.getLogger(__name__)
+
+# per transaction, dropped on commit
+users_import_table = Table(
+    "users_import",
+    MetaData(),
+    Column("id", SqlaUUID(as_uuid=True), nullable=False),
+    Column("username", String(USERNAME_MAX_LEN), nullable=False),
+    Column("password_hash", LargeBinary, nullable=False),
+    prefixes=["TEMPORARY"],
+    postgresql_on_commit="DROP",
+)
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class UserImportReport:
+    read: int
+    imported: int
+    duplicates: int
+    already_existing: int
+    rejected: int
+    elapsed_s: float
+
+    @property
+    def records_per_s(self) -> float:
+        return self.read / self.elapsed_s if self.elapsed_s else 0.0
+
+
+@dataclass(slots=True, kw_only=True)
+class _ImportBatch:
+    usernames: list[str]
+    raw_passwords: list[str]
+    password_hashes: list[bytes]
+    # usernames whose hash is computed from `raw_passwords`, in the same order
+    usernames_to_hash: list[str]
+
+    def __len__(self) -> int:
+        return len(self.usernames) + len(self.usernames_to_hash)
+
+
+class SqlaUserBulkImporter:
+    """
+    Imports users in batches of `batch_size` records.
+    - Records are validated like on signup, usernames repeated within
+      the import are dropped after their first occurrence.
+    - Raw passwords are hashed with the current policy, split into one job
+      per pool worker; supported pre-hashed values are stored as they are.
+    - Each batch is `COPY`-ed into a temporary table and moved to `users`
+      in the same transaction, skipping usernames that already exist.
+    - The next batch is read and hashed while the previous one is loaded.
+    Imported users get the default roles and are active.
+    """
+
+    def __init__(
+        self,
+        session_maker: async_sessionmaker[AsyncSession],
+        password_hasher_pool: PasswordHasherPool,
+        pepper: PasswordPepper,
+        password_hash_policy: PasswordHashPolicy,
+        user_id_generator: UserIdGenerator,
+        *,
+        batch_size: int,
+    ):
+        self._session_maker = session_maker
+        self._password_hasher_pool = password_hasher_pool
+        self._pepper = pepper
+        self._password_hash_policy = password_hash_policy
+        self._user_id_generator = user_id_generator
+        self._batch_size = batch_size
+
+    async def import_records(
+        self, records: Iterable[UserImportRecord]
+    ) -> UserImportReport:
+        """
+        Batches already loaded stay imported if a later one fails.
+
+        :raises DataGatewayError:
+        :raises PasswordHasherBusy:
+        :raises UserImportFormatError:
+        """
+        started_at: float = time.perf_counter()
+        seen_usernames: set[str] = set()
+        read: int = 0
+        imported: int = 0
+        loaded: int = 0
+        duplicates: int = 0
+        rejected: int = 0
+        load_task: asyncio.Task[int] | None = None
+
+        try:
+            batch: _ImportBatch = self._new_batch()
+            for record in records:
+                read += 1
+                if record.username in seen_usernames:
+                    duplicates += 1
+                    continue
+                if not self._add_record(batch, record):
+                    rejected += 1
+                    continue
+                seen_usernames.add(record.username)
+
+                if len(batch) < self._batch_size:
+                    continue
+
+                rows: list[tuple[UUID, str, bytes]] = await self._prepare_rows(batch)
+                if load_task is not None:
+                    imported += await load_task
+                load_task = asyncio.create_task(self._load_rows(rows))
+                loaded += len(rows)
+                log.info(
+                    "User import: %d records read, %.0f records/s.",
+                    read,
+                    read / (time.perf_counter() - started_at),
+                )
+                batch = self._new_batch()
+
+            rows = await self._prepare_rows(batch)
+            if load_task is not None:
+                imported += await load_task
+                load_task = None
+            if rows:
+                imported += await self._load_rows(rows)
+                loaded += len(rows)
+
+        finally:
+            if load_task is not None and not load_task.done():
+                load_task.cancel()
+
+        report = UserImportReport(
+            read=read,
+            imported=imported,
+            duplicates=duplicates,
+            already_existing=loaded - imported,
+            rejected=rejected,
+            elapsed_s=time.perf_counter() - started_at,
+        )
+        log.info(
+            "User import done: %d read, %d imported, %d duplicates, "
+            "%d already existing, %d rejected, %.3f s, %.0f records/s.",
+            report.read,
+            report.imported,
+            report.duplicates,
+            report.already_existing,
+            report.rejected,
+            report.elapsed_s,
+            report.records_per_s,
+        )
+        return report
+
+    @staticmethod
+    def _new_batch() -> _ImportBatch:
+        return _ImportBatch(
+            usernames=[],
+            raw_passwords=[],
+            password_hashes=[],
+            usernames_to_hash=[],
+        )
+
+    @staticmethod
+    def _add_record(batch: _ImportBatch, record: UserImportRecord) -> bool:
+        try:
+            Username(record.username)
+            if record.password_hash is not None:
+                password_hash: bytes = record.password_hash.encode()
+                if not password_hash.startswith((*BCRYPT_PREFIXES, ARGON2ID_PREFIX)):
+                    raise DomainFieldError("Unsupported password hash scheme.")
+                batch.usernames.append(record.username)
+                batch.password_hashes.append(password_hash)
+                return True
+            RawPassword(record.password or "")
+
+        except DomainFieldError as error:
+            log.warning("User import: line %d rejected: %s", record.line, error)
+            return False
+
+        batch.usernames_to_hash.append(record.username)
+        batch.raw_passwords.append(record.password or "")
+        return True
+
+    async def _prepare_rows(
+        self, batch: _ImportBatch
+    ) -> list[tuple[UUID, str, bytes]]:
+        """
+        :raises PasswordHasherBusy:
+        """
+        jobs_count: int = self._password_hasher_pool.metrics.max_workers
+        chunk_size: int = -(-len(batch.raw_passwords) // jobs_count) or 1
+        hashed_chunks: list[list[bytes]] = await asyncio.gather(
+            *(
+                self._password_hasher_pool.run(
+                    hash_passwords,
+                    batch.raw_passwords[chunk_start : chunk_start + chunk_size],
+                    self._pepper,
+                    self._password_hash_policy,
+                )
+                for chunk_start in range(0, len(batch.raw_passwords), chunk_size)
+            )
+        )
+
+        usernames: list[str] = batch.usernames + batch.usernames_to_hash
+        password_hashes: list[bytes] = batch.password_hashes + [
+            password_hash for chunk in hashed_chunks for password_hash in chunk
+        ]
+        return [
+            (self._user_id_generator(), username, password_hash)
+            for username, password_hash in zip(usernames, password_hashes)
+        ]
+
+    async def _load_rows(self, rows: list[tuple[UUID, str, bytes]]) -> int:
+        """
+        :raises DataGatewayError:
+        """
+        insert_stmt: Insert = insert(users_table).from_select(
+            ["id", "username", "password_hash"],
+            select(
+                users_import_table.c.id,
+                users_import_table.c.username,
+                users_import_table.c.password_hash,
+            ),
+        )
+        insert_stmt = insert_stmt.on_conflict_do_nothing(
+            index_elements=[users_table.c.username]
+        )
+
+        try:
+            async with self._session_maker() as session:
+                connection: AsyncConnection = await session.connection()
+                await connection.run_sync(users_import_table.create)
+                await self._copy_rows(connection, rows)
+                result = await session.execute(insert_stmt)
+                await session.commit()
+
+        except (OSError, psycopg.OperationalError) as error:
+            raise DataGatewayError("Connection failed.") from error
+        except (SQLAlchemyError, psycopg.Error) as error:
+            raise DataGatewayError("Database query failed.") from error
+
+        return int(result.rowcount)  # type: ignore[attr-defined]
+
+    @staticmethod
+    async def _copy_rows(
+        connection: AsyncConnection, rows: list[tuple[UUID, str, bytes]]
+    ) -> None:
+        # `COPY` is driver-specific: psycopg, as in the configured DSN
+        raw_connection = await connection.get_raw_connection()
+        driver_connection: psycopg.AsyncConnection = raw_connection.driver_connection
+        async with driver_connection.cursor() as cursor:
+            async with cursor.copy(
+                "COPY users_import (id, username, password_hash) FROM STDIN"
+            ) as copy:
+                for row in rows:
+                    await copy.write_row(row)
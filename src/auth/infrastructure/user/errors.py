@@ -0,0 +1,15 @@
+from auth.infrastructure.base.errors import InfrastructureError
+
+
+class PasswordHasherBusy(InfrastructureError):
+    def __init__(self, pool_name: str):
+        message: str = (
+            f"Password hasher pool '{pool_name}' is saturated. Try again later."
+        )
+        super().__init__(message)
+
+
+class UserImportFormatError(InfrastructureError):
+    def __init__(self, line: int, reason: str):
+        message: str = f"Malformed user import record at line {line}: {reason}"
+        super().__init__(message)
@@ -0,0 +1,57 @@
+import csv
+import json
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Iterator
+
+from auth.infrastructure.custom_types import UserImportFormat
+from auth.infrastructure.user.errors import UserImportFormatError
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class UserImportRecord:
+    """
+    Either `password` or an already computed `password_hash` is expected.
+    """
+
+    line: int
+    username: str
+    password: str | None = None
+    password_hash: str | None = None
+
+
+def read_user_import_records(
+    path: Path, file_format: UserImportFormat
+) -> Iterator[UserImportRecord]:
+    """
+    Streams the file record by record: CSV with a header row, or NDJSON,
+    both with `username` and `password` or `password_hash` fields.
+
+    :raises UserImportFormatError:
+    """
+    with path.open(newline="", encoding="utf-8") as file:
+        if file_format == "csv":
+            # the header is line 1
+            for line, row in enumerate(csv.DictReader(file), start=2):
+                yield _to_record(line, row)
+            return
+
+        for line, text in enumerate(file, start=1):
+            if not text.strip():
+                continue
+            try:
+                row: Any = json.loads(text)
+            except json.JSONDecodeError as error:
+                raise UserImportFormatError(line, error.msg) from error
+            if not isinstance(row, dict):
+                raise UserImportFormatError(line, "expected a JSON object.")
+            yield _to_record(line, row)
+
+
+def _to_record(line: int, row: dict[str, Any]) -> UserImportRecord:
+    return UserImportRecord(
+        line=line,
+        username=str(row.get("username") or ""),
+        password=row.get("password") or None,
+        password_hash=row.get("password_hash") or None,
+    )
@@ -0,0 +1,18 @@
+from dataclasses import dataclass
+
+from auth.infrastructure.custom_types import PasswordHashScheme
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class PasswordHashPolicy:
+    """
+    Scheme and cost parameters for new password hashes.
+    Stored hashes made with anything else still verify,
+    and are upgraded on the next successful login.
+    """
+
+    scheme: PasswordHashScheme
+    bcrypt_rounds: int
+    argon2_time_cost: int
+    argon2_memory_cost_kib: int
+    argon2_parallelism: int
@@ -0,0 +1,168 @@
+import asyncio
+import logging
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass
+from functools import partial
+from typing import Any, Callable, TypeVar
+
+from auth.infrastructure.custom_types import PasswordHasherPoolKind
+from auth.infrastructure.user.errors import PasswordHasherBusy
+
+log = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class PasswordHasherPoolMetrics:
+    name: str
+    kind: PasswordHasherPoolKind
+    max_workers: int
+    queue_size: int
+    in_flight: int
+    verifications_in_flight: int
+    queued: int
+    peak_in_flight: int
+    submitted: int
+    completed: int
+    failed: int
+    rejected: int
+    total_latency_s: float
+
+
+class PasswordHasherPool:
+    """
+    Runs CPU-bound password hashing outside the event loop.
+    - At most `max_workers` jobs run at once, up to `queue_size` more may wait.
+    - Any job beyond that is rejected immediately instead of being queued,
+      so a burst of logins fails fast rather than stalling other requests.
+    - Verifications can be capped further with `max_verifications`
+      (0 disables the cap), keeping CPU and pool slots for signups
+      and for authenticated traffic during a login flood.
+    """
+
+    def __init__(
+        self,
+        *,
+        name: str,
+        kind: PasswordHasherPoolKind,
+        max_workers: int,
+        queue_size: int,
+        max_verifications: int = 0,
+    ):
+        self._name = name
+        self._kind = kind
+        self._max_workers = max_workers
+        self._queue_size = queue_size
+        self._max_verifications = max_verifications
+        self._executor: Executor = (
+            ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix=name)
+            if kind == "thread"
+            else ProcessPoolExecutor(max_workers=max_workers)
+        )
+
+        self._in_flight: int = 0
+        self._verifications_in_flight: int = 0
+        self._peak_in_flight: int = 0
+        self._submitted: int = 0
+        self._completed: int = 0
+        self._failed: int = 0
+        self._rejected: int = 0
+        self._total_latency_s: float = 0.0
+
+    @property
+    def capacity(self) -> int:
+        return self._max_workers + self._queue_size
+
+    @property
+    def metrics(self) -> PasswordHasherPoolMetrics:
+        return PasswordHasherPoolMetrics(
+            name=self._name,
+            kind=self._kind,
+            max_workers=self._max_workers,
+            queue_size=self._queue_size,
+            in_flight=self._in_flight,
+            verifications_in_flight=self._verifications_in_flight,
+            queued=max(0, self._in_flight - self._max_workers),
+            peak_in_flight=self._peak_in_flight,
+            submitted=self._submitted,
+            completed=self._completed,
+            failed=self._failed,
+            rejected=self._rejected,
+            total_latency_s=self._total_latency_s,
+        )
+
+    async def run(self, func: Callable[..., T], *args: Any) -> T:
+        """
+        A job stays counted until it has finished in the executor,
+        even if the awaiting request is cancelled meanwhile.
+
+        :raises PasswordHasherBusy:
+        """
+        self._check_capacity()
+        return await asyncio.shield(self._submit(func, *args))
+
+    async def run_verification(self, func: Callable[..., T], *args: Any) -> T:
+        """
+        :raises PasswordHasherBusy:
+        """
+        if (
+            self._max_verifications
+            and self._verifications_in_flight >= self._max_verifications
+        ):
+            self._rejected += 1
+            log.warning(
+                "Password hasher pool '%s' verification cap reached (%d in flight).",
+                self._name,
+                self._verifications_in_flight,
+            )
+            raise PasswordHasherBusy(self._name)
+        self._check_capacity()
+
+        self._verifications_in_flight += 1
+        future: asyncio.Future[T] = self._submit(func, *args)
+        future.add_done_callback(self._on_verification_done)
+        return await asyncio.shield(future)
+
+    def _check_capacity(self) -> None:
+        """
+        :raises PasswordHasherBusy:
+        """
+        if self._in_flight >= self.capacity:
+            self._rejected += 1
+            log.warning(
+                "Password hasher pool '%s' is saturated (%d in flight).",
+                self._name,
+                self._in_flight,
+            )
+            raise PasswordHasherBusy(self._name)
+
+    def _submit(self, func: Callable[..., T], *args: Any) -> asyncio.Future[T]:
+        self._in_flight += 1
+        self._submitted += 1
+        self._peak_in_flight = max(self._peak_in_flight, self._in_flight)
+
+        future: asyncio.Future[T] = asyncio.get_running_loop().run_in_executor(
+            self._executor, func, *args
+        )
+        future.add_done_callback(partial(self._on_job_done, time.perf_counter()))
+        return future
+
+    def _on_job_done(self, started_at: float, future: asyncio.Future[Any]) -> None:
+        self._in_flight -= 1
+        self._total_latency_s += time.perf_counter() - started_at
+        # also retrieves the error of a job nobody awaits anymore
+        if future.cancelled() or future.exception() is not None:
+            self._failed += 1
+        else:
+            self._completed += 1
+
+    def _on_verification_done(self, _: asyncio.Future[Any]) -> None:
+        self._verifications_in_flight -= 1
+
+    def shutdown(self) -> None:
+        log.debug(
+            "Shutting down password hasher pool '%s': %s", self._name, self.metrics
+        )
+        self._executor.shutdown(wait=False, cancel_futures=True)
@@ -0,0 +1,70 @@
+import asyncio
+import logging
+from typing import Any, Coroutine
+
+from sqlalchemy import Update, update
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from auth.domain.user.value_objects import UserId, UserPasswordHash
+from auth.infrastructure.base.errors import InfrastructureError
+from auth.infrastructure.user.persistence_sqla import users_table
+
+log = logging.getLogger(__name__)
+
+
+class PasswordRehashScheduler:
+    """
+    Stores upgraded password hashes in the background, after the login
+    that verified the password has already been answered.
+    - The new hash only replaces the one it was computed from, so a password
+      changed in the meantime is never overwritten.
+    - A failed upgrade is only logged: it is retried on the next login.
+    """
+
+    def __init__(self, session_maker: async_sessionmaker[AsyncSession]):
+        self._session_maker = session_maker
+        self._tasks: set[asyncio.Task[None]] = set()
+
+    def schedule(
+        self,
+        user_id: UserId,
+        old_password_hash: UserPasswordHash,
+        new_password_hash: Coroutine[Any, Any, UserPasswordHash],
+    ) -> None:
+        task: asyncio.Task[None] = asyncio.create_task(
+            self._rehash(user_id, old_password_hash, new_password_hash)
+        )
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _rehash(
+        self,
+        user_id: UserId,
+        old_password_hash: UserPasswordHash,
+        new_password_hash: Coroutine[Any, Any, UserPasswordHash],
+    ) -> None:
+        try:
+            password_hash: UserPasswordHash = await new_password_hash
+
+            update_stmt: Update = (
+                update(users_table)
+                .where(
+                    users_table.c.id == user_id.value,
+                    users_table.c.password_hash == old_password_hash.value,
+                )
+                .values(password_hash=password_hash.value)
+            )
+            async with self._session_maker() as session:
+                await session.execute(update_stmt)
+                await session.commit()
+
+        except (InfrastructureError, OSError, SQLAlchemyError):
+            log.warning("Password rehash failed, retried on next login.", exc_info=True)
+        else:
+            log.debug("Password hash upgraded.")
+
+    async def shutdown(self) -> None:
+        if self._tasks:
+            log.debug("Waiting for %d pending password rehashes...", len(self._tasks))
+            await asyncio.gather(*self._tasks, return_exceptions=True)
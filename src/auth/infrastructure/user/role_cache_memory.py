@@ -0,0 +1,36 @@
+from auth.domain.user.enums import UserRoleEnum
+from auth.domain.user.value_objects import UserId
+from auth.infrastructure.cache_ttl_lru import TtlLruCache
+from auth.infrastructure.custom_types import UserRoleCacheMaxEntries, UserRoleCacheTtl
+
+
+class InMemoryUserRoleCache:
+    """
+    Process-local cache of the roles users hold, keyed by user id.
+    Changes made through `UserService` invalidate the entry in this process,
+    both right away and once committed; other workers may serve the old
+    roles until the short TTL runs out.
+    """
+
+    def __init__(
+        self,
+        max_entries: UserRoleCacheMaxEntries,
+        ttl: UserRoleCacheTtl,
+    ):
+        self._roles: TtlLruCache[UserId, frozenset[UserRoleEnum]] = TtlLruCache(
+            max_entries=max_entries,
+            ttl_s=ttl.total_seconds(),
+        )
+
+    def get(self, user_id: UserId) -> set[UserRoleEnum] | None:
+        roles: frozenset[UserRoleEnum] | None = self._roles.get(user_id)
+        return None if roles is None else set(roles)
+
+    def put(self, user_id: UserId, roles: set[UserRoleEnum]) -> None:
+        if not self._roles.is_enabled:
+            return
+
+        self._roles.put(user_id, frozenset(roles))
+
+    def invalidate(self, user_id: UserId) -> None:
+        self._roles.pop(user_id)
@@ -0,0 +1,115 @@
+"""
+Bulk import of users from a CSV (with a header row) or NDJSON file.
+Each record has a `username` and either a `password` or a bcrypt/argon2id
+`password_hash`.
+
+Usage:
+    python -m auth.presentation.cli.import_users users.csv [--batch-size N]
+        [--workers N] [--format csv|ndjson]
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+from pathlib import Path
+
+from dishka import AsyncContainer, make_async_container
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from auth.infrastructure.custom_types import PasswordPepper, UserImportFormat
+from auth.infrastructure.persistence.sqla import initialize_mapping  # noqa: F401
+from auth.infrastructure.user.adapters_domain.user_id_generator_uuid import (
+    UuidUserIdGenerator,
+)
+from auth.infrastructure.user.bulk_importer_sqla import (
+    SqlaUserBulkImporter,
+    UserImportReport,
+)
+from auth.infrastructure.user.import_records import read_user_import_records
+from auth.infrastructure.user.password_hash_policy import PasswordHashPolicy
+from auth.infrastructure.user.password_hasher_pool import PasswordHasherPool
+from auth.setup.config.logs import configure_logging
+from auth.setup.config.settings import Settings
+from auth.setup.ioc.enum_component import ComponentEnum
+from auth.setup.ioc.ioc_registry import get_providers
+
+
+def parse_args(argv: list[str]) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Import users in bulk.")
+    parser.add_argument("path", type=Path)
+    parser.add_argument("--batch-size", type=int, default=5_000)
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=os.cpu_count() or 1,
+        help="hashing processes, defaults to the number of CPUs",
+    )
+    parser.add_argument(
+        "--format",
+        choices=("csv", "ndjson"),
+        default=None,
+        help="defaults to the file extension",
+    )
+    return parser.parse_args(argv)
+
+
+async def import_users(
+    settings: Settings,
+    path: Path,
+    file_format: UserImportFormat,
+    batch_size: int,
+    workers: int,
+) -> UserImportReport:
+    container: AsyncContainer = make_async_container(
+        *get_providers(settings), context={Settings: settings}
+    )
+    # a dedicated pool: the import may saturate every CPU it is given
+    password_hasher_pool = PasswordHasherPool(
+        name="import",
+        kind="process",
+        max_workers=workers,
+        queue_size=0,
+    )
+
+    try:
+        importer = SqlaUserBulkImporter(
+            await container.get(async_sessionmaker[AsyncSession]),
+            password_hasher_pool,
+            await container.get(PasswordPepper, component=ComponentEnum.USER),
+            await container.get(PasswordHashPolicy, component=ComponentEnum.USER),
+            UuidUserIdGenerator(),
+            batch_size=batch_size,
+        )
+        return await importer.import_records(
+            read_user_import_records(path, file_format)
+        )
+    finally:
+        password_hasher_pool.shutdown()
+        await container.close()
+
+
+def main(argv: list[str] | None = None) -> None:
+    args: argparse.Namespace = parse_args(sys.argv[1:] if argv is None else argv)
+    file_format: UserImportFormat = args.format or (
+        "ndjson" if args.path.suffix in (".ndjson", ".jsonl") else "csv"
+    )
+
+    settings: Settings = Settings.from_file()
+    configure_logging(settings.logging.level, settings.logging.sampling_rate)
+
+    report: UserImportReport = asyncio.run(
+        import_users(
+            settings, args.path, file_format, args.batch_size, args.workers
+        )
+    )
+    print(
+        f"read={report.read} imported={report.imported} "
+        f"duplicates={report.duplicates} already_existing={report.already_existing} "
+        f"rejected={report.rejected} elapsed_s={report.elapsed_s:.3f} "
+        f"records_per_s={report.records_per_s:.0f}"
+    )
+
+
+if __name__ == "__main__":
+    main()
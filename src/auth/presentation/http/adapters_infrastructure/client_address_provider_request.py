@@ -0,0 +1,20 @@
+from fastapi.requests import Request
+
+from auth.infrastructure.rate_limiting.ports.client_address_provider import (
+    ClientAddressProvider,
+)
+
+
+class RequestClientAddressProvider(ClientAddressProvider):
+    """
+    Behind a reverse proxy, run Uvicorn with `--proxy-headers` and
+    `--forwarded-allow-ips` so the peer address is the real client.
+    """
+
+    def __init__(self, request: Request):
+        self._request = request
+
+    def get_client_address(self) -> str | None:
+        if self._request.client is None:
+            return None
+        return self._request.client.host
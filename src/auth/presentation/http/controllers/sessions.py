@@ -0,0 +1,13 @@
+from fastapi import APIRouter
+
+from auth.presentation.http.routers.sessions_revoke import revoke_sessions_router
+
+sessions_router = APIRouter(
+    prefix="/sessions",
+    tags=["Sessions"],
+)
+
+sessions_sub_routers = (revoke_sessions_router,)
+
+for router in sessions_sub_routers:
+    sessions_router.include_router(router)
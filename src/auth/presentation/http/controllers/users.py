@@ -0,0 +1,17 @@
+from fastapi import APIRouter
+
+from auth.presentation.http.routers.users_export import export_users_router
+from auth.presentation.http.routers.users_list import list_users_router
+
+users_router = APIRouter(
+    prefix="/users",
+    tags=["Users"],
+)
+
+users_sub_routers = (
+    list_users_router,
+    export_users_router,
+)
+
+for router in users_sub_routers:
+    users_router.include_router(router)
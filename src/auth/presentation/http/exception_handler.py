@@ -10,6 +10,7 @@ from fastapi.responses import ORJSONResponse
 from pydantic_core import ErrorDetails
 
 from auth.application.base.errors import ApplicationError
+from auth.application.errors import PaginationCursorError
 from auth.application.user.errors import (
     AlreadyAuthenticatedError,
     AuthenticationError,
@@ -21,7 +22,14 @@ from auth.domain.user.errors.non_existence import (
     UserNotFoundById,
     UserNotFoundByUsername,
 )
-from auth.infrastructure.session.errors import SessionExpired, SessionNotFoundById
+from auth.infrastructure.rate_limiting.errors import RateLimitExceeded
+from auth.infrastructure.session.errors import (
+    SessionExpired,
+    SessionNotFoundById,
+    SessionRevocationCriteriaError,
+    SessionRevocationUnsupported,
+)
+from auth.infrastructure.user.errors import PasswordHasherBusy
 
 log = logging.getLogger(__name__)
 
@@ -48,6 +56,8 @@ class ExceptionMapper:
         self.exceptions_status_code_map: dict[type[Exception], int] = {
             pydantic.ValidationError: status.HTTP_400_BAD_REQUEST,
             DomainFieldError: status.HTTP_400_BAD_REQUEST,
+            PaginationCursorError: status.HTTP_400_BAD_REQUEST,
+            SessionRevocationCriteriaError: status.HTTP_400_BAD_REQUEST,
             AuthenticationError: status.HTTP_401_UNAUTHORIZED,
             AlreadyAuthenticatedError: status.HTTP_401_UNAUTHORIZED,
             SessionExpired: status.HTTP_401_UNAUTHORIZED,
@@ -56,8 +66,11 @@ class ExceptionMapper:
             UserNotFoundById: status.HTTP_404_NOT_FOUND,
             UserNotFoundByUsername: status.HTTP_404_NOT_FOUND,
             UsernameAlreadyExists: status.HTTP_409_CONFLICT,
+            RateLimitExceeded: status.HTTP_429_TOO_MANY_REQUESTS,
             DomainError: status.HTTP_500_INTERNAL_SERVER_ERROR,
             ApplicationError: status.HTTP_500_INTERNAL_SERVER_ERROR,
+            SessionRevocationUnsupported: status.HTTP_501_NOT_IMPLEMENTED,
+            PasswordHasherBusy: status.HTTP_503_SERVICE_UNAVAILABLE,
         }
 
     def get_status_code(self, exc: Exception) -> int:
@@ -107,7 +120,15 @@ class ExceptionHandler:
             exc.errors() if isinstance(exc, pydantic.ValidationError) else None
         )
 
-        return self._create_exception_response(status_code, exception_message, details)
+        headers: dict[str, str] | None = (
+            {"Retry-After": str(exc.retry_after_s)}
+            if isinstance(exc, RateLimitExceeded)
+            else None
+        )
+
+        return self._create_exception_response(
+            status_code, exception_message, details, headers
+        )
 
     async def _handle_unexpected_exceptions(
         self, _: Request, exc: Exception
@@ -128,11 +149,14 @@ class ExceptionHandler:
         status_code: int,
         exception_message: str,
         details: list[ErrorDetails] | None = None,
+        headers: dict[str, str] | None = None,
     ) -> ORJSONResponse:
         response_content: ExceptionSchemaRich | ExceptionSchema = (
             ExceptionSchemaRich(exception_message, jsonable_encoder(details))
             if details
             else ExceptionSchema(exception_message)
         )
-        return ORJSONResponse(status_code=status_code, content=response_content)
+        return ORJSONResponse(
+            status_code=status_code, content=response_content, headers=headers
+        )
     
\ No newline at end of file
@@ -1,48 +1,103 @@
 import logging
+from http.cookies import SimpleCookie
 from typing import Any, Literal
 
-from fastapi import FastAPI
-from starlette.middleware.base import BaseHTTPMiddleware, RequestResponseEndpoint
-from starlette.requests import Request
-from starlette.responses import Response
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from auth.infrastructure.session.token_fingerprint import TokenFingerprint
+from auth.setup.config.logs import SAMPLED
 
 log = logging.getLogger(__name__)
 
 
-class AuthMiddleware(BaseHTTPMiddleware):
-    def __init__(self, app: FastAPI):
-        super().__init__(app)
+class AuthMiddleware:
+    """
+    Pure ASGI middleware: applies the access token cookie changes requested
+    through `request.state` by patching the headers of `http.response.start`.
+    Unlike `BaseHTTPMiddleware`, it neither spawns a task nor wraps
+    the response body stream.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self._app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self._app(scope, receive, send)
+            return
+
+        # `request.state` of every handler wraps this very dict
+        state: dict[str, Any] = scope.setdefault("state", {})
 
-    async def dispatch(
-        self, request: Request, call_next: RequestResponseEndpoint
-    ) -> Response:
-        response: Response = await call_next(request)
+        async def send_with_cookies(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                self._patch_cookies(state, MutableHeaders(scope=message))
+            await send(message)
 
-        new_access_token: str | None = getattr(request.state, "new_access_token", None)
-        cookie_params: dict[str, Any] = getattr(request.state, "cookie_params", {})
+        await self._app(scope, receive, send_with_cookies)
+
+    @staticmethod
+    def _patch_cookies(state: dict[str, Any], headers: MutableHeaders) -> None:
+        new_access_token: str | None = state.get("new_access_token")
+        cookie_params: dict[str, Any] = state.get("cookie_params", {})
         cookie_params_secure: bool | None = cookie_params.get("secure")
         cookie_params_samesite: Literal["strict", "none"] | None = cookie_params.get(
             "samesite"
         )
 
         if new_access_token is not None and cookie_params_secure is not None:
-            response.set_cookie(
-                key="access_token",
-                value=new_access_token,
-                httponly=True,
-                secure=cookie_params_secure,
-                samesite=cookie_params_samesite,
+            headers.append(
+                "set-cookie",
+                _build_cookie(
+                    value=new_access_token,
+                    httponly=True,
+                    secure=cookie_params_secure,
+                    samesite=cookie_params_samesite,
+                ),
+            )
+            log.info(
+                "Cookie with access token '%s' was set.",
+                TokenFingerprint(new_access_token),
+                extra=SAMPLED,
             )
-            log.info("Cookie with access token '%s' was set.", new_access_token)
 
-        is_delete_token: bool = getattr(request.state, "delete_access_token", False)
+        is_delete_token: bool = state.get("delete_access_token", False)
         if is_delete_token:
-            response.delete_cookie(key="access_token")
-            access_token: str | None = getattr(request.state, "access_token", None)
+            headers.append("set-cookie", _build_cookie(value="", max_age=0))
+            access_token: str | None = state.get("access_token")
             if access_token is None:
-                log.info("Cookie with access token was already deleted.")
+                log.info("Cookie with access token was already deleted.", extra=SAMPLED)
             else:
-                log.info("Cookie with access token '%s' was deleted.", access_token)
+                log.info(
+                    "Cookie with access token '%s' was deleted.",
+                    TokenFingerprint(access_token),
+                    extra=SAMPLED,
+                )
+
 
-        return response
-    
\ No newline at end of file
+def _build_cookie(
+    *,
+    value: str,
+    httponly: bool = False,
+    secure: bool = False,
+    samesite: Literal["strict", "lax", "none"] | None = "lax",
+    max_age: int | None = None,
+) -> str:
+    """
+    Same attributes as `Response.set_cookie` / `Response.delete_cookie`.
+    """
+    cookie: SimpleCookie = SimpleCookie()
+    cookie["access_token"] = value
+    morsel = cookie["access_token"]
+    morsel["path"] = "/"
+    if httponly:
+        morsel["httponly"] = True
+    if secure:
+        morsel["secure"] = True
+    if samesite is not None:
+        morsel["samesite"] = samesite
+    if max_age is not None:
+        morsel["max-age"] = max_age
+        morsel["expires"] = "Thu, 01 Jan 1970 00:00:00 GMT"
+    return morsel.OutputString()
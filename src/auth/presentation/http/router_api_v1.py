@@ -2,6 +2,7 @@ from fastapi import APIRouter
 from fastapi.requests import Request
 
 from auth.presentation.http.controllers.account import account_router
+from auth.presentation.http.controllers.sessions import sessions_router
 from auth.presentation.http.controllers.users import users_router
 
 api_v1_router = APIRouter(
@@ -16,6 +17,7 @@ async def healthcheck(_: Request) -> dict[str, str]:
 
 api_v1_sub_routers = (
     account_router,
+    sessions_router,
     users_router,
 )
 
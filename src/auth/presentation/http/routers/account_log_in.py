@@ -4,8 +4,8 @@ from dishka import FromComponent
 from dishka.integrations.fastapi import inject
 from fastapi import APIRouter, status
 
-from auth.infrastructure.scenarios.account_log_in.interactor import LogInInteractor
-from auth.infrastructure.contracts.login import  (
+from auth.infrastructure.scenarios.account_log_in import LogInInteractor
+from auth.infrastructure.contracts.login import (
     LogInRequest,
     LogInResponse,
 )
@@ -22,7 +22,9 @@ log_in_router = APIRouter()
         status.HTTP_400_BAD_REQUEST: {"model": ExceptionSchema},
         status.HTTP_401_UNAUTHORIZED: {"model": ExceptionSchema},
         status.HTTP_404_NOT_FOUND: {"model": ExceptionSchema},
+        status.HTTP_429_TOO_MANY_REQUESTS: {"model": ExceptionSchema},
         status.HTTP_500_INTERNAL_SERVER_ERROR: {"model": ExceptionSchema},
+        status.HTTP_503_SERVICE_UNAVAILABLE: {"model": ExceptionSchema},
     },
     status_code=status.HTTP_200_OK,
 )
@@ -38,4 +40,6 @@ async def login(
     # :raises DomainFieldError 400:
     # :raises DataGatewayError 500:
     # :raises UserNotFoundByUsername 404:
+    # :raises PasswordHasherBusy 503:
+    # :raises RateLimitExceeded 429:
     return await interactor(request_data)
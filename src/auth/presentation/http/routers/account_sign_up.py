@@ -23,6 +23,7 @@ sign_up_router = APIRouter()
         status.HTTP_401_UNAUTHORIZED: {"model": ExceptionSchema},
         status.HTTP_409_CONFLICT: {"model": ExceptionSchema},
         status.HTTP_500_INTERNAL_SERVER_ERROR: {"model": ExceptionSchema},
+        status.HTTP_503_SERVICE_UNAVAILABLE: {"model": ExceptionSchema},
     },
     status_code=status.HTTP_201_CREATED,
 )
@@ -38,4 +39,5 @@ async def sign_up(
     # :raises DomainFieldError 400:
     # :raises DataGatewayError 500:
     # :raises UsernameAlreadyExists 409:
+    # :raises PasswordHasherBusy 503:
     return await interactor(request_data)
@@ -0,0 +1,45 @@
+from typing import Annotated
+
+from dishka import FromComponent
+from dishka.integrations.fastapi import inject
+from fastapi import APIRouter, Security, status
+
+from auth.infrastructure.contracts.revoke_sessions import (
+    RevokeSessionsRequest,
+    RevokeSessionsResponse,
+)
+from auth.infrastructure.scenarios.sessions_revoke import RevokeSessionsInteractor
+from auth.presentation.http.dependencies import cookie_scheme
+from auth.presentation.http.exception_handler import ExceptionSchema
+from auth.setup.ioc.enum_component import ComponentEnum
+
+revoke_sessions_router = APIRouter()
+
+
+@revoke_sessions_router.post(
+    "/revoke",
+    responses={
+        status.HTTP_200_OK: {"model": RevokeSessionsResponse},
+        status.HTTP_400_BAD_REQUEST: {"model": ExceptionSchema},
+        status.HTTP_401_UNAUTHORIZED: {"model": ExceptionSchema},
+        status.HTTP_403_FORBIDDEN: {"model": ExceptionSchema},
+        status.HTTP_500_INTERNAL_SERVER_ERROR: {"model": ExceptionSchema},
+        status.HTTP_501_NOT_IMPLEMENTED: {"model": ExceptionSchema},
+    },
+    status_code=status.HTTP_200_OK,
+    dependencies=[Security(cookie_scheme)],
+)
+@inject
+async def revoke_sessions(
+    request_data: RevokeSessionsRequest,
+    interactor: Annotated[
+        RevokeSessionsInteractor,
+        FromComponent(ComponentEnum.SESSION),
+    ],
+) -> RevokeSessionsResponse:
+    # :raises AuthenticationError 401:
+    # :raises AuthorizationError 403:
+    # :raises SessionRevocationCriteriaError 400:
+    # :raises SessionRevocationUnsupported 501:
+    # :raises DataGatewayError 500:
+    return await interactor(request_data)
@@ -0,0 +1,42 @@
+from typing import Annotated, AsyncIterator
+
+from dishka import FromComponent
+from dishka.integrations.fastapi import inject
+from fastapi import APIRouter, Security, status
+from fastapi.responses import StreamingResponse
+
+from auth.application.contracts.user import UserListItem
+from auth.application.scenarios.users_export.interactor import (
+    ExportUsersInteractor,
+)
+from auth.presentation.http.dependencies import cookie_scheme
+from auth.presentation.http.exception_handler import ExceptionSchema
+from auth.presentation.http.streaming import NDJSON_MEDIA_TYPE, ndjson_chunks
+from auth.setup.ioc.enum_component import ComponentEnum
+
+export_users_router = APIRouter()
+
+
+@export_users_router.get(
+    "/export",
+    responses={
+        status.HTTP_200_OK: {"content": {NDJSON_MEDIA_TYPE: {}}},
+        status.HTTP_401_UNAUTHORIZED: {"model": ExceptionSchema},
+        status.HTTP_403_FORBIDDEN: {"model": ExceptionSchema},
+    },
+    status_code=status.HTTP_200_OK,
+    response_class=StreamingResponse,
+    dependencies=[Security(cookie_scheme)],
+)
+@inject
+async def export_users(
+    interactor: Annotated[
+        ExportUsersInteractor,
+        FromComponent(ComponentEnum.USER),
+    ],
+) -> StreamingResponse:
+    # :raises AuthenticationError 401:
+    # :raises AuthorizationError 403:
+    # a DataGatewayError once streaming has started aborts the response
+    users: AsyncIterator[UserListItem] = await interactor()
+    return StreamingResponse(ndjson_chunks(users), media_type=NDJSON_MEDIA_TYPE)
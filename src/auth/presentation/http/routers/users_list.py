@@ -0,0 +1,42 @@
+from typing import Annotated
+
+from dishka import FromComponent
+from dishka.integrations.fastapi import inject
+from fastapi import APIRouter, Query, Security, status
+
+from auth.application.contracts.user import ListUsersResponse
+from auth.application.pagination import PaginationRequest
+from auth.application.scenarios.users_list.interactor import ListUsersInteractor
+from auth.presentation.http.dependencies import cookie_scheme
+from auth.presentation.http.exception_handler import ExceptionSchema
+from auth.setup.ioc.enum_component import ComponentEnum
+
+list_users_router = APIRouter()
+
+
+@list_users_router.get(
+    "/",
+    responses={
+        status.HTTP_200_OK: {"model": ListUsersResponse},
+        status.HTTP_400_BAD_REQUEST: {"model": ExceptionSchema},
+        status.HTTP_401_UNAUTHORIZED: {"model": ExceptionSchema},
+        status.HTTP_403_FORBIDDEN: {"model": ExceptionSchema},
+        status.HTTP_500_INTERNAL_SERVER_ERROR: {"model": ExceptionSchema},
+    },
+    status_code=status.HTTP_200_OK,
+    dependencies=[Security(cookie_scheme)],
+)
+@inject
+async def list_users(
+    interactor: Annotated[
+        ListUsersInteractor,
+        FromComponent(ComponentEnum.USER),
+    ],
+    limit: Annotated[int, Query(ge=1, le=100)] = 20,
+    cursor: Annotated[str | None, Query()] = None,
+) -> ListUsersResponse:
+    # :raises AuthenticationError 401:
+    # :raises AuthorizationError 403:
+    # :raises PaginationCursorError 400:
+    # :raises DataGatewayError 500:
+    return await interactor(PaginationRequest(limit=limit, cursor=cursor))
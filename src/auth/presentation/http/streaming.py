@@ -0,0 +1,24 @@
+from typing import Any, AsyncIterator
+
+import orjson
+
+NDJSON_MEDIA_TYPE: str = "application/x-ndjson"
+
+
+async def ndjson_chunks(
+    items: AsyncIterator[Any], items_per_chunk: int = 500
+) -> AsyncIterator[bytes]:
+    """
+    One JSON document per line, sent in chunks of `items_per_chunk` lines.
+    The first chunk is sent right away, with the first item only.
+    """
+    lines: list[bytes] = []
+    is_first_chunk: bool = True
+    async for item in items:
+        lines.append(orjson.dumps(item))
+        if is_first_chunk or len(lines) >= items_per_chunk:
+            yield b"\n".join(lines) + b"\n"
+            lines.clear()
+            is_first_chunk = False
+    if lines:
+        yield b"\n".join(lines) + b"\n"
@@ -1,6 +1,7 @@
 # pylint: disable=C0301 (line-too-long)
 __all__ = ("initialize_mapping", "create_app_with_container")
 
+import asyncio
 from contextlib import asynccontextmanager
 from typing import AsyncIterator
 
@@ -9,7 +10,12 @@ from dishka.integrations.fastapi import setup_dishka
 from fastapi import FastAPI
 from fastapi.responses import ORJSONResponse
 
+from auth.infrastructure.custom_types import DummyPasswordHash
 from auth.infrastructure.persistence.sqla import initialize_mapping
+from auth.infrastructure.session.prolongation_coalescer_sqla import (
+    SqlaSessionProlongationCoalescer,
+)
+from auth.infrastructure.session.reaper_sqla import SqlaSessionReaper
 from auth.presentation.http.exception_handler import (
     ExceptionHandler,
     ExceptionMapper,
@@ -17,14 +23,43 @@ from auth.presentation.http.exception_handler import (
 )
 from auth.presentation.http.middleware_auth import AuthMiddleware
 from auth.presentation.http.router_root import root_router
+from auth.setup.config.logs import configure_logging
 from auth.setup.config.settings import Settings
+from auth.setup.ioc.enum_component import ComponentEnum
 from auth.setup.ioc.ioc_registry import get_providers
 
 
 @asynccontextmanager
 async def lifespan(auth: FastAPI) -> AsyncIterator[None]:
+    container: AsyncContainer = auth.state.dishka_container  # noqa; auth.state is the place where dishka_container lives
+    background_tasks: list[asyncio.Task[None]] = []
+
+    # made before serving, for constant-time logins of unknown usernames
+    await container.get(DummyPasswordHash, component=ComponentEnum.USER)
+
+    session_reaper: SqlaSessionReaper = await container.get(
+        SqlaSessionReaper, component=ComponentEnum.SESSION
+    )
+    if session_reaper.is_enabled:
+        background_tasks.append(asyncio.create_task(session_reaper.run()))
+
+    session_prolongation_coalescer: SqlaSessionProlongationCoalescer = (
+        await container.get(
+            SqlaSessionProlongationCoalescer, component=ComponentEnum.SESSION
+        )
+    )
+    if session_prolongation_coalescer.is_enabled:
+        background_tasks.append(
+            asyncio.create_task(session_prolongation_coalescer.run())
+        )
+
     yield None
-    await auth.state.dishka_container.close()  # noqa; auth.state is the place where dishka_container lives
+
+    for task in background_tasks:
+        task.cancel()
+    await asyncio.gather(*background_tasks, return_exceptions=True)
+    await session_prolongation_coalescer.flush()
+    await container.close()
 
 
 def configure_app(new_app: FastAPI) -> None:
@@ -39,10 +74,11 @@ def configure_app(new_app: FastAPI) -> None:
 
 
 def create_app_with_container(settings: Settings) -> FastAPI:
+    configure_logging(settings.logging.level, settings.logging.sampling_rate)
     new_app: FastAPI = FastAPI(lifespan=lifespan, default_response_class=ORJSONResponse)
     configure_app(new_app)
     async_container: AsyncContainer = make_async_container(
-        *get_providers(), context={Settings: settings}
+        *get_providers(settings), context={Settings: settings}
     )
     setup_dishka(async_container, new_app)
     return new_app
@@ -1,10 +1,77 @@
+import atexit
+import copy
 import logging
+import queue
+import random
+from logging.handlers import QueueHandler, QueueListener
 from typing import Literal
 
 LoggingLevel = Literal["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"]
 
+# pass `extra=SAMPLED` to log a high-volume event subject to sampling
+SAMPLED: dict[str, bool] = {"sampled": True}
+
+_queue_listener: QueueListener | None = None
+
+
+def _stop_queue_listener() -> None:
+    global _queue_listener
+
+    if _queue_listener is not None:
+        _queue_listener.stop()
+        _queue_listener = None
+
+
+atexit.register(_stop_queue_listener)
+
+
+class SamplingFilter(logging.Filter):
+    """
+    Keeps a `rate` fraction of the records marked as sampled,
+    any other record passes through.
+    """
+
+    def __init__(self, rate: float):
+        super().__init__()
+        self._rate = rate
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if not getattr(record, "sampled", False):
+            return True
+        return self._rate >= 1 or random.random() < self._rate
+
+
+class DeferredQueueHandler(QueueHandler):
+    """
+    Renders the message and the traceback on the calling thread, so that
+    later changes to the arguments do not show up in the log, and leaves
+    only the final line formatting to the listener thread.
+    Only valid with an in-process listener.
+    """
+
+    _exception_formatter: logging.Formatter = logging.Formatter()
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # other handlers of the same record still see it unchanged
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        if record.exc_info:
+            if not record.exc_text:
+                record.exc_text = self._exception_formatter.formatException(
+                    record.exc_info
+                )
+            record.exc_info = None
+        return record
+
+
+def configure_logging(level: LoggingLevel = "INFO", sampling_rate: float = 1.0) -> None:
+    """
+    Log calls only enqueue the record, the stream is written
+    by a background thread.
+    """
+    global _queue_listener
 
-def configure_logging(level: LoggingLevel = "INFO") -> None:
     level_map: dict[LoggingLevel, int] = {
         "DEBUG": logging.DEBUG,
         "INFO": logging.INFO,
@@ -15,15 +82,31 @@ def configure_logging(level: LoggingLevel = "INFO") -> None:
 
     numeric_level: int = level_map.get(level, logging.INFO)
 
-    logging.basicConfig(
-        level=numeric_level,
-        datefmt="%Y-%m-%d %H:%M:%S",
-        format=(
-            "[%(asctime)s.%(msecs)03d] "
-            "%(funcName)20s "
-            "%(module)s:%(lineno)d "
-            "%(levelname)-8s - "
-            "%(message)s"
-        ),
+    stream_handler: logging.Handler = logging.StreamHandler()
+    stream_handler.setFormatter(
+        logging.Formatter(
+            datefmt="%Y-%m-%d %H:%M:%S",
+            fmt=(
+                "[%(asctime)s.%(msecs)03d] "
+                "%(funcName)20s "
+                "%(module)s:%(lineno)d "
+                "%(levelname)-8s - "
+                "%(message)s"
+            ),
+        )
     )
-    
\ No newline at end of file
+
+    log_queue: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
+    queue_handler: QueueHandler = DeferredQueueHandler(log_queue)
+    queue_handler.addFilter(SamplingFilter(sampling_rate))
+
+    # stopping twice fails: the listener is only stopped through this function
+    _stop_queue_listener()
+    _queue_listener = QueueListener(log_queue, stream_handler)
+    _queue_listener.start()
+
+    root_logger: logging.Logger = logging.getLogger()
+    for handler in root_logger.handlers[:]:
+        root_logger.removeHandler(handler)
+    root_logger.addHandler(queue_handler)
+    root_logger.setLevel(numeric_level)
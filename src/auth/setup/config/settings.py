@@ -14,6 +14,86 @@ log = logging.getLogger(__name__)
 
 class PasswordSecuritySettings(BaseModel):
     pepper: str = Field(alias="PASSWORD_PEPPER")
+    constant_time_login: bool = Field(default=False, alias="CONSTANT_TIME_LOGIN")
+    hash_scheme: Literal["bcrypt", "argon2id"] = Field(
+        default="bcrypt", alias="PASSWORD_HASH_SCHEME"
+    )
+    bcrypt_rounds: int = Field(default=12, alias="PASSWORD_BCRYPT_ROUNDS")
+    argon2_time_cost: int = Field(default=3, alias="PASSWORD_ARGON2_TIME_COST")
+    argon2_memory_cost_kib: int = Field(
+        default=65_536, alias="PASSWORD_ARGON2_MEMORY_COST_KIB"
+    )
+    argon2_parallelism: int = Field(default=4, alias="PASSWORD_ARGON2_PARALLELISM")
+
+    @field_validator("bcrypt_rounds", mode="before")
+    @classmethod
+    def validate_bcrypt_rounds(cls, v: Any) -> int:
+        if isinstance(v, int):
+            if not 4 <= v <= 31:
+                raise ValueError("PASSWORD_BCRYPT_ROUNDS must be between 4 and 31.")
+            return v
+        else:
+            raise ValueError(
+                "PASSWORD_BCRYPT_ROUNDS must be an integer (4 <= n <= 31)."
+            )
+
+    @field_validator(
+        "argon2_time_cost",
+        "argon2_memory_cost_kib",
+        "argon2_parallelism",
+        mode="before",
+    )
+    @classmethod
+    def validate_argon2_parameter(cls, v: Any) -> int:
+        if isinstance(v, int):
+            if v < 1:
+                raise ValueError("PASSWORD_ARGON2_* must be at least 1.")
+            return v
+        else:
+            raise ValueError("PASSWORD_ARGON2_* must be an integer (n >= 1).")
+
+
+class PasswordHasherPoolSettings(BaseModel):
+    kind: Literal["thread", "process"] = Field(
+        default="thread", alias="HASHER_POOL_KIND"
+    )
+    max_workers: int = Field(default=4, alias="HASHER_POOL_MAX_WORKERS")
+    queue_size: int = Field(default=16, alias="HASHER_POOL_QUEUE_SIZE")
+    max_verifications: int = Field(default=0, alias="HASHER_POOL_MAX_VERIFICATIONS")
+
+    @field_validator("max_workers", mode="before")
+    @classmethod
+    def validate_max_workers(cls, v: Any) -> int:
+        if isinstance(v, int):
+            if v < 1:
+                raise ValueError("HASHER_POOL_MAX_WORKERS must be at least 1.")
+            return v
+        else:
+            raise ValueError("HASHER_POOL_MAX_WORKERS must be an integer (n >= 1).")
+
+    @field_validator("queue_size", mode="before")
+    @classmethod
+    def validate_queue_size(cls, v: Any) -> int:
+        if isinstance(v, int):
+            if v < 0:
+                raise ValueError("HASHER_POOL_QUEUE_SIZE must be non-negative.")
+            return v
+        else:
+            raise ValueError("HASHER_POOL_QUEUE_SIZE must be an integer (n >= 0).")
+
+    @field_validator("max_verifications", mode="before")
+    @classmethod
+    def validate_max_verifications(cls, v: Any) -> int:
+        if isinstance(v, int):
+            if v < 0:
+                raise ValueError(
+                    "HASHER_POOL_MAX_VERIFICATIONS must be non-negative (0 disables)."
+                )
+            return v
+        else:
+            raise ValueError(
+                "HASHER_POOL_MAX_VERIFICATIONS must be an integer (n >= 0)."
+            )
 
 
 class SessionSettings(BaseModel):
@@ -28,6 +108,36 @@ class SessionSettings(BaseModel):
     ] = Field(alias="JWT_ALGORITHM")
     session_ttl_min: timedelta = Field(alias="SESSION_TTL_MIN")
     session_refresh_threshold: float = Field(alias="SESSION_REFRESH_THRESHOLD")
+    jwt_stateless_window_s: timedelta = Field(
+        default=timedelta(0), alias="JWT_STATELESS_WINDOW_S"
+    )
+    jwt_decode_cache_max_entries: int = Field(
+        default=10_000, alias="JWT_DECODE_CACHE_MAX_ENTRIES"
+    )
+    session_cache_max_entries: int = Field(
+        default=10_000, alias="SESSION_CACHE_MAX_ENTRIES"
+    )
+    session_cache_ttl_s: timedelta = Field(
+        default=timedelta(seconds=30), alias="SESSION_CACHE_TTL_S"
+    )
+    session_reaper_interval_s: timedelta = Field(
+        default=timedelta(seconds=60), alias="SESSION_REAPER_INTERVAL_S"
+    )
+    session_reaper_batch_size: int = Field(
+        default=1_000, alias="SESSION_REAPER_BATCH_SIZE"
+    )
+    session_prolong_flush_interval_s: timedelta = Field(
+        default=timedelta(0), alias="SESSION_PROLONG_FLUSH_INTERVAL_S"
+    )
+    session_revocation_batch_size: int = Field(
+        default=1_000, alias="SESSION_REVOCATION_BATCH_SIZE"
+    )
+    user_role_cache_max_entries: int = Field(
+        default=10_000, alias="USER_ROLE_CACHE_MAX_ENTRIES"
+    )
+    user_role_cache_ttl_s: timedelta = Field(
+        default=timedelta(seconds=5), alias="USER_ROLE_CACHE_TTL_S"
+    )
 
     @field_validator("session_ttl_min", mode="before")
     @classmethod
@@ -54,6 +164,180 @@ class SessionSettings(BaseModel):
                 "(fraction, 0 < fraction < 1)."
             )
 
+    @field_validator("jwt_stateless_window_s", mode="before")
+    @classmethod
+    def convert_jwt_stateless_window_s(cls, v: Any) -> timedelta:
+        if isinstance(v, (int, float)):
+            if v < 0:
+                raise ValueError(
+                    "JWT_STATELESS_WINDOW_S must be non-negative (0 disables)."
+                )
+            return timedelta(seconds=v)
+        else:
+            raise ValueError("JWT_STATELESS_WINDOW_S must be a number (n of seconds).")
+
+    @field_validator("jwt_decode_cache_max_entries", mode="before")
+    @classmethod
+    def validate_jwt_decode_cache_max_entries(cls, v: Any) -> int:
+        if isinstance(v, int):
+            if v < 0:
+                raise ValueError(
+                    "JWT_DECODE_CACHE_MAX_ENTRIES must be non-negative (0 disables)."
+                )
+            return v
+        else:
+            raise ValueError(
+                "JWT_DECODE_CACHE_MAX_ENTRIES must be an integer (n >= 0)."
+            )
+
+    @field_validator("session_cache_max_entries", mode="before")
+    @classmethod
+    def validate_session_cache_max_entries(cls, v: Any) -> int:
+        if isinstance(v, int):
+            if v < 0:
+                raise ValueError(
+                    "SESSION_CACHE_MAX_ENTRIES must be non-negative (0 disables)."
+                )
+            return v
+        else:
+            raise ValueError("SESSION_CACHE_MAX_ENTRIES must be an integer (n >= 0).")
+
+    @field_validator("session_cache_ttl_s", mode="before")
+    @classmethod
+    def convert_session_cache_ttl_s(cls, v: Any) -> timedelta:
+        if isinstance(v, (int, float)):
+            if v < 0:
+                raise ValueError("SESSION_CACHE_TTL_S must be non-negative.")
+            return timedelta(seconds=v)
+        else:
+            raise ValueError("SESSION_CACHE_TTL_S must be a number (n of seconds).")
+
+    @field_validator("session_reaper_interval_s", mode="before")
+    @classmethod
+    def convert_session_reaper_interval_s(cls, v: Any) -> timedelta:
+        if isinstance(v, (int, float)):
+            if v < 0:
+                raise ValueError(
+                    "SESSION_REAPER_INTERVAL_S must be non-negative (0 disables)."
+                )
+            return timedelta(seconds=v)
+        else:
+            raise ValueError(
+                "SESSION_REAPER_INTERVAL_S must be a number (n of seconds)."
+            )
+
+    @field_validator("session_reaper_batch_size", mode="before")
+    @classmethod
+    def validate_session_reaper_batch_size(cls, v: Any) -> int:
+        if isinstance(v, int):
+            if v < 1:
+                raise ValueError("SESSION_REAPER_BATCH_SIZE must be at least 1.")
+            return v
+        else:
+            raise ValueError("SESSION_REAPER_BATCH_SIZE must be an integer (n >= 1).")
+
+    @field_validator("session_prolong_flush_interval_s", mode="before")
+    @classmethod
+    def convert_session_prolong_flush_interval_s(cls, v: Any) -> timedelta:
+        if isinstance(v, (int, float)):
+            if v < 0:
+                raise ValueError(
+                    "SESSION_PROLONG_FLUSH_INTERVAL_S must be non-negative "
+                    "(0 disables)."
+                )
+            return timedelta(seconds=v)
+        else:
+            raise ValueError(
+                "SESSION_PROLONG_FLUSH_INTERVAL_S must be a number (n of seconds)."
+            )
+
+    @field_validator("session_revocation_batch_size", mode="before")
+    @classmethod
+    def validate_session_revocation_batch_size(cls, v: Any) -> int:
+        if isinstance(v, int):
+            if v < 1:
+                raise ValueError("SESSION_REVOCATION_BATCH_SIZE must be at least 1.")
+            return v
+        else:
+            raise ValueError(
+                "SESSION_REVOCATION_BATCH_SIZE must be an integer (n >= 1)."
+            )
+
+    @field_validator("user_role_cache_max_entries", mode="before")
+    @classmethod
+    def validate_user_role_cache_max_entries(cls, v: Any) -> int:
+        if isinstance(v, int):
+            if v < 0:
+                raise ValueError(
+                    "USER_ROLE_CACHE_MAX_ENTRIES must be non-negative (0 disables)."
+                )
+            return v
+        else:
+            raise ValueError(
+                "USER_ROLE_CACHE_MAX_ENTRIES must be an integer (n >= 0)."
+            )
+
+    @field_validator("user_role_cache_ttl_s", mode="before")
+    @classmethod
+    def convert_user_role_cache_ttl_s(cls, v: Any) -> timedelta:
+        if isinstance(v, (int, float)):
+            if v < 0:
+                raise ValueError(
+                    "USER_ROLE_CACHE_TTL_S must be non-negative (0 disables)."
+                )
+            return timedelta(seconds=v)
+        else:
+            raise ValueError("USER_ROLE_CACHE_TTL_S must be a number (n of seconds).")
+
+
+class RateLimitSettings(BaseModel):
+    backend: Literal["memory", "redis"] = Field(
+        default="memory", alias="RATE_LIMIT_BACKEND"
+    )
+    redis_url: str = Field(
+        default="redis://localhost:6379/0", alias="RATE_LIMIT_REDIS_URL"
+    )
+    key_prefix: str = Field(default="auth", alias="RATE_LIMIT_KEY_PREFIX")
+    login_per_username: int = Field(
+        default=50, alias="LOGIN_RATE_LIMIT_PER_USERNAME"
+    )
+    login_per_username_address: int = Field(
+        default=10, alias="LOGIN_RATE_LIMIT_PER_USERNAME_ADDRESS"
+    )
+    login_per_address: int = Field(default=100, alias="LOGIN_RATE_LIMIT_PER_ADDRESS")
+    login_window_s: timedelta = Field(
+        default=timedelta(seconds=60), alias="LOGIN_RATE_LIMIT_WINDOW_S"
+    )
+
+    @field_validator(
+        "login_per_username",
+        "login_per_username_address",
+        "login_per_address",
+        mode="before",
+    )
+    @classmethod
+    def validate_login_limit(cls, v: Any) -> int:
+        if isinstance(v, int):
+            if v < 0:
+                raise ValueError(
+                    "LOGIN_RATE_LIMIT_PER_* must be non-negative (0 disables)."
+                )
+            return v
+        else:
+            raise ValueError("LOGIN_RATE_LIMIT_PER_* must be an integer (n >= 0).")
+
+    @field_validator("login_window_s", mode="before")
+    @classmethod
+    def convert_login_window_s(cls, v: Any) -> timedelta:
+        if isinstance(v, (int, float)):
+            if v <= 0:
+                raise ValueError("LOGIN_RATE_LIMIT_WINDOW_S must be positive.")
+            return timedelta(seconds=v)
+        else:
+            raise ValueError(
+                "LOGIN_RATE_LIMIT_WINDOW_S must be a number (n of seconds)."
+            )
+
 
 class CookiesSettings(BaseModel):
     secure: bool = Field(alias="SECURE")
@@ -61,8 +345,12 @@ class CookiesSettings(BaseModel):
 
 class SecuritySettings(BaseModel):
     password: PasswordSecuritySettings
+    password_hasher_pool: PasswordHasherPoolSettings = Field(
+        default_factory=PasswordHasherPoolSettings
+    )
     session: SessionSettings
     cookies: CookiesSettings
+    rate_limit: RateLimitSettings = Field(default_factory=RateLimitSettings)
 
 
 class LoggingSettings(BaseModel):
@@ -73,6 +361,19 @@ class LoggingSettings(BaseModel):
         "ERROR",
         "CRITICAL",
     ] = Field(alias="LOG_LEVEL")
+    sampling_rate: float = Field(default=1.0, alias="LOG_SAMPLING_RATE")
+
+    @field_validator("sampling_rate", mode="before")
+    @classmethod
+    def validate_sampling_rate(cls, v: Any) -> float:
+        if isinstance(v, (int, float)):
+            if not 0 <= v <= 1:
+                raise ValueError("LOG_SAMPLING_RATE must be between 0 and 1.")
+            return v
+        else:
+            raise ValueError(
+                "LOG_SAMPLING_RATE must be a number (fraction, 0 <= fraction <= 1)."
+            )
 
 
 class UvicornSettings(BaseModel):
@@ -109,9 +410,28 @@ class SqlaEngineSettings(BaseModel):
     max_overflow: int = Field(alias="SQLA_MAX_OVERFLOW")
 
 
+class SqlaSessionSettings(BaseModel):
+    shared: bool = Field(default=False, alias="SQLA_SHARED_SESSION")
+
+
+class SessionStoreSettings(BaseModel):
+    backend: Literal["sqla", "redis", "memory"] = Field(
+        default="sqla", alias="SESSION_STORE_BACKEND"
+    )
+    redis_url: str = Field(
+        default="redis://localhost:6379/0", alias="SESSION_STORE_REDIS_URL"
+    )
+    key_prefix: str = Field(default="auth", alias="SESSION_STORE_KEY_PREFIX")
+    sqla_partitioned: bool = Field(
+        default=False, alias="SESSION_STORE_SQLA_PARTITIONED"
+    )
+
+
 class DbSettings(BaseModel):
     postgres: PostgresSettings
     sqla_engine: SqlaEngineSettings
+    sqla_session: SqlaSessionSettings = Field(default_factory=SqlaSessionSettings)
+    session_store: SessionStoreSettings = Field(default_factory=SessionStoreSettings)
 
 
 class Settings(BaseModel):
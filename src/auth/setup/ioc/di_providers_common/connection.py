@@ -4,11 +4,16 @@ import logging
 from typing import AsyncIterable
 
 from dishka import Provider, Scope, provide
-from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
 
-from app.setup.config.settings import SqlaEngineSettings
-from app.setup.ioc.di_providers_common.settings import PostgresDsn
-from app.setup.ioc.enum_component import ComponentEnum
+from auth.setup.config.settings import SqlaEngineSettings
+from auth.setup.ioc.di_providers_common.settings import PostgresDsn
+from auth.setup.ioc.enum_component import ComponentEnum
 
 log = logging.getLogger(__name__)
 
@@ -32,4 +37,33 @@ class CommonConnectionInfraProvider(Provider):
         yield async_engine
         log.debug("Disposing async engine...")
         await async_engine.dispose()
-        log.debug("Engine is disposed.")
\ No newline at end of file
+        log.debug("Engine is disposed.")
+
+    @provide
+    def provide_async_session_maker(
+        self,
+        engine: AsyncEngine,
+    ) -> async_sessionmaker[AsyncSession]:
+        session_factory = async_sessionmaker(
+            bind=engine,
+            class_=AsyncSession,
+            autoflush=False,
+            expire_on_commit=False,
+            info={
+                "component": self.component,
+            },
+        )
+        log.debug("Async session maker initialized.")
+        return session_factory
+
+    @provide(scope=Scope.REQUEST)
+    async def provide_async_session(
+        self,
+        async_session_maker: async_sessionmaker[AsyncSession],
+    ) -> AsyncIterable[AsyncSession]:
+        log.debug("Starting shared async session...")
+        async with async_session_maker() as session:
+            log.debug("Shared async session started.")
+            yield session
+            log.debug("Closing shared async session.")
+        log.debug("Shared async session closed.")
@@ -45,3 +45,24 @@ class SessionConnectionInfraProvider(Provider):
             yield session
             log.debug("Closing async session.")
         log.debug("Async session closed for '%s'.", self.component)
+
+
+class SessionSharedConnectionInfraProvider(Provider):
+    """
+    Reuses the request-scoped session of the default component,
+    so every component works over a single connection and transaction.
+    """
+
+    component = ComponentEnum.SESSION
+    scope = Scope.REQUEST
+
+    @provide
+    def provide_async_session(
+        self,
+        session: Annotated[
+            AsyncSession,
+            FromComponent(ComponentEnum.DEFAULT),
+        ],
+    ) -> AsyncSession:
+        log.debug("Shared async session reused for '%s'.", self.component)
+        return session
@@ -1,9 +1,14 @@
 # pylint: disable=C0301 (line-too-long)
-from typing import Annotated
+import logging
+import math
+from datetime import timedelta
+from typing import Annotated, AsyncIterable
 
 from dishka import FromComponent, Provider, Scope, from_context, provide, provide_all
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 from starlette.requests import Request
 
+from auth.application.user.service_authorization import AuthorizationService
 from auth.domain.user.service import UserService
 from auth.infrastructure.adapters_application.identity_provider_session import (
     SessionIdentityProvider,
@@ -11,25 +16,92 @@ from auth.infrastructure.adapters_application.identity_provider_session import (
 from auth.infrastructure.adapters_application.user_data_mapper_sqla import (
     SqlaUserDataMapper,
 )
+from auth.infrastructure.custom_types import (
+    ConstantTimeLogin,
+    JwtAccessTokenTtlMin,
+    RateLimitKeyPrefix,
+    SessionProlongFlushInterval,
+    SessionReaperBatchSize,
+    SessionReaperInterval,
+    SessionRevocationBatchSize,
+    SessionStoreBackend,
+)
 from auth.infrastructure.persistence.sqla.committer import SqlaCommitter
+from auth.infrastructure.rate_limiting.ports.client_address_provider import (
+    ClientAddressProvider,
+)
+from auth.infrastructure.rate_limiting.ports.rate_limit_storage import (
+    RateLimitStorage,
+)
+from auth.infrastructure.rate_limiting.services.login import LoginRateLimitService
+from auth.infrastructure.rate_limiting.storage_key_value import (
+    KeyValueRateLimitStorage,
+)
+from auth.infrastructure.rate_limiting.storage_memory import (
+    InMemoryRateLimitStorage,
+)
 from auth.infrastructure.session.access_token_processor_jwt import (
     JwtAccessTokenProcessor,
 )
+from auth.infrastructure.session.bulk_revoker_sqla import SqlaSessionBulkRevoker
+from auth.infrastructure.session.cache_memory import InMemorySessionCache
+from auth.infrastructure.session.context_request import RequestIdentityContext
+from auth.infrastructure.session.data_mapper_key_value import (
+    KeyValueSessionDataMapper,
+)
+from auth.infrastructure.session.identity_reader_gateway import (
+    GatewaySessionIdentityReader,
+)
+from auth.infrastructure.session.identity_reader_sqla import (
+    SqlaSessionIdentityReader,
+)
+from auth.infrastructure.session.key_value_client_memory import (
+    InMemoryKeyValueClient,
+)
 from auth.infrastructure.session.ports.access_token_request_handler import (
     AccessTokenRequestHandler,
 )
+from auth.infrastructure.session.ports.key_value_client import KeyValueClient
+from auth.infrastructure.session.ports.session_data_gateway import (
+    SessionDataGateway,
+)
+from auth.infrastructure.session.ports.session_identity_reader import (
+    SessionIdentityReader,
+)
+from auth.infrastructure.session.partitions_sqla import SqlaSessionPartitionManager
+from auth.infrastructure.session.prolongation_coalescer_sqla import (
+    SqlaSessionProlongationCoalescer,
+)
+from auth.infrastructure.session.reaper_sqla import SqlaSessionReaper
+from auth.infrastructure.session.revocation_list_memory import (
+    InMemoryRevocationList,
+)
 from auth.infrastructure.session.services.jwt_token import JwtTokenService
 from auth.infrastructure.session.services.session import SessionService
+from auth.infrastructure.session.token_cache_memory import (
+    InMemoryDecodedTokenCache,
+)
 from auth.infrastructure.session.data_mapper_sqla import SqlaSessionDataMapper
 from auth.infrastructure.session.id_generator_str import StrSessionIdGenerator
 from auth.infrastructure.session.timer_utc import UtcSessionTimer
 from auth.infrastructure.scenarios.account_log_in import LogInInteractor
 from auth.infrastructure.scenarios.account_log_out import LogOutInteractor
+from auth.infrastructure.scenarios.sessions_revoke import RevokeSessionsInteractor
 from auth.presentation.http.adapters_infrastructure.access_token_request_handler_cookie import (
     CookieAccessTokenRequestHandler,
 )
+from auth.infrastructure.user.password_rehash_scheduler import (
+    PasswordRehashScheduler,
+)
+from auth.infrastructure.user.role_cache_memory import InMemoryUserRoleCache
+from auth.presentation.http.adapters_infrastructure.client_address_provider_request import (
+    RequestClientAddressProvider,
+)
+from auth.setup.config.settings import RateLimitSettings, SessionStoreSettings
 from auth.setup.ioc.enum_component import ComponentEnum
 
+log = logging.getLogger(__name__)
+
 
 class SessionInfraPortsProvider(Provider):
     component = ComponentEnum.SESSION
@@ -41,6 +113,10 @@ class SessionInfraPortsProvider(Provider):
         source=CookieAccessTokenRequestHandler,
         provides=AccessTokenRequestHandler,
     )
+    client_address_provider = provide(
+        source=RequestClientAddressProvider,
+        provides=ClientAddressProvider,
+    )
 
 
 class SessionInfraDataMappersProvider(Provider):
@@ -52,6 +128,167 @@ class SessionInfraDataMappersProvider(Provider):
         scope=Scope.REQUEST,
     )
 
+    def __init__(self, session_store_backend: SessionStoreBackend = "sqla"):
+        super().__init__()
+        self._session_store_backend = session_store_backend
+        if session_store_backend == "sqla":
+            self.provide(SqlaSessionDataMapper, provides=SessionDataGateway)
+        else:
+            self.provide(KeyValueSessionDataMapper, provides=SessionDataGateway)
+
+    @provide
+    def provide_session_identity_reader(
+        self,
+        session: AsyncSession,
+        session_data_gateway: SessionDataGateway,
+        sqla_user_data_mapper: Annotated[
+            SqlaUserDataMapper,
+            FromComponent(ComponentEnum.USER),
+        ],
+    ) -> SessionIdentityReader:
+        # sessions and users can only be joined when they share the database
+        if self._session_store_backend == "sqla":
+            return SqlaSessionIdentityReader(session)
+        return GatewaySessionIdentityReader(session_data_gateway, sqla_user_data_mapper)
+
+
+class SessionInfraKeyValueProvider(Provider):
+    component = ComponentEnum.SESSION
+    scope = Scope.APP
+
+    @provide
+    async def provide_key_value_client(
+        self,
+        session_store_settings: SessionStoreSettings,
+    ) -> AsyncIterable[KeyValueClient]:
+        if session_store_settings.backend == "memory":
+            log.debug("In-memory key-value session store initialized.")
+            yield InMemoryKeyValueClient()
+            return
+
+        # imported lazily: `redis` is only required by this backend
+        from auth.infrastructure.session.key_value_client_redis import (
+            RedisKeyValueClient,
+        )
+
+        redis_key_value_client = RedisKeyValueClient.from_url(
+            session_store_settings.redis_url
+        )
+        log.debug("Redis key-value session store client created.")
+        yield redis_key_value_client
+        log.debug("Closing Redis key-value session store client...")
+        await redis_key_value_client.close()
+        log.debug("Redis key-value session store client is closed.")
+
+
+class SessionInfraCachesProvider(Provider):
+    component = ComponentEnum.SESSION
+    scope = Scope.APP
+
+    in_memory_session_cache = provide(source=InMemorySessionCache)
+    in_memory_revocation_list = provide(source=InMemoryRevocationList)
+    in_memory_decoded_token_cache = provide(source=InMemoryDecodedTokenCache)
+
+
+class SessionInfraRateLimitingProvider(Provider):
+    component = ComponentEnum.SESSION
+    scope = Scope.APP
+
+    @provide
+    async def provide_rate_limit_storage(
+        self,
+        rate_limit_settings: RateLimitSettings,
+        key_prefix: RateLimitKeyPrefix,
+    ) -> AsyncIterable[RateLimitStorage]:
+        if rate_limit_settings.backend == "memory":
+            log.debug("In-memory rate limit storage initialized.")
+            yield InMemoryRateLimitStorage()
+            return
+
+        # imported lazily: `redis` is only required by this backend
+        from auth.infrastructure.session.key_value_client_redis import (
+            RedisKeyValueClient,
+        )
+
+        redis_key_value_client = RedisKeyValueClient.from_url(
+            rate_limit_settings.redis_url
+        )
+        log.debug("Redis rate limit storage client created.")
+        yield KeyValueRateLimitStorage(redis_key_value_client, key_prefix)
+        log.debug("Closing Redis rate limit storage client...")
+        await redis_key_value_client.close()
+        log.debug("Redis rate limit storage client is closed.")
+
+
+class SessionInfraMaintenanceProvider(Provider):
+    component = ComponentEnum.SESSION
+    scope = Scope.APP
+
+    @provide
+    def provide_sqla_session_reaper(
+        self,
+        session_maker: Annotated[
+            async_sessionmaker[AsyncSession],
+            FromComponent(ComponentEnum.DEFAULT),
+        ],
+        session_store_settings: SessionStoreSettings,
+        interval: SessionReaperInterval,
+        batch_size: SessionReaperBatchSize,
+        session_ttl_min: JwtAccessTokenTtlMin,
+    ) -> SqlaSessionReaper:
+        partition_manager: SqlaSessionPartitionManager | None = None
+        if session_store_settings.sqla_partitioned:
+            partition_manager = SqlaSessionPartitionManager(
+                session_maker,
+                days_ahead=math.ceil(session_ttl_min / timedelta(days=1)) + 1,
+            )
+
+        return SqlaSessionReaper(
+            session_maker,
+            interval=interval,
+            batch_size=batch_size,
+            is_enabled=(
+                session_store_settings.backend == "sqla"
+                and interval > timedelta(0)
+            ),
+            partition_manager=partition_manager,
+        )
+
+    @provide
+    def provide_sqla_session_prolongation_coalescer(
+        self,
+        session_maker: Annotated[
+            async_sessionmaker[AsyncSession],
+            FromComponent(ComponentEnum.DEFAULT),
+        ],
+        session_store_settings: SessionStoreSettings,
+        flush_interval: SessionProlongFlushInterval,
+    ) -> SqlaSessionProlongationCoalescer:
+        return SqlaSessionProlongationCoalescer(
+            session_maker,
+            flush_interval=flush_interval,
+            is_enabled=(
+                session_store_settings.backend == "sqla"
+                and flush_interval > timedelta(0)
+            ),
+        )
+
+    @provide
+    def provide_sqla_session_bulk_revoker(
+        self,
+        session_maker: Annotated[
+            async_sessionmaker[AsyncSession],
+            FromComponent(ComponentEnum.DEFAULT),
+        ],
+        session_store_settings: SessionStoreSettings,
+        batch_size: SessionRevocationBatchSize,
+    ) -> SqlaSessionBulkRevoker:
+        return SqlaSessionBulkRevoker(
+            session_maker,
+            batch_size=batch_size,
+            is_enabled=session_store_settings.backend == "sqla",
+        )
+
 
 class SessionInfraConcreteProvider(Provider):
     component = ComponentEnum.SESSION
@@ -64,6 +301,8 @@ class SessionInfraConcreteProvider(Provider):
         SqlaCommitter,
         JwtTokenService,
         JwtAccessTokenProcessor,
+        RequestIdentityContext,
+        LoginRateLimitService,
     )
 
     @provide
@@ -75,11 +314,18 @@ class SessionInfraConcreteProvider(Provider):
             SqlaUserDataMapper,
             FromComponent(ComponentEnum.USER),
         ],
+        request_identity_context: RequestIdentityContext,
+        in_memory_user_role_cache: Annotated[
+            InMemoryUserRoleCache,
+            FromComponent(ComponentEnum.USER),
+        ],
     ) -> SessionIdentityProvider:
         return SessionIdentityProvider(
             jwt_token_service,
             session_service,
             sqla_user_data_mapper,
+            request_identity_context,
+            in_memory_user_role_cache,
         )
 
 
@@ -101,6 +347,15 @@ class SessionInfraInteractorProvider(Provider):
             UserService,
             FromComponent(ComponentEnum.USER),
         ],
+        constant_time_login: Annotated[
+            ConstantTimeLogin,
+            FromComponent(ComponentEnum.USER),
+        ],
+        login_rate_limit_service: LoginRateLimitService,
+        password_rehash_scheduler: Annotated[
+            PasswordRehashScheduler,
+            FromComponent(ComponentEnum.USER),
+        ],
     ) -> LogInInteractor:
         return LogInInteractor(
             session_identity_provider,
@@ -108,22 +363,34 @@ class SessionInfraInteractorProvider(Provider):
             session_service,
             jtw_token_service,
             user_service,
+            constant_time_login,
+            login_rate_limit_service,
+            password_rehash_scheduler,
         )
 
     @provide
     def provide_logout_interactor(
         self,
         session_identity_provider: SessionIdentityProvider,
-        sqla_user_data_mapper: Annotated[
-            SqlaUserDataMapper,
-            FromComponent(ComponentEnum.USER),
-        ],
         session_service: SessionService,
         jtw_token_service: JwtTokenService,
     ) -> LogOutInteractor:
         return LogOutInteractor(
             session_identity_provider,
-            sqla_user_data_mapper,
             session_service,
             jtw_token_service,
         )
+
+    @provide
+    def provide_revoke_sessions_interactor(
+        self,
+        authorization_service: Annotated[
+            AuthorizationService,
+            FromComponent(ComponentEnum.USER),
+        ],
+        session_service: SessionService,
+    ) -> RevokeSessionsInteractor:
+        return RevokeSessionsInteractor(
+            authorization_service,
+            session_service,
+        )
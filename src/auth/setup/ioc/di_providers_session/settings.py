@@ -3,17 +3,35 @@ from dishka import Provider, Scope, provide
 from auth.infrastructure.custom_types import (
     JwtAccessTokenTtlMin,
     JwtAlgorithm,
+    JwtDecodeCacheMaxEntries,
     JwtSecret,
+    JwtStatelessWindow,
+    LoginRateLimitPerAddress,
+    LoginRateLimitPerUsername,
+    LoginRateLimitPerUsernameAddress,
+    LoginRateLimitWindow,
+    RateLimitKeyPrefix,
+    SessionCacheMaxEntries,
+    SessionCacheTtl,
+    SessionProlongFlushInterval,
+    SessionReaperBatchSize,
+    SessionReaperInterval,
     SessionRefreshThreshold,
+    SessionRevocationBatchSize,
+    SessionStoreKeyPrefix,
 )
 from auth.presentation.http.cookie_params import CookieParams
-from auth.setup.config.settings import Settings
+from auth.setup.config.settings import (
+    RateLimitSettings,
+    SessionStoreSettings,
+    Settings,
+)
 from auth.setup.ioc.enum_component import ComponentEnum
 
 
 class SessionSettingsProvider(Provider):
     component = ComponentEnum.SESSION
-    scope = Scope.auth
+    scope = Scope.APP
 
     @provide
     def provide_jwt_secret(self, settings: Settings) -> JwtSecret:
@@ -29,6 +47,18 @@ class SessionSettingsProvider(Provider):
     ) -> JwtAccessTokenTtlMin:
         return JwtAccessTokenTtlMin(settings.security.session.session_ttl_min)
 
+    @provide
+    def provide_jwt_stateless_window(self, settings: Settings) -> JwtStatelessWindow:
+        return JwtStatelessWindow(settings.security.session.jwt_stateless_window_s)
+
+    @provide
+    def provide_jwt_decode_cache_max_entries(
+        self, settings: Settings
+    ) -> JwtDecodeCacheMaxEntries:
+        return JwtDecodeCacheMaxEntries(
+            settings.security.session.jwt_decode_cache_max_entries
+        )
+
     @provide
     def provide_session_refresh_threshold(
         self, settings: Settings
@@ -37,6 +67,98 @@ class SessionSettingsProvider(Provider):
             settings.security.session.session_refresh_threshold
         )
 
+    @provide
+    def provide_session_cache_max_entries(
+        self, settings: Settings
+    ) -> SessionCacheMaxEntries:
+        return SessionCacheMaxEntries(
+            settings.security.session.session_cache_max_entries
+        )
+
+    @provide
+    def provide_session_cache_ttl(self, settings: Settings) -> SessionCacheTtl:
+        return SessionCacheTtl(settings.security.session.session_cache_ttl_s)
+
+    @provide
+    def provide_session_reaper_interval(
+        self, settings: Settings
+    ) -> SessionReaperInterval:
+        return SessionReaperInterval(
+            settings.security.session.session_reaper_interval_s
+        )
+
+    @provide
+    def provide_session_reaper_batch_size(
+        self, settings: Settings
+    ) -> SessionReaperBatchSize:
+        return SessionReaperBatchSize(
+            settings.security.session.session_reaper_batch_size
+        )
+
+    @provide
+    def provide_session_prolong_flush_interval(
+        self, settings: Settings
+    ) -> SessionProlongFlushInterval:
+        return SessionProlongFlushInterval(
+            settings.security.session.session_prolong_flush_interval_s
+        )
+
+    @provide
+    def provide_session_revocation_batch_size(
+        self, settings: Settings
+    ) -> SessionRevocationBatchSize:
+        return SessionRevocationBatchSize(
+            settings.security.session.session_revocation_batch_size
+        )
+
+    @provide
+    def provide_session_store_settings(
+        self, settings: Settings
+    ) -> SessionStoreSettings:
+        return settings.db.session_store
+
+    @provide
+    def provide_session_store_key_prefix(
+        self, settings: Settings
+    ) -> SessionStoreKeyPrefix:
+        return SessionStoreKeyPrefix(settings.db.session_store.key_prefix)
+
+    @provide
+    def provide_rate_limit_settings(self, settings: Settings) -> RateLimitSettings:
+        return settings.security.rate_limit
+
+    @provide
+    def provide_rate_limit_key_prefix(self, settings: Settings) -> RateLimitKeyPrefix:
+        return RateLimitKeyPrefix(settings.security.rate_limit.key_prefix)
+
+    @provide
+    def provide_login_rate_limit_per_username(
+        self, settings: Settings
+    ) -> LoginRateLimitPerUsername:
+        return LoginRateLimitPerUsername(
+            settings.security.rate_limit.login_per_username
+        )
+
+    @provide
+    def provide_login_rate_limit_per_username_address(
+        self, settings: Settings
+    ) -> LoginRateLimitPerUsernameAddress:
+        return LoginRateLimitPerUsernameAddress(
+            settings.security.rate_limit.login_per_username_address
+        )
+
+    @provide
+    def provide_login_rate_limit_per_address(
+        self, settings: Settings
+    ) -> LoginRateLimitPerAddress:
+        return LoginRateLimitPerAddress(settings.security.rate_limit.login_per_address)
+
+    @provide
+    def provide_login_rate_limit_window(
+        self, settings: Settings
+    ) -> LoginRateLimitWindow:
+        return LoginRateLimitWindow(settings.security.rate_limit.login_window_s)
+
     @provide
     def provide_cookie_params(self, settings: Settings) -> CookieParams:
         is_cookies_secure: bool = settings.security.cookies.secure
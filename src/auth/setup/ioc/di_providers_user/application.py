@@ -8,6 +8,10 @@ from auth.application.user.ports.identity_provider import IdentityProvider
 from auth.application.user.ports.user_data_gateway import UserDataGateway
 from auth.application.user.service_authorization import AuthorizationService
 from auth.application.scenarios.account_sign_up.interactor import SignUpInteractor
+from auth.application.scenarios.users_export.interactor import (
+    ExportUsersInteractor,
+)
+from auth.application.scenarios.users_list.interactor import ListUsersInteractor
 
 from auth.infrastructure.adapters_application.identity_provider_session import (
     SessionIdentityProvider,
@@ -16,9 +20,6 @@ from auth.infrastructure.adapters_application.user_data_mapper_sqla import (
     SqlaUserDataMapper,
 )
 from auth.infrastructure.persistence.sqla.committer import SqlaCommitter
-from auth.infrastructure.session.services.jwt_token import JwtTokenService
-from auth.infrastructure.session.services.session import SessionService
-from auth.infrastructure.session.data_mapper_sqla import SqlaSessionDataMapper
 from auth.setup.ioc.enum_component import ComponentEnum
 
 
@@ -41,36 +42,13 @@ class UserApplicationPortsProvider(Provider):
     @provide
     def provide_identity_provider(
         self,
-        jwt_token_service: Annotated[
-            JwtTokenService,
-            FromComponent(ComponentEnum.SESSION),
-        ],
-        session_service: Annotated[
-            SessionService,
+        session_identity_provider: Annotated[
+            SessionIdentityProvider,
             FromComponent(ComponentEnum.SESSION),
         ],
-        sqla_user_data_mapper: Annotated[
-            SqlaUserDataMapper,
-            FromComponent(ComponentEnum.USER),
-        ],
     ) -> IdentityProvider:
-        return SessionIdentityProvider(
-            jwt_token_service, session_service, sqla_user_data_mapper
-        )
-
-    @provide
-    def provide_global_logout_service(
-        self,
-        sqla_session_data_mapper: Annotated[
-            SqlaSessionDataMapper,
-            FromComponent(ComponentEnum.SESSION),
-        ],
-        sqla_committer: Annotated[
-            SqlaCommitter,
-            FromComponent(ComponentEnum.SESSION),
-        ],
-    ) -> GlobalLogoutService:
-        return SessionGlobalLogoutService(sqla_session_data_mapper, sqla_committer)
+        # the same instance as the session component's, sharing its request memo
+        return session_identity_provider
 
 
 class UserApplicationDataGatewaysProvider(Provider):
@@ -90,5 +68,7 @@ class UserApplicationInteractorsProvider(Provider):
 
     interactors = provide_all(
         SignUpInteractor,
+        ListUsersInteractor,
+        ExportUsersInteractor,
     )
     
\ No newline at end of file
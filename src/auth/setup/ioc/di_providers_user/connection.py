@@ -44,4 +44,25 @@ class UserConnectionInfraProvider(Provider):
             log.debug("Async session started for '%s'.", self.component)
             yield session
             log.debug("Closing async session.")
-        log.debug("Async session closed for '%s'.", self.component)
\ No newline at end of file
+        log.debug("Async session closed for '%s'.", self.component)
+
+
+class UserSharedConnectionInfraProvider(Provider):
+    """
+    Reuses the request-scoped session of the default component,
+    so every component works over a single connection and transaction.
+    """
+
+    component = ComponentEnum.USER
+    scope = Scope.REQUEST
+
+    @provide
+    def provide_async_session(
+        self,
+        session: Annotated[
+            AsyncSession,
+            FromComponent(ComponentEnum.DEFAULT),
+        ],
+    ) -> AsyncSession:
+        log.debug("Shared async session reused for '%s'.", self.component)
+        return session
@@ -1,18 +1,39 @@
 # pylint: disable=C0301 (line-too-long)
 
-from dishka import Provider, Scope, provide
+import logging
+from typing import Annotated, AsyncIterable, Iterable
+
+from dishka import FromComponent, Provider, Scope, provide
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
 from auth.domain.user.ports.password_hasher import PasswordHasher
+from auth.domain.user.ports.user_access_listener import UserAccessListener
 from auth.domain.user.ports.user_id_generator import UserIdGenerator
 from auth.domain.user.service import UserService
-from auth.infrastructure.user.adapters_domain.password_hasher_bcrypt import (
-    BcryptPasswordHasher,
+from auth.infrastructure.custom_types import DummyPasswordHash, PasswordPepper
+from auth.infrastructure.session.revocation_list_memory import InMemoryRevocationList
+from auth.infrastructure.user.adapters_domain.password_hasher_multi_scheme import (
+    DUMMY_PASSWORD,
+    MultiSchemePasswordHasher,
+    hash_passwords,
+)
+from auth.infrastructure.user.adapters_domain.user_access_listener_sqla import (
+    SqlaUserAccessListener,
 )
 from auth.infrastructure.user.adapters_domain.user_id_generator_uuid import (
     UuidUserIdGenerator,
 )
+from auth.infrastructure.user.password_hash_policy import PasswordHashPolicy
+from auth.infrastructure.user.password_hasher_pool import PasswordHasherPool
+from auth.infrastructure.user.password_rehash_scheduler import (
+    PasswordRehashScheduler,
+)
+from auth.infrastructure.user.role_cache_memory import InMemoryUserRoleCache
+from auth.setup.config.settings import PasswordHasherPoolSettings
 from auth.setup.ioc.enum_component import ComponentEnum
 
+log = logging.getLogger(__name__)
+
 
 class UserDomainServicesProvider(Provider):
     component = ComponentEnum.USER
@@ -30,7 +51,76 @@ class UserDomainPortsProvider(Provider):
         provides=UserIdGenerator,
     )
     password_hasher = provide(
-        source=BcryptPasswordHasher,
+        source=MultiSchemePasswordHasher,
         provides=PasswordHasher,
     )
-    
\ No newline at end of file
+
+
+class UserInfraCachesProvider(Provider):
+    component = ComponentEnum.USER
+    scope = Scope.APP
+
+    in_memory_user_role_cache = provide(source=InMemoryUserRoleCache)
+
+    @provide(scope=Scope.REQUEST)
+    def provide_user_access_listener(
+        self,
+        session: AsyncSession,
+        in_memory_user_role_cache: InMemoryUserRoleCache,
+        in_memory_revocation_list: Annotated[
+            InMemoryRevocationList,
+            FromComponent(ComponentEnum.SESSION),
+        ],
+    ) -> UserAccessListener:
+        return SqlaUserAccessListener(
+            session, in_memory_user_role_cache, in_memory_revocation_list
+        )
+
+
+class UserDomainWorkersProvider(Provider):
+    component = ComponentEnum.USER
+    scope = Scope.APP
+
+    @provide
+    def provide_password_hasher_pool(
+        self,
+        pool_settings: PasswordHasherPoolSettings,
+    ) -> Iterable[PasswordHasherPool]:
+        password_hasher_pool = PasswordHasherPool(
+            name="bcrypt",
+            kind=pool_settings.kind,
+            max_workers=pool_settings.max_workers,
+            queue_size=pool_settings.queue_size,
+            max_verifications=pool_settings.max_verifications,
+        )
+        log.debug("Password hasher pool created: %s", pool_settings)
+        yield password_hasher_pool
+        log.debug("Shutting down password hasher pool...")
+        password_hasher_pool.shutdown()
+        log.debug("Password hasher pool is shut down.")
+
+    @provide
+    async def provide_dummy_password_hash(
+        self,
+        password_hasher_pool: PasswordHasherPool,
+        pepper: PasswordPepper,
+        password_hash_policy: PasswordHashPolicy,
+    ) -> DummyPasswordHash:
+        # resolved on startup, so no login pays for it
+        dummy_password_hashes: list[bytes] = await password_hasher_pool.run(
+            hash_passwords, [DUMMY_PASSWORD], pepper, password_hash_policy
+        )
+        return DummyPasswordHash(dummy_password_hashes[0])
+
+    @provide
+    async def provide_password_rehash_scheduler(
+        self,
+        session_maker: Annotated[
+            async_sessionmaker[AsyncSession],
+            FromComponent(ComponentEnum.DEFAULT),
+        ],
+    ) -> AsyncIterable[PasswordRehashScheduler]:
+        password_rehash_scheduler = PasswordRehashScheduler(session_maker)
+        yield password_rehash_scheduler
+        await password_rehash_scheduler.shutdown()
+        log.debug("Password rehash scheduler is shut down.")
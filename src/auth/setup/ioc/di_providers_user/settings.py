@@ -1,7 +1,13 @@
 from dishka import Provider, Scope, provide
 
-from auth.infrastructure.custom_types import PasswordPepper
-from auth.setup.config.settings import Settings
+from auth.infrastructure.custom_types import (
+    ConstantTimeLogin,
+    PasswordPepper,
+    UserRoleCacheMaxEntries,
+    UserRoleCacheTtl,
+)
+from auth.infrastructure.user.password_hash_policy import PasswordHashPolicy
+from auth.setup.config.settings import PasswordHasherPoolSettings, Settings
 from auth.setup.ioc.enum_component import ComponentEnum
 
 
@@ -12,3 +18,36 @@ class UserSettingsProvider(Provider):
     @provide
     def provide_password_pepper(self, settings: Settings) -> PasswordPepper:
         return PasswordPepper(settings.security.password.pepper)
+
+    @provide
+    def provide_constant_time_login(self, settings: Settings) -> ConstantTimeLogin:
+        return ConstantTimeLogin(settings.security.password.constant_time_login)
+
+    @provide
+    def provide_password_hash_policy(self, settings: Settings) -> PasswordHashPolicy:
+        password_settings = settings.security.password
+        return PasswordHashPolicy(
+            scheme=password_settings.hash_scheme,
+            bcrypt_rounds=password_settings.bcrypt_rounds,
+            argon2_time_cost=password_settings.argon2_time_cost,
+            argon2_memory_cost_kib=password_settings.argon2_memory_cost_kib,
+            argon2_parallelism=password_settings.argon2_parallelism,
+        )
+
+    @provide
+    def provide_password_hasher_pool_settings(
+        self, settings: Settings
+    ) -> PasswordHasherPoolSettings:
+        return settings.security.password_hasher_pool
+
+    @provide
+    def provide_user_role_cache_max_entries(
+        self, settings: Settings
+    ) -> UserRoleCacheMaxEntries:
+        return UserRoleCacheMaxEntries(
+            settings.security.session.user_role_cache_max_entries
+        )
+
+    @provide
+    def provide_user_role_cache_ttl(self, settings: Settings) -> UserRoleCacheTtl:
+        return UserRoleCacheTtl(settings.security.session.user_role_cache_ttl_s)
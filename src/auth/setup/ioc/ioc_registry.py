@@ -2,17 +2,26 @@ from typing import Iterable
 
 from dishka import Provider
 
+from auth.infrastructure.custom_types import SessionStoreBackend
+from auth.setup.config.settings import Settings
 from auth.setup.ioc.di_providers_common.connection import CommonConnectionInfraProvider
 from auth.setup.ioc.di_providers_common.settings import (
     CommonSettingsProvider,
     SettingsProvider,
 )
-from auth.setup.ioc.di_providers_session.connection import SessionConnectionInfraProvider
+from auth.setup.ioc.di_providers_session.connection import (
+    SessionConnectionInfraProvider,
+    SessionSharedConnectionInfraProvider,
+)
 from auth.setup.ioc.di_providers_session.infrastructure import (
+    SessionInfraCachesProvider,
     SessionInfraConcreteProvider,
     SessionInfraDataMappersProvider,
     SessionInfraInteractorProvider,
+    SessionInfraKeyValueProvider,
+    SessionInfraMaintenanceProvider,
     SessionInfraPortsProvider,
+    SessionInfraRateLimitingProvider,
 )
 from auth.setup.ioc.di_providers_session.settings import SessionSettingsProvider
 from auth.setup.ioc.di_providers_user.application import (
@@ -21,16 +30,21 @@ from auth.setup.ioc.di_providers_user.application import (
     UserApplicationPortsProvider,
     UserApplicationServicesProvider,
 )
-from auth.setup.ioc.di_providers_user.connection import UserConnectionInfraProvider
+from auth.setup.ioc.di_providers_user.connection import (
+    UserConnectionInfraProvider,
+    UserSharedConnectionInfraProvider,
+)
 from auth.setup.ioc.di_providers_user.domain import (
     UserDomainPortsProvider,
     UserDomainServicesProvider,
+    UserDomainWorkersProvider,
+    UserInfraCachesProvider,
 )
 from auth.setup.ioc.di_providers_user.settings import UserSettingsProvider
 
 
-def get_providers() -> Iterable[Provider]:
-    settings = (
+def get_providers(settings: Settings) -> Iterable[Provider]:
+    settings_providers = (
         SettingsProvider(),
         CommonSettingsProvider(),
         UserSettingsProvider(),
@@ -38,12 +52,21 @@ def get_providers() -> Iterable[Provider]:
     )
 
     connection_common = (CommonConnectionInfraProvider(),)
-    connection_user = (UserConnectionInfraProvider(),)
-    connection_session = (SessionConnectionInfraProvider(),)
+    connection_user: tuple[Provider, ...]
+    connection_session: tuple[Provider, ...]
+    # a single request-scoped session lets one commit cover all components
+    if settings.db.sqla_session.shared:
+        connection_user = (UserSharedConnectionInfraProvider(),)
+        connection_session = (SessionSharedConnectionInfraProvider(),)
+    else:
+        connection_user = (UserConnectionInfraProvider(),)
+        connection_session = (SessionConnectionInfraProvider(),)
 
     domain_user = (
         UserDomainServicesProvider(),
         UserDomainPortsProvider(),
+        UserDomainWorkersProvider(),
+        UserInfraCachesProvider(),
     )
 
     application_user = (
@@ -53,15 +76,21 @@ def get_providers() -> Iterable[Provider]:
         UserApplicationInteractorsProvider(),
     )
 
-    infrastructure_session = (
-        SessionInfraDataMappersProvider(),
+    session_store_backend: SessionStoreBackend = settings.db.session_store.backend
+    infrastructure_session: tuple[Provider, ...] = (
+        SessionInfraCachesProvider(),
+        SessionInfraDataMappersProvider(session_store_backend),
         SessionInfraPortsProvider(),
         SessionInfraConcreteProvider(),
         SessionInfraInteractorProvider(),
+        SessionInfraMaintenanceProvider(),
+        SessionInfraRateLimitingProvider(),
     )
+    if session_store_backend != "sqla":
+        infrastructure_session += (SessionInfraKeyValueProvider(),)
 
     return (
-        *settings,
+        *settings_providers,
         *connection_common,
         *connection_user,
         *connection_session,
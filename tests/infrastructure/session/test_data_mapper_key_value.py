@@ -0,0 +1,205 @@
+import asyncio
+from datetime import datetime, timedelta
+from typing import Any, Coroutine, TypeVar
+from uuid import uuid4
+
+import pytest
+
+from auth.domain.user.value_objects import UserId
+from auth.infrastructure.custom_types import (
+    JwtAccessTokenTtlMin,
+    SessionRefreshThreshold,
+    SessionStoreKeyPrefix,
+)
+from auth.infrastructure.record_session import SessionRecord
+from auth.infrastructure.session.data_mapper_key_value import (
+    KeyValueSessionDataMapper,
+)
+from auth.infrastructure.session.key_value_client_memory import (
+    InMemoryKeyValueClient,
+)
+from auth.infrastructure.session.timer_utc import UtcSessionTimer
+
+T = TypeVar("T")
+
+SESSION_TTL: timedelta = timedelta(minutes=5)
+
+
+def run(coroutine: Coroutine[Any, Any, T]) -> T:
+    return asyncio.run(coroutine)
+
+
+@pytest.fixture
+def key_value_client() -> InMemoryKeyValueClient:
+    return InMemoryKeyValueClient()
+
+
+@pytest.fixture
+def timer() -> UtcSessionTimer:
+    return UtcSessionTimer(
+        JwtAccessTokenTtlMin(SESSION_TTL), SessionRefreshThreshold(0.2)
+    )
+
+
+@pytest.fixture
+def mapper(
+    key_value_client: InMemoryKeyValueClient, timer: UtcSessionTimer
+) -> KeyValueSessionDataMapper:
+    return KeyValueSessionDataMapper(
+        key_value_client, SessionStoreKeyPrefix("test"), timer
+    )
+
+
+def make_session(
+    expiration: datetime, user_id: UserId | None = None
+) -> SessionRecord:
+    return SessionRecord(
+        id_=uuid4().hex,
+        user_id=user_id or UserId(uuid4()),
+        expiration=expiration,
+    )
+
+
+def test_save_then_read(
+    mapper: KeyValueSessionDataMapper, timer: UtcSessionTimer
+) -> None:
+    session = make_session(timer.access_expiration)
+
+    run(mapper.save(session))
+    stored = run(mapper.read(session.id_))
+
+    assert stored is not None
+    assert stored.id_ == session.id_
+    assert stored.user_id == session.user_id
+    assert stored.expiration == session.expiration
+
+
+def test_read_unknown_session(mapper: KeyValueSessionDataMapper) -> None:
+    assert run(mapper.read("unknown")) is None
+
+
+def test_session_expires_with_its_ttl(
+    mapper: KeyValueSessionDataMapper, timer: UtcSessionTimer
+) -> None:
+    session = make_session(timer.current_time + timedelta(milliseconds=50))
+
+    run(mapper.save(session))
+    assert run(mapper.read(session.id_)) is not None
+
+    run(asyncio.sleep(0.1))
+    assert run(mapper.read(session.id_)) is None
+
+
+def test_prolong_within_refresh_boundary(
+    mapper: KeyValueSessionDataMapper, timer: UtcSessionTimer
+) -> None:
+    session = make_session(timer.current_time + timedelta(seconds=30))
+    run(mapper.save(session))
+    new_expiration: datetime = timer.access_expiration
+
+    is_prolonged = run(
+        mapper.prolong(
+            session,
+            new_expiration=new_expiration,
+            refresh_boundary=timer.refresh_boundary,
+        )
+    )
+
+    assert is_prolonged
+    assert session.expiration == new_expiration
+    stored = run(mapper.read(session.id_))
+    assert stored is not None
+    assert stored.expiration == new_expiration
+
+
+def test_prolong_outside_refresh_boundary(
+    mapper: KeyValueSessionDataMapper, timer: UtcSessionTimer
+) -> None:
+    expiration: datetime = timer.access_expiration
+    session = make_session(expiration)
+    run(mapper.save(session))
+
+    is_prolonged = run(
+        mapper.prolong(
+            session,
+            new_expiration=expiration + timedelta(minutes=1),
+            refresh_boundary=timer.refresh_boundary,
+        )
+    )
+
+    assert not is_prolonged
+    assert session.expiration == expiration
+    stored = run(mapper.read(session.id_))
+    assert stored is not None
+    assert stored.expiration == expiration
+
+
+def test_prolong_does_not_restore_a_session_deleted_meanwhile(
+    mapper: KeyValueSessionDataMapper,
+    timer: UtcSessionTimer,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    session = make_session(timer.current_time + timedelta(seconds=30))
+    run(mapper.save(session))
+    stale_session: SessionRecord | None = run(mapper.read(session.id_))
+    run(mapper.delete(session.id_))
+
+    async def read_stale(*_: Any, **__: Any) -> SessionRecord | None:
+        return stale_session
+
+    # the read inside `prolong` happens before the concurrent delete
+    monkeypatch.setattr(mapper, "read", read_stale)
+    is_prolonged = run(
+        mapper.prolong(
+            session,
+            new_expiration=timer.access_expiration,
+            refresh_boundary=timer.refresh_boundary,
+        )
+    )
+    monkeypatch.undo()
+
+    assert not is_prolonged
+    assert run(mapper.read(session.id_)) is None
+
+
+def test_delete(
+    mapper: KeyValueSessionDataMapper,
+    key_value_client: InMemoryKeyValueClient,
+    timer: UtcSessionTimer,
+) -> None:
+    session = make_session(timer.access_expiration)
+    run(mapper.save(session))
+
+    assert run(mapper.delete(session.id_))
+    assert run(mapper.read(session.id_)) is None
+    assert not run(mapper.delete(session.id_))
+    assert (
+        run(key_value_client.smembers(f"test:user_sessions:{session.user_id.value}"))
+        == set()
+    )
+
+
+def test_delete_all_for_user(
+    mapper: KeyValueSessionDataMapper,
+    key_value_client: InMemoryKeyValueClient,
+    timer: UtcSessionTimer,
+) -> None:
+    user_id = UserId(uuid4())
+    sessions: list[SessionRecord] = [
+        make_session(timer.access_expiration, user_id) for _ in range(3)
+    ]
+    other_session = make_session(timer.access_expiration)
+    for session in [*sessions, other_session]:
+        run(mapper.save(session))
+
+    user_sessions_key: str = f"test:user_sessions:{user_id.value}"
+    assert run(key_value_client.smembers(user_sessions_key)) == {
+        session.id_.encode() for session in sessions
+    }
+
+    run(mapper.delete_all_for_user(user_id))
+
+    for session in sessions:
+        assert run(mapper.read(session.id_)) is None
+    assert run(key_value_client.smembers(user_sessions_key)) == set()
+    assert run(mapper.read(other_session.id_)) is not None